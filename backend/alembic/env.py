@@ -9,7 +9,16 @@ from sqlalchemy import engine_from_config, pool
 
 from app.config import get_settings
 from app.database import Base
-from app.models import classification, clause_evaluation, review, segment  # noqa: F401
+from app.models import (  # noqa: F401
+    classification,
+    classification_cache_entry,
+    clause_evaluation,
+    clause_library_entry,
+    llm_cache_entry,
+    review,
+    segment,
+    stage_checkpoint,
+)
 
 config = context.config
 
@@ -0,0 +1,44 @@
+"""create llm cache entries table
+
+Revision ID: 0011_llm_cache_entries
+Revises: 0010_clause_eval_suggested
+Create Date: 2025-02-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0011_llm_cache_entries"
+down_revision: Union[str, None] = "0010_clause_eval_suggested"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_cache_entries",
+        sa.Column("key", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_llm_cache_entries_expires_at", "llm_cache_entries", ["expires_at"]
+    )
+    op.create_index(
+        "ix_llm_cache_entries_created_at", "llm_cache_entries", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_cache_entries_created_at", table_name="llm_cache_entries")
+    op.drop_index("ix_llm_cache_entries_expires_at", table_name="llm_cache_entries")
+    op.drop_table("llm_cache_entries")
@@ -0,0 +1,45 @@
+"""add review dedup fields
+
+Revision ID: 0012_review_dedup
+Revises: 0011_llm_cache_entries
+Create Date: 2025-02-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0012_review_dedup"
+down_revision: Union[str, None] = "0011_llm_cache_entries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reviews", sa.Column("playbook_version", sa.String(length=64), nullable=True)
+    )
+    op.add_column(
+        "reviews",
+        sa.Column("results_fingerprint", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "reviews",
+        sa.Column(
+            "reused_from_review_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("reviews.id"),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_reviews_doc_sha256", "reviews", ["doc_sha256"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reviews_doc_sha256", table_name="reviews")
+    op.drop_column("reviews", "reused_from_review_id")
+    op.drop_column("reviews", "results_fingerprint")
+    op.drop_column("reviews", "playbook_version")
@@ -0,0 +1,53 @@
+"""create review stage checkpoints and clause evaluation input hash
+
+Revision ID: 0013_stage_checkpoints
+Revises: 0012_review_dedup
+Create Date: 2025-02-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0013_stage_checkpoints"
+down_revision: Union[str, None] = "0012_review_dedup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "review_stage_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column(
+            "review_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("reviews.id"),
+            nullable=False,
+        ),
+        sa.Column("stage", sa.String(length=32), nullable=False),
+        sa.Column("input_hash", sa.String(length=64), nullable=False),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "review_id",
+            "stage",
+            name="uq_review_stage_checkpoints_review_stage",
+        ),
+    )
+    op.add_column(
+        "clause_evaluations",
+        sa.Column("input_hash", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("clause_evaluations", "input_hash")
+    op.drop_table("review_stage_checkpoints")
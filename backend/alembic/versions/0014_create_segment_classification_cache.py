@@ -0,0 +1,42 @@
+"""create segment classification cache and review metrics
+
+Revision ID: 0014_classification_cache
+Revises: 0013_stage_checkpoints
+Create Date: 2025-02-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0014_classification_cache"
+down_revision: Union[str, None] = "0013_stage_checkpoints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "segment_classification_cache",
+        sa.Column("segment_hash", sa.String(length=32), nullable=False),
+        sa.Column("config_hash", sa.String(length=64), nullable=False),
+        sa.Column("results", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("segment_hash", "config_hash"),
+    )
+    op.add_column(
+        "reviews", sa.Column("metrics_json", postgresql.JSONB(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("reviews", "metrics_json")
+    op.drop_table("segment_classification_cache")
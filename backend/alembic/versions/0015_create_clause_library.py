@@ -0,0 +1,87 @@
+"""create clause library
+
+Revision ID: 0015_clause_library
+Revises: 0014_classification_cache
+Create Date: 2025-02-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0015_clause_library"
+down_revision: Union[str, None] = "0014_classification_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    clause_type_enum = postgresql.ENUM(name="clause_type", create_type=False)
+    risk_label_enum = postgresql.ENUM(name="risk_label", create_type=False)
+    op.create_table(
+        "clause_library",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("clause_type", clause_type_enum, nullable=False),
+        sa.Column("candidates_hash", sa.String(length=64), nullable=False),
+        sa.Column("context_hash", sa.String(length=64), nullable=False),
+        sa.Column("playbook_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("evaluator_hash", sa.String(length=64), nullable=False),
+        sa.Column("risk_label", risk_label_enum, nullable=False),
+        sa.Column("short_reason", sa.Text(), nullable=False),
+        sa.Column("suggested_change", sa.Text(), nullable=True),
+        sa.Column(
+            "triggered_rule_ids",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "evidence_quotes",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("hit_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "uq_clause_library_key",
+        "clause_library",
+        [
+            "candidates_hash",
+            "clause_type",
+            "context_hash",
+            "playbook_fingerprint",
+            "evaluator_hash",
+        ],
+        unique=True,
+    )
+    op.add_column(
+        "clause_evaluations",
+        sa.Column(
+            "library_entry_id",
+            sa.Integer(),
+            sa.ForeignKey("clause_library.id"),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("clause_evaluations", "library_entry_id")
+    op.drop_index("uq_clause_library_key", table_name="clause_library")
+    op.drop_table("clause_library")
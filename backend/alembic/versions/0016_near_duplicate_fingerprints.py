@@ -0,0 +1,75 @@
+"""add near-duplicate fingerprints
+
+Revision ID: 0016_near_duplicates
+Revises: 0015_clause_library
+Create Date: 2025-02-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0016_near_duplicates"
+down_revision: Union[str, None] = "0015_clause_library"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "clause_library",
+        sa.Column(
+            "source_review_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("reviews.id"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "clause_library",
+        sa.Column(
+            "candidate_minhashes",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "clause_library",
+        sa.Column(
+            "lsh_bands",
+            postgresql.ARRAY(sa.Integer()),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_clause_library_lsh_bands",
+        "clause_library",
+        ["lsh_bands"],
+        postgresql_using="gin",
+    )
+    op.add_column(
+        "clause_evaluations",
+        sa.Column(
+            "reused_from_review_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("reviews.id"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "clause_evaluations", sa.Column("reuse_similarity", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("clause_evaluations", "reuse_similarity")
+    op.drop_column("clause_evaluations", "reused_from_review_id")
+    op.drop_index("ix_clause_library_lsh_bands", table_name="clause_library")
+    op.drop_column("clause_library", "lsh_bands")
+    op.drop_column("clause_library", "candidate_minhashes")
+    op.drop_column("clause_library", "source_review_id")
@@ -0,0 +1,39 @@
+"""add review revision fields
+
+Revision ID: 0017_review_revisions
+Revises: 0016_near_duplicates
+Create Date: 2025-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0017_review_revisions"
+down_revision: Union[str, None] = "0016_near_duplicates"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reviews",
+        sa.Column(
+            "parent_review_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("reviews.id"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "reviews",
+        sa.Column("revision_diff_json", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("reviews", "revision_diff_json")
+    op.drop_column("reviews", "parent_review_id")
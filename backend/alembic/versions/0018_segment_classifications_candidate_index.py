@@ -0,0 +1,39 @@
+"""add candidate selection index to segment_classifications
+
+Revision ID: 0018_candidate_index
+Revises: 0017_review_revisions
+Create Date: 2025-02-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0018_candidate_index"
+down_revision: Union[str, None] = "0017_review_revisions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction and does not block writes
+    # to the table while the index builds.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_segment_classifications_candidates",
+            "segment_classifications",
+            ["review_id", "clause_type", sa.text("confidence DESC")],
+            postgresql_include=["segment_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_segment_classifications_candidates",
+            table_name="segment_classifications",
+            postgresql_concurrently=True,
+        )
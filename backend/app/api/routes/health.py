@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from app.config import get_settings
 from app.database import db_ping
+from app.services.llm_circuit import get_circuit_breaker
 
 router = APIRouter(tags=["health"])
 
@@ -16,3 +18,21 @@ def ready() -> JSONResponse:
     if db_ping():
         return JSONResponse(status_code=200, content={"status": "ok"})
     return JSONResponse(status_code=503, content={"status": "not_ready"})
+
+
+@router.get("/health/llm")
+def llm() -> JSONResponse:
+    # Circuit state of the configured model. An open circuit degrades reviews
+    # to fallback evaluations but does not make the API unready.
+    model = get_settings().openai_model
+    try:
+        circuit = get_circuit_breaker().state(model)
+    except Exception:  # noqa: BLE001
+        return JSONResponse(
+            status_code=200,
+            content={"status": "unknown", "model": model, "circuit": None},
+        )
+    status = "degraded" if circuit["state"] in {"open", "half_open"} else "ok"
+    return JSONResponse(
+        status_code=200, content={"status": status, "model": model, "circuit": circuit}
+    )
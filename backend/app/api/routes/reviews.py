@@ -22,7 +22,11 @@ from app.schemas.reviews import (
     ReviewOut,
     ReviewUploadOut,
 )
-from app.services.uploads import UnsupportedFileType, upload_review_document
+from app.services.uploads import (
+    ScannedDocument,
+    UnsupportedFileType,
+    upload_review_document,
+)
 from app.workers.celery_tasks import process_review_task
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
@@ -111,15 +115,29 @@ def _build_explain_payload(review_id: UUID, db: Session) -> ReviewExplainOut:
                 suggested_change=evaluation.suggested_change,
                 triggered_rule_ids=evaluation.triggered_rule_ids or [],
                 evidence_spans=evidence_spans,
+                reused_from_review_id=(
+                    str(evaluation.reused_from_review_id)
+                    if evaluation.reused_from_review_id
+                    else None
+                ),
+                reuse_similarity=evaluation.reuse_similarity,
             )
         )
 
     return ReviewExplainOut(
         review_id=str(review.id),
         status=review.status.value,
-        playbook_version=get_playbook_version(),
+        playbook_version=review.playbook_version or get_playbook_version(),
         decision=review.decision,
         summary=review.summary_json,
+        reused_from_review_id=(
+            str(review.reused_from_review_id) if review.reused_from_review_id else None
+        ),
+        parent_review_id=(
+            str(review.parent_review_id) if review.parent_review_id else None
+        ),
+        revision_diff=review.revision_diff_json,
+        metrics=review.metrics_json,
         evaluations=evaluation_out,
     )
 
@@ -128,6 +146,7 @@ def _build_explain_payload(review_id: UUID, db: Session) -> ReviewExplainOut:
 def upload_review_file(
     review_id: UUID,
     file: UploadFile,
+    parent_review_id: UUID | None = Form(None),
     db: Session = Depends(get_db),
 ) -> ReviewUploadOut:
     review = db.get(Review, review_id)
@@ -135,6 +154,8 @@ def upload_review_file(
         raise HTTPException(status_code=404, detail="Review not found")
     if review.status != ReviewStatus.CREATED:
         raise HTTPException(status_code=409, detail="Review is not in CREATED status")
+    if parent_review_id is not None:
+        review.parent_review_id = _resolve_parent_review(db, parent_review_id).id
 
     try:
         data = file.file.read()
@@ -149,6 +170,8 @@ def upload_review_file(
         raise HTTPException(status_code=409, detail=str(exc)) from exc
     except UnsupportedFileType as exc:
         raise HTTPException(status_code=415, detail=str(exc)) from exc
+    except ScannedDocument as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     finally:
         file.file.close()
 
@@ -159,12 +182,29 @@ def upload_review_file(
         sha256=updated.doc_sha256,
         storage_key=updated.doc_storage_key,
     )
-    return ReviewUploadOut(review_id=updated.id, status=updated.status, doc=doc)
+    return ReviewUploadOut(
+        review_id=updated.id,
+        status=updated.status,
+        doc=doc,
+        parent_review_id=updated.parent_review_id,
+    )
+
+
+def _resolve_parent_review(db: Session, parent_review_id: UUID) -> Review:
+    # A revision carries over the parent's results, so the parent must have
+    # finished processing.
+    parent = db.get(Review, parent_review_id)
+    if parent is None:
+        raise HTTPException(status_code=404, detail="Parent review not found")
+    if parent.status != ReviewStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail="Parent review is not completed")
+    return parent
 
 
 @router.post("/{review_id}/start")
 def start_processing(
     review_id: UUID,
+    force: bool = False,
     db: Session = Depends(get_db),
 ) -> dict:
     review = db.get(Review, review_id)
@@ -179,7 +219,7 @@ def start_processing(
     db.commit()
     db.refresh(review)
 
-    async_result = process_review_task.delay(str(review.id))
+    async_result = process_review_task.delay(str(review.id), force=force)
     review.job_id = async_result.id
     review.job_status = getattr(async_result, "status", None) or "PENDING"
     db.add(review)
@@ -200,10 +240,17 @@ def submit_review(
     company_role: str | None = Form(None),
     region: str | None = Form(None),
     vendor_type: str | None = Form(None),
+    force: bool = Form(False),
+    parent_review_id: UUID | None = Form(None),
     db: Session = Depends(get_db),
 ) -> dict:
     if file is None:
         raise HTTPException(status_code=400, detail="Missing file")
+    parent = (
+        _resolve_parent_review(db, parent_review_id)
+        if parent_review_id is not None
+        else None
+    )
 
     if context_json:
         try:
@@ -222,7 +269,11 @@ def submit_review(
             "vendor_type": vendor_type or None,
         }
 
-    review = Review(status=ReviewStatus.CREATED, context_json=payload)
+    review = Review(
+        status=ReviewStatus.CREATED,
+        context_json=payload,
+        parent_review_id=parent.id if parent is not None else None,
+    )
     db.add(review)
     db.commit()
     db.refresh(review)
@@ -240,6 +291,8 @@ def submit_review(
         raise HTTPException(status_code=409, detail=str(exc)) from exc
     except UnsupportedFileType as exc:
         raise HTTPException(status_code=415, detail=str(exc)) from exc
+    except ScannedDocument as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     finally:
         file.file.close()
 
@@ -250,7 +303,7 @@ def submit_review(
         db.commit()
         db.refresh(updated)
 
-        async_result = process_review_task.delay(str(updated.id))
+        async_result = process_review_task.delay(str(updated.id), force=force)
         updated.job_id = async_result.id
         updated.job_status = getattr(async_result, "status", None) or "PENDING"
         db.add(updated)
@@ -270,6 +323,7 @@ def submit_review(
         "review_id": str(updated.id),
         "job_id": updated.job_id,
         "status": "processing",
+        "parent_review_id": str(parent.id) if parent is not None else None,
     }
 
 
@@ -29,18 +29,72 @@ class Settings(BaseSettings):
         False, validation_alias="CELERY_TASK_ALWAYS_EAGER"
     )
     max_file_size_mb: int = Field(25, validation_alias="MAX_FILE_SIZE_MB")
+    extraction_mode: str = Field("buffered", validation_alias="EXTRACTION_MODE")
+    extraction_spool_max_bytes: int = Field(
+        1024 * 1024, validation_alias="EXTRACTION_SPOOL_MAX_BYTES"
+    )
     text_density_threshold: float = Field(0.1, validation_alias="TEXT_DENSITY_THRESHOLD")
+    scanned_precheck_sample_pages: int = Field(
+        3, validation_alias="SCANNED_PRECHECK_SAMPLE_PAGES"
+    )
     use_llm_classification: bool = Field(False, validation_alias="USE_LLM_CLASSIFICATION")
     classify_rules_min_conf: float = Field(0.5, validation_alias="CLASSIFY_RULES_MIN_CONF")
     classify_top_k: int = Field(3, validation_alias="CLASSIFY_TOP_K")
+    classification_cache_enabled: bool = Field(
+        True, validation_alias="CLASSIFICATION_CACHE_ENABLED"
+    )
+    clause_library_enabled: bool = Field(True, validation_alias="CLAUSE_LIBRARY_ENABLED")
+    near_duplicate_min_similarity: float = Field(
+        0.0, validation_alias="NEAR_DUPLICATE_MIN_SIMILARITY"
+    )
     playbook_yaml_path: str = Field(
         "playbook/rules.yaml", validation_alias="PLAYBOOK_YAML_PATH"
     )
+    playbook_reload_interval_seconds: float = Field(
+        5.0, validation_alias="PLAYBOOK_RELOAD_INTERVAL_SECONDS"
+    )
     use_llm_eval: bool = Field(False, validation_alias="USE_LLM_EVAL")
     openai_api_key: str | None = Field(None, validation_alias="OPENAI_API_KEY")
     openai_model: str = Field("gpt-4.1-mini", validation_alias="OPENAI_MODEL")
     llm_max_input_chars: int = Field(60000, validation_alias="LLM_MAX_INPUT_CHARS")
     llm_temperature: float = Field(0.2, validation_alias="LLM_TEMPERATURE")
+    pipeline_mode: str = Field("monolithic", validation_alias="PIPELINE_MODE")
+    db_round_trip_metrics: bool = Field(False, validation_alias="DB_ROUND_TRIP_METRICS")
+    llm_eval_concurrency: int = Field(4, validation_alias="LLM_EVAL_CONCURRENCY")
+    llm_pool_max_connections: int = Field(20, validation_alias="LLM_POOL_MAX_CONNECTIONS")
+    llm_pool_max_keepalive: int = Field(10, validation_alias="LLM_POOL_MAX_KEEPALIVE")
+    llm_keepalive_expiry_seconds: float = Field(
+        30.0, validation_alias="LLM_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    llm_timeout_seconds: float = Field(60.0, validation_alias="LLM_TIMEOUT_SECONDS")
+    llm_connect_timeout_seconds: float = Field(
+        5.0, validation_alias="LLM_CONNECT_TIMEOUT_SECONDS"
+    )
+    llm_retry_deadline_seconds: float = Field(
+        120.0, validation_alias="LLM_RETRY_DEADLINE_SECONDS"
+    )
+    llm_surface_reprobe_seconds: float = Field(
+        3600.0, validation_alias="LLM_SURFACE_REPROBE_SECONDS"
+    )
+    llm_rate_limit_backend: str = Field("redis", validation_alias="LLM_RATE_LIMIT_BACKEND")
+    llm_rpm_limit: int = Field(0, validation_alias="LLM_RPM_LIMIT")
+    llm_tpm_limit: int = Field(0, validation_alias="LLM_TPM_LIMIT")
+    llm_rate_limits: dict[str, dict[str, int]] = Field(
+        default_factory=dict, validation_alias="LLM_RATE_LIMITS"
+    )
+    llm_rate_limit_max_wait_seconds: float = Field(
+        60.0, validation_alias="LLM_RATE_LIMIT_MAX_WAIT_SECONDS"
+    )
+    llm_circuit_backend: str = Field("redis", validation_alias="LLM_CIRCUIT_BACKEND")
+    llm_circuit_failure_threshold: int = Field(
+        5, validation_alias="LLM_CIRCUIT_FAILURE_THRESHOLD"
+    )
+    llm_circuit_cooldown_seconds: float = Field(
+        30.0, validation_alias="LLM_CIRCUIT_COOLDOWN_SECONDS"
+    )
+    llm_cache_backend: str = Field("memory", validation_alias="LLM_CACHE_BACKEND")
+    llm_cache_ttl_seconds: int = Field(604800, validation_alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_entries: int = Field(10000, validation_alias="LLM_CACHE_MAX_ENTRIES")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,6 +1,9 @@
-from typing import Generator
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, Iterator
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config import get_settings
@@ -10,6 +13,8 @@ engine = create_engine(settings.database_url, pool_pre_ping=True, future=True)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base = declarative_base()
 
+_round_trips: ContextVar[dict | None] = ContextVar("db_round_trips", default=None)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -26,3 +31,45 @@ def db_ping() -> bool:
         return True
     except Exception:
         return False
+
+
+@contextmanager
+def count_round_trips() -> Iterator[dict]:
+    # Counts statements sent to the database and commits made by sessions in
+    # the current thread or task while the block runs. The event listeners
+    # are only attached the first time this is used.
+    _listen_for_round_trips()
+    counts = {"statements": 0, "commits": 0}
+    token = _round_trips.set(counts)
+    try:
+        yield counts
+    finally:
+        _round_trips.reset(token)
+
+
+_listeners_lock = threading.Lock()
+_listening = False
+
+
+def _listen_for_round_trips() -> None:
+    global _listening
+    with _listeners_lock:
+        if _listening:
+            return
+        event.listen(engine, "before_cursor_execute", _count_statement)
+        event.listen(SessionLocal, "after_commit", _count_commit)
+        _listening = True
+
+
+def _count(kind: str) -> None:
+    counts = _round_trips.get()
+    if counts is not None:
+        counts[kind] += 1
+
+
+def _count_statement(*_args) -> None:
+    _count("statements")
+
+
+def _count_commit(_session) -> None:
+    _count("commits")
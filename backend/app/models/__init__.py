@@ -1,15 +1,23 @@
 from app.models.classification import SegmentClassification
+from app.models.classification_cache_entry import ClassificationCacheEntry
 from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_library_entry import ClauseLibraryEntry
 from app.models.clause_type import ClauseType
+from app.models.llm_cache_entry import LLMCacheEntry
 from app.models.review import Review, ReviewStatus
 from app.models.risk_label import RiskLabel
 from app.models.segment import ReviewSegment
+from app.models.stage_checkpoint import ReviewStageCheckpoint
 
 __all__ = [
+    "ClassificationCacheEntry",
     "ClauseEvaluation",
+    "ClauseLibraryEntry",
     "ClauseType",
+    "LLMCacheEntry",
     "Review",
     "ReviewSegment",
+    "ReviewStageCheckpoint",
     "ReviewStatus",
     "RiskLabel",
     "SegmentClassification",
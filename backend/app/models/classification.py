@@ -41,4 +41,13 @@ class SegmentClassification(Base):
             "clause_type",
             unique=True,
         ),
+        # Candidate selection: a review's classifications of one clause type
+        # by confidence, without visiting the heap.
+        Index(
+            "ix_segment_classifications_candidates",
+            "review_id",
+            "clause_type",
+            confidence.desc(),
+            postgresql_include=["segment_id"],
+        ),
     )
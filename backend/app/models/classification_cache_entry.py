@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ClassificationCacheEntry(Base):
+    __tablename__ = "segment_classification_cache"
+
+    segment_hash: Mapped[str] = mapped_column(String(length=32), primary_key=True)
+    config_hash: Mapped[str] = mapped_column(String(length=64), primary_key=True)
+    results: Mapped[list[dict]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, Index, text
+from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -34,6 +34,16 @@ class ClauseEvaluation(Base):
     evidence_spans: Mapped[list[dict]] = mapped_column(
         JSONB, nullable=False, server_default=text("'[]'::jsonb")
     )
+    input_hash: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
+    library_entry_id: Mapped[int | None] = mapped_column(
+        ForeignKey("clause_library.id"), nullable=True
+    )
+    # Set when the evaluation was taken from the clause library: the review
+    # that produced it and the estimated similarity of the match (1 = exact).
+    reused_from_review_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("reviews.id"), nullable=True
+    )
+    reuse_similarity: Mapped[float | None] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import (
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.clause_type import ClauseType
+from app.models.risk_label import RiskLabel
+
+
+class ClauseLibraryEntry(Base):
+    __tablename__ = "clause_library"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    clause_type: Mapped[ClauseType] = mapped_column(
+        SAEnum(ClauseType, name="clause_type", create_type=False), nullable=False
+    )
+    candidates_hash: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    context_hash: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    playbook_fingerprint: Mapped[str] = mapped_column(
+        String(length=64), nullable=False
+    )
+    evaluator_hash: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    risk_label: Mapped[RiskLabel] = mapped_column(
+        SAEnum(RiskLabel, name="risk_label", create_type=False), nullable=False
+    )
+    short_reason: Mapped[str] = mapped_column(nullable=False)
+    suggested_change: Mapped[str | None] = mapped_column(nullable=True)
+    triggered_rule_ids: Mapped[list[str]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    evidence_quotes: Mapped[list[str]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    source_review_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("reviews.id"), nullable=True
+    )
+    # MinHash signatures of the candidates in candidate order, and the union
+    # of their LSH band values for near-duplicate lookups.
+    candidate_minhashes: Mapped[list[list[int]]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    lsh_bands: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), nullable=False, server_default=text("'{}'")
+    )
+    hit_count: Mapped[int] = mapped_column(nullable=False, server_default=text("0"))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index(
+            "uq_clause_library_key",
+            "candidates_hash",
+            "clause_type",
+            "context_hash",
+            "playbook_fingerprint",
+            "evaluator_hash",
+            unique=True,
+        ),
+        Index("ix_clause_library_lsh_bands", "lsh_bands", postgresql_using="gin"),
+    )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Enum as SAEnum, String, func
+from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -32,13 +32,27 @@ class Review(Base):
     doc_filename: Mapped[str | None] = mapped_column(nullable=True)
     doc_mime: Mapped[str | None] = mapped_column(nullable=True)
     doc_size_bytes: Mapped[int | None] = mapped_column(nullable=True)
-    doc_sha256: Mapped[str | None] = mapped_column(nullable=True)
+    doc_sha256: Mapped[str | None] = mapped_column(nullable=True, index=True)
     doc_storage_key: Mapped[str | None] = mapped_column(nullable=True)
     error_message: Mapped[str | None] = mapped_column(nullable=True)
     job_id: Mapped[str | None] = mapped_column(String(length=128), nullable=True)
     job_status: Mapped[str | None] = mapped_column(String(length=32), nullable=True)
     decision: Mapped[str | None] = mapped_column(nullable=True)
     summary_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    metrics_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    playbook_version: Mapped[str | None] = mapped_column(
+        String(length=64), nullable=True
+    )
+    results_fingerprint: Mapped[str | None] = mapped_column(
+        String(length=64), nullable=True
+    )
+    reused_from_review_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("reviews.id"), nullable=True
+    )
+    parent_review_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("reviews.id"), nullable=True
+    )
+    revision_diff_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ReviewStageCheckpoint(Base):
+    __tablename__ = "review_stage_checkpoints"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    review_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("reviews.id"), nullable=False
+    )
+    stage: Mapped[str] = mapped_column(String(length=32), nullable=False)
+    input_hash: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "review_id",
+            "stage",
+            name="uq_review_stage_checkpoints_review_stage",
+        ),
+    )
@@ -1,3 +1,15 @@
-from app.playbook.rules import get_classification_keywords, get_rules, get_rules_for_clause_type
+from app.playbook.rules import (
+    CompiledPlaybook,
+    get_classification_keywords,
+    get_compiled_playbook,
+    get_rules,
+    get_rules_for_clause_type,
+)
 
-__all__ = ["get_classification_keywords", "get_rules", "get_rules_for_clause_type"]
+__all__ = [
+    "CompiledPlaybook",
+    "get_classification_keywords",
+    "get_compiled_playbook",
+    "get_rules",
+    "get_rules_for_clause_type",
+]
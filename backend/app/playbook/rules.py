@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -9,6 +16,8 @@ from app.config import get_settings
 from app.models.clause_type import ClauseType
 from app.playbook.schema import PlaybookFile
 
+logger = logging.getLogger(__name__)
+
 
 def normalize(value: str) -> str:
     return value.strip().lower().replace("-", "_").replace(" ", "_")
@@ -35,22 +44,49 @@ YAML_TO_ENUM.update(
     }
 )
 
-_CACHE: dict[str, object] = {"path": None, "version": None, "rules": None}
+_BASE_DIR = Path(__file__).resolve().parents[2]
+
+RULE_PROMPT_FIELDS = (
+    "rule_id",
+    "clause_type",
+    "title",
+    "requirement",
+    "preferred_position",
+    "fallback_position",
+    "red_flag",
+    "severity",
+    "mandatory",
+    "rationale",
+    "gdpr_references",
+)
+
+
+@dataclass(frozen=True)
+class CompiledPlaybook:
+    path: Path
+    version: str
+    fingerprint: str
+    mtime_ns: int
+    size: int
+    rules_by_clause: dict[ClauseType, list[dict]]
+    keywords_by_clause: dict[ClauseType, list[str]]
+    rules_json_by_clause: dict[ClauseType, str]
 
 
+_LOCK = threading.Lock()
+_CURRENT: CompiledPlaybook | None = None
+_LAST_CHECKED = 0.0
+
+
+@lru_cache(maxsize=8)
 def _resolve_playbook_path(path: str) -> Path:
     resolved = Path(path)
     if resolved.is_absolute():
         return resolved
-    base_dir = Path(__file__).resolve().parents[2]
-    return base_dir / resolved
+    return _BASE_DIR / resolved
 
 
-def load_playbook_from_yaml(path: str) -> tuple[str, dict[ClauseType, list[dict]]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
-    playbook = PlaybookFile.model_validate(data)
-
+def _rules_from_playbook(playbook: PlaybookFile) -> dict[ClauseType, list[dict]]:
     rules_by_clause: dict[ClauseType, list[dict]] = {clause: [] for clause in ClauseType}
     for rule in playbook.playbook.rules:
         clause_key = normalize(rule.clause_type)
@@ -58,51 +94,29 @@ def load_playbook_from_yaml(path: str) -> tuple[str, dict[ClauseType, list[dict]
             raise ValueError(f"Unknown clause_type: {rule.clause_type}")
         clause_type = YAML_TO_ENUM[clause_key]
         rules_by_clause[clause_type].append(rule.model_dump())
+    return rules_by_clause
 
-    return playbook.playbook.version, rules_by_clause
-
-
-def _get_loaded() -> tuple[str, dict[ClauseType, list[dict]]]:
-    settings = get_settings()
-    path = _resolve_playbook_path(settings.playbook_yaml_path)
-    cached_path = _CACHE["path"]
-    cached_rules = _CACHE["rules"]
-    cached_version = _CACHE["version"]
-    if cached_path == path and cached_rules is not None and cached_version is not None:
-        return cached_version, cached_rules  # type: ignore[return-value]
-
-    if not path.exists():
-        empty_rules = {clause: [] for clause in ClauseType}
-        _CACHE.update({"path": path, "version": "0", "rules": empty_rules})
-        return "0", empty_rules
-
-    version, rules_by_clause = load_playbook_from_yaml(str(path))
-    _CACHE.update({"path": path, "version": version, "rules": rules_by_clause})
-    return version, rules_by_clause
-
-
-def get_rules_for_clause_type(clause_type: ClauseType) -> list[dict]:
-    _version, rules = _get_loaded()
-    return rules.get(clause_type, [])
 
-
-def get_rules() -> list[dict]:
-    _version, rules = _get_loaded()
-    all_rules: list[dict] = []
-    for rule_list in rules.values():
-        all_rules.extend(rule_list)
-    return all_rules
+def load_playbook_from_yaml(path: str) -> tuple[str, dict[ClauseType, list[dict]]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = yaml.safe_load(handle) or {}
+    playbook = PlaybookFile.model_validate(data)
+    return playbook.playbook.version, _rules_from_playbook(playbook)
 
 
-def get_playbook_version() -> str:
-    version, _rules = _get_loaded()
-    return version
+def serialize_rule_fields(playbook_rules: list[dict]) -> str:
+    rule_fields = [
+        {field: rule.get(field) for field in RULE_PROMPT_FIELDS}
+        for rule in playbook_rules
+    ]
+    return json.dumps(rule_fields, indent=2)
 
 
-def get_classification_keywords() -> dict[ClauseType, list[str]]:
-    _version, rules = _get_loaded()
+def _build_keywords(
+    rules_by_clause: dict[ClauseType, list[dict]],
+) -> dict[ClauseType, list[str]]:
     keywords_map: dict[ClauseType, list[str]] = {clause: [] for clause in ClauseType}
-    for clause_type, rule_list in rules.items():
+    for clause_type, rule_list in rules_by_clause.items():
         existing = keywords_map[clause_type]
         seen = set(existing)
         for rule in rule_list:
@@ -118,3 +132,120 @@ def get_classification_keywords() -> dict[ClauseType, list[str]]:
                 existing.append(normalized)
                 seen.add(normalized)
     return keywords_map
+
+
+def compile_playbook(
+    path: Path, content: bytes, mtime_ns: int = 0, size: int = 0
+) -> CompiledPlaybook:
+    data = yaml.safe_load(content) or {}
+    playbook = PlaybookFile.model_validate(data)
+    rules_by_clause = _rules_from_playbook(playbook)
+    return CompiledPlaybook(
+        path=path,
+        version=playbook.playbook.version,
+        fingerprint=hashlib.sha256(content).hexdigest(),
+        mtime_ns=mtime_ns,
+        size=size,
+        rules_by_clause=rules_by_clause,
+        keywords_by_clause=_build_keywords(rules_by_clause),
+        rules_json_by_clause={
+            clause_type: serialize_rule_fields(rule_list)
+            for clause_type, rule_list in rules_by_clause.items()
+        },
+    )
+
+
+def _empty_playbook(path: Path) -> CompiledPlaybook:
+    empty_rules: dict[ClauseType, list[dict]] = {clause: [] for clause in ClauseType}
+    return CompiledPlaybook(
+        path=path,
+        version="0",
+        fingerprint="missing",
+        mtime_ns=0,
+        size=0,
+        rules_by_clause=empty_rules,
+        keywords_by_clause={clause: [] for clause in ClauseType},
+        rules_json_by_clause={clause: serialize_rule_fields([]) for clause in ClauseType},
+    )
+
+
+def _refresh(path: Path, current: CompiledPlaybook | None) -> CompiledPlaybook:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        if current is not None and current.path == path and current.fingerprint == "missing":
+            return current
+        return _empty_playbook(path)
+
+    if (
+        current is not None
+        and current.path == path
+        and current.mtime_ns == stat.st_mtime_ns
+        and current.size == stat.st_size
+    ):
+        return current
+
+    with open(path, "rb") as handle:
+        content = handle.read()
+    fingerprint = hashlib.sha256(content).hexdigest()
+    if current is not None and current.path == path and current.fingerprint == fingerprint:
+        return replace(current, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    return compile_playbook(path, content, stat.st_mtime_ns, stat.st_size)
+
+
+def get_compiled_playbook() -> CompiledPlaybook:
+    global _CURRENT, _LAST_CHECKED
+    settings = get_settings()
+    path = _resolve_playbook_path(settings.playbook_yaml_path)
+    current = _CURRENT
+    now = time.monotonic()
+    if (
+        current is not None
+        and current.path == path
+        and now - _LAST_CHECKED < settings.playbook_reload_interval_seconds
+    ):
+        return current
+
+    with _LOCK:
+        current = _CURRENT
+        if (
+            current is None
+            or current.path != path
+            or now - _LAST_CHECKED >= settings.playbook_reload_interval_seconds
+        ):
+            # Readers hold a reference to a single immutable snapshot; swapping
+            # the module global is atomic, so a reload never mixes two versions.
+            # A broken or half-written file keeps the last good snapshot until
+            # the next check instead of failing every caller.
+            try:
+                _CURRENT = _refresh(path, current)
+            except (OSError, ValueError, yaml.YAMLError):
+                if current is None or current.path != path:
+                    raise
+                logger.exception(
+                    "Playbook %s failed to reload; keeping version %s",
+                    path,
+                    current.version,
+                )
+            _LAST_CHECKED = now
+        return _CURRENT
+
+
+def get_rules_for_clause_type(clause_type: ClauseType) -> list[dict]:
+    return get_compiled_playbook().rules_by_clause.get(clause_type, [])
+
+
+def get_rules() -> list[dict]:
+    all_rules: list[dict] = []
+    for rule_list in get_compiled_playbook().rules_by_clause.values():
+        all_rules.extend(rule_list)
+    return all_rules
+
+
+def get_playbook_version() -> str:
+    return get_compiled_playbook().version
+
+
+def get_classification_keywords() -> dict[ClauseType, list[str]]:
+    keywords_map = get_compiled_playbook().keywords_by_clause
+    return {clause_type: list(keywords) for clause_type, keywords in keywords_map.items()}
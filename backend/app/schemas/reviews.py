@@ -33,6 +33,8 @@ class ClauseEvaluationOut(BaseModel):
     suggested_change: str | None = None
     triggered_rule_ids: list[str]
     evidence_spans: list[EvidenceSpanOut]
+    reused_from_review_id: str | None = None
+    reuse_similarity: float | None = None
 
 
 class ReviewExplainOut(BaseModel):
@@ -41,6 +43,10 @@ class ReviewExplainOut(BaseModel):
     playbook_version: str
     decision: str | None = None
     summary: dict | None = None
+    reused_from_review_id: str | None = None
+    parent_review_id: str | None = None
+    revision_diff: dict | None = None
+    metrics: dict | None = None
     evaluations: list[ClauseEvaluationOut]
 
 
@@ -57,3 +63,4 @@ class ReviewUploadOut(BaseModel):
     review_id: UUID
     status: ReviewStatus
     doc: ReviewDoc
+    parent_review_id: UUID | None = None
@@ -4,8 +4,10 @@ import json
 
 from app.config import get_settings
 from app.models.clause_type import ClauseType
-from app.playbook.rules import get_classification_keywords
-from app.services.openai_retry import retry_with_backoff
+from app.playbook.rules import get_compiled_playbook
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.llm_cache import get_llm_cache
+from app.services.llm_gateway import get_llm_gateway
 
 FALLBACK_CLASSIFICATION_RULES: dict[ClauseType, list[str]] = {
     ClauseType.ROLES: ["controller", "processor", "data controller", "data processor", "parties"],
@@ -44,26 +46,38 @@ FALLBACK_CLASSIFICATION_RULES: dict[ClauseType, list[str]] = {
 # }
 
 
+_MATCHER_CACHE: dict[str, KeywordMatcher] = {}
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    playbook = get_compiled_playbook()
+    matcher = _MATCHER_CACHE.get(playbook.fingerprint)
+    if matcher is None:
+        matcher = KeywordMatcher(
+            {
+                clause_type: playbook.keywords_by_clause.get(clause_type)
+                or FALLBACK_CLASSIFICATION_RULES.get(clause_type, [])
+                for clause_type in ClauseType
+            }
+        )
+        _MATCHER_CACHE.clear()
+        _MATCHER_CACHE[playbook.fingerprint] = matcher
+    return matcher
+
+
 def classify_segment_rules(segment_text: str) -> list[dict]:
     normalized = segment_text.lower()
     results: list[dict] = []
-    keywords_map = get_classification_keywords()
-    for clause_type in ClauseType:
-        keywords = keywords_map.get(clause_type) or FALLBACK_CLASSIFICATION_RULES.get(
-            clause_type, []
+    matcher = get_keyword_matcher()
+    for clause_type, score in matcher.count_hits(normalized).items():
+        confidence = min((score / matcher.totals[clause_type]) * 2, 0.9)
+        results.append(
+            {
+                "clause_type": clause_type,
+                "confidence": confidence,
+                "method": "RULES",
+            }
         )
-        if not keywords:
-            continue
-        score = sum(1 for keyword in keywords if keyword in normalized)
-        if score > 0:
-            confidence = min((score / len(keywords)) * 2, 0.9)
-            results.append(
-                {
-                    "clause_type": clause_type,
-                    "confidence": confidence,
-                    "method": "RULES",
-                }
-            )
     results.sort(key=lambda item: (-item["confidence"], item["clause_type"].value))
     settings = get_settings()
     top_k = settings.classify_top_k
@@ -107,29 +121,16 @@ def call_llm_openai_classify(prompt: str) -> str:
     settings = get_settings()
     if not settings.openai_api_key:
         raise RuntimeError("Missing OpenAI API key")
-    from openai import OpenAI
+    return get_llm_cache().get_or_call(
+        "classification",
+        prompt,
+        lambda: _request_openai_classify(prompt),
+        cacheable=lambda payload: bool(_parse_llm_output(payload)),
+    )
 
-    client = OpenAI(api_key=settings.openai_api_key)
 
-    def _call() -> str:
-        try:
-            response = client.responses.create(
-                model=settings.openai_model,
-                input=prompt,
-                temperature=settings.llm_temperature,
-            )
-            if hasattr(response, "output_text"):
-                return response.output_text
-        except Exception:
-            response = client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=settings.llm_temperature,
-            )
-            return response.choices[0].message.content or ""
-        raise RuntimeError("Empty LLM response")
-
-    return retry_with_backoff(_call)
+def _request_openai_classify(prompt: str) -> str:
+    return get_llm_gateway().complete("classification", prompt)
 
 
 def _parse_llm_output(payload: str) -> list[dict]:
@@ -162,14 +163,19 @@ def _parse_llm_output(payload: str) -> list[dict]:
     return results
 
 
-def classify_segment(segment_text: str) -> list[dict]:
+def classify_segment(segment_text: str) -> tuple[list[dict], bool]:
+    # The flag is False when the LLM should have answered but did not (no API
+    # key, an error, an open circuit). The rules-only fallback is then used
+    # for this review but must not be cached as the classifier's answer.
     settings = get_settings()
     rules_results = classify_segment_rules(segment_text)
     if rules_results:
         top_conf = rules_results[0]["confidence"]
         if top_conf >= settings.classify_rules_min_conf:
-            return rules_results
+            return rules_results, True
+    if not settings.use_llm_classification:
+        return rules_results, True
     llm_results = classify_segment_llm(segment_text)
     if llm_results:
-        return llm_results
-    return rules_results
+        return llm_results, True
+    return rules_results, False
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.classification_cache_entry import ClassificationCacheEntry
+from app.models.clause_type import ClauseType
+from app.playbook.rules import get_compiled_playbook
+
+_BATCH_SIZE = 1000
+
+
+def classifier_config() -> list:
+    # Everything besides the segment text that can change what
+    # ``classify_segment`` returns.
+    settings = get_settings()
+    return [
+        get_compiled_playbook().fingerprint,
+        settings.use_llm_classification,
+        settings.classify_rules_min_conf,
+        settings.classify_top_k,
+        settings.openai_model,
+        bool(settings.openai_api_key),
+    ]
+
+
+def classifier_config_hash() -> str:
+    payload = json.dumps(classifier_config(), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def lookup_cached_classifications(
+    db: Session, segment_hashes: Iterable[str], config_hash: str
+) -> dict[str, list[dict]]:
+    hashes = sorted(set(segment_hashes))
+    cached: dict[str, list[dict]] = {}
+    for start in range(0, len(hashes), _BATCH_SIZE):
+        rows = db.execute(
+            select(ClassificationCacheEntry.segment_hash, ClassificationCacheEntry.results)
+            .where(
+                ClassificationCacheEntry.config_hash == config_hash,
+                ClassificationCacheEntry.segment_hash.in_(
+                    hashes[start : start + _BATCH_SIZE]
+                ),
+            )
+        ).all()
+        for segment_hash, results in rows:
+            cached[segment_hash] = [
+                {**result, "clause_type": ClauseType(result["clause_type"])}
+                for result in results
+            ]
+    return cached
+
+
+def store_cached_classifications(
+    db: Session, results_by_hash: dict[str, list[dict]], config_hash: str
+) -> None:
+    rows = [
+        {
+            "segment_hash": segment_hash,
+            "config_hash": config_hash,
+            "results": [
+                {
+                    "clause_type": ClauseType(result["clause_type"]).value,
+                    "confidence": result["confidence"],
+                    "method": result["method"],
+                }
+                for result in results
+            ],
+        }
+        for segment_hash, results in results_by_hash.items()
+    ]
+    for start in range(0, len(rows), _BATCH_SIZE):
+        db.execute(
+            insert(ClassificationCacheEntry)
+            .values(rows[start : start + _BATCH_SIZE])
+            .on_conflict_do_nothing(index_elements=["segment_hash", "config_hash"])
+        )
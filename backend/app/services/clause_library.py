@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.clause_library_entry import ClauseLibraryEntry
+from app.models.clause_type import ClauseType
+from app.models.risk_label import RiskLabel
+from app.playbook.rules import get_compiled_playbook
+from app.services.fingerprint import estimate_similarity, lsh_bands
+
+
+_NEAR_DUPLICATE_SCAN_LIMIT = 50
+
+
+def _sha256(value: object) -> str:
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def normalize_context(context: dict | None) -> dict:
+    # String values are trimmed and empty values dropped, so contexts that only
+    # differ in blank fields share library entries. Key order is ignored by the
+    # sorted JSON hash.
+    normalized: dict = {}
+    for key, value in (context or {}).items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value in (None, "", [], {}):
+            continue
+        normalized[key] = value
+    return normalized
+
+
+def evaluator_hash() -> str:
+    settings = get_settings()
+    return _sha256(
+        [
+            settings.use_llm_eval,
+            settings.openai_model,
+            settings.llm_temperature,
+            settings.llm_max_input_chars,
+        ]
+    )
+
+
+def clause_library_key(
+    clause_type: ClauseType, candidate_hashes: list[str], context: dict | None
+) -> dict:
+    return {
+        "clause_type": clause_type,
+        "candidates_hash": _sha256(candidate_hashes),
+        "context_hash": _sha256(normalize_context(context)),
+        "playbook_fingerprint": get_compiled_playbook().fingerprint,
+        "evaluator_hash": evaluator_hash(),
+    }
+
+
+def _key_tuple(key: dict) -> tuple:
+    return (
+        key["candidates_hash"],
+        key["clause_type"],
+        key["context_hash"],
+        key["playbook_fingerprint"],
+        key["evaluator_hash"],
+    )
+
+
+def lookup_library_entries(
+    db: Session, keys: dict[ClauseType, dict]
+) -> dict[ClauseType, ClauseLibraryEntry]:
+    if not keys:
+        return {}
+    wanted = {_key_tuple(key): clause_type for clause_type, key in keys.items()}
+    entries = (
+        db.execute(
+            select(ClauseLibraryEntry).where(
+                ClauseLibraryEntry.candidates_hash.in_(
+                    {key["candidates_hash"] for key in keys.values()}
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    found: dict[ClauseType, ClauseLibraryEntry] = {}
+    for entry in entries:
+        clause_type = wanted.get(
+            (
+                entry.candidates_hash,
+                entry.clause_type,
+                entry.context_hash,
+                entry.playbook_fingerprint,
+                entry.evaluator_hash,
+            )
+        )
+        if clause_type is not None:
+            found[clause_type] = entry
+    mark_library_entries_used(db, [entry.id for entry in found.values()])
+    return found
+
+
+def find_near_duplicate_entries(
+    db: Session, key: dict, signatures: list[list[int]], min_similarity: float
+) -> list[tuple[float, ClauseLibraryEntry]]:
+    # Entries with the same clause, context, playbook and evaluator whose
+    # candidates each have an estimated similarity of at least
+    # ``min_similarity`` to the candidate at the same position, closest
+    # first. The band overlap query only narrows the search.
+    if min_similarity <= 0 or not signatures:
+        return []
+    bands = sorted({band for signature in signatures for band in lsh_bands(signature)})
+    entries = (
+        db.execute(
+            select(ClauseLibraryEntry)
+            .where(
+                ClauseLibraryEntry.clause_type == key["clause_type"],
+                ClauseLibraryEntry.context_hash == key["context_hash"],
+                ClauseLibraryEntry.playbook_fingerprint == key["playbook_fingerprint"],
+                ClauseLibraryEntry.evaluator_hash == key["evaluator_hash"],
+                ClauseLibraryEntry.lsh_bands.overlap(bands),
+                func.jsonb_array_length(ClauseLibraryEntry.candidate_minhashes)
+                == len(signatures),
+            )
+            .order_by(ClauseLibraryEntry.last_used_at.desc())
+            .limit(_NEAR_DUPLICATE_SCAN_LIMIT)
+        )
+        .scalars()
+        .all()
+    )
+    matches: list[tuple[float, ClauseLibraryEntry]] = []
+    for entry in entries:
+        similarity = min(
+            estimate_similarity(left, right)
+            for left, right in zip(signatures, entry.candidate_minhashes)
+        )
+        if similarity >= min_similarity:
+            matches.append((similarity, entry))
+    matches.sort(key=lambda match: match[0], reverse=True)
+    return matches
+
+
+def mark_library_entries_used(db: Session, entry_ids: list[int]) -> None:
+    if not entry_ids:
+        return
+    db.execute(
+        update(ClauseLibraryEntry)
+        .where(ClauseLibraryEntry.id.in_(entry_ids))
+        .values(hit_count=ClauseLibraryEntry.hit_count + 1, last_used_at=func.now())
+    )
+
+
+def library_entry_result(entry: ClauseLibraryEntry) -> dict:
+    return {
+        "risk_label": entry.risk_label.value,
+        "short_reason": entry.short_reason,
+        "suggested_change": entry.suggested_change,
+        "candidate_quotes": list(entry.evidence_quotes or []),
+        "triggered_rule_ids": list(entry.triggered_rule_ids or []),
+    }
+
+
+def store_library_entries(
+    db: Session,
+    entries: dict[ClauseType, tuple[dict, dict, list[list[int]]]],
+    source_review_id: UUID,
+) -> dict[ClauseType, int]:
+    # ``entries`` maps each clause type to its library key, evaluation result
+    # and candidate signatures. All of them are upserted in one statement.
+    if not entries:
+        return {}
+    rows = []
+    for key, result, signatures in entries.values():
+        rows.append(
+            {
+                **key,
+                "risk_label": RiskLabel(result["risk_label"]),
+                "short_reason": result["short_reason"],
+                "suggested_change": result["suggested_change"],
+                "triggered_rule_ids": result.get("triggered_rule_ids", []),
+                "evidence_quotes": result.get("candidate_quotes", []),
+                "source_review_id": source_review_id,
+                "candidate_minhashes": list(signatures),
+                "lsh_bands": sorted(
+                    {band for signature in signatures for band in lsh_bands(signature)}
+                ),
+            }
+        )
+    statement = insert(ClauseLibraryEntry).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[
+            "candidates_hash",
+            "clause_type",
+            "context_hash",
+            "playbook_fingerprint",
+            "evaluator_hash",
+        ],
+        set_={
+            column: statement.excluded[column]
+            for column in (
+                "risk_label",
+                "short_reason",
+                "suggested_change",
+                "triggered_rule_ids",
+                "evidence_quotes",
+                "source_review_id",
+                "candidate_minhashes",
+                "lsh_bands",
+            )
+        }
+        | {"last_used_at": func.now()},
+    )
+    returned = db.execute(
+        statement.returning(ClauseLibraryEntry.clause_type, ClauseLibraryEntry.id)
+    ).all()
+    return {clause_type: entry_id for clause_type, entry_id in returned}
@@ -5,7 +5,9 @@ import json
 from app.config import get_settings
 from app.models.clause_type import ClauseType
 from app.models.risk_label import RiskLabel
-from app.services.openai_retry import retry_with_backoff
+from app.playbook.rules import get_compiled_playbook, serialize_rule_fields
+from app.services.llm_cache import get_llm_cache
+from app.services.llm_gateway import get_llm_gateway
 
 CRITICAL_MISSING_CLAUSES = {
     ClauseType.SECURITY_TOMS,
@@ -46,22 +48,11 @@ def build_eval_prompt(
     settings = get_settings()
     segment_blob = "\n\n---\n\n".join(segment_texts)
     segment_blob = segment_blob[: settings.llm_max_input_chars]
-    rule_fields = [
-        {
-            "rule_id": rule.get("rule_id"),
-            "clause_type": rule.get("clause_type"),
-            "title": rule.get("title"),
-            "requirement": rule.get("requirement"),
-            "preferred_position": rule.get("preferred_position"),
-            "fallback_position": rule.get("fallback_position"),
-            "red_flag": rule.get("red_flag"),
-            "severity": rule.get("severity"),
-            "mandatory": rule.get("mandatory"),
-            "rationale": rule.get("rationale"),
-            "gdpr_references": rule.get("gdpr_references"),
-        }
-        for rule in playbook_rules
-    ]
+    compiled = get_compiled_playbook()
+    if playbook_rules is compiled.rules_by_clause.get(clause_type):
+        rules_json = compiled.rules_json_by_clause[clause_type]
+    else:
+        rules_json = serialize_rule_fields(playbook_rules)
     prompt = (
         "You are a DPA clause evaluator. Use ONLY the provided clause text, rules, "
         "and context JSON. Do not infer facts that are not in the text. Return ONLY "
@@ -98,7 +89,7 @@ def build_eval_prompt(
         "\"candidate_quotes\":[\"...\"],\"triggered_rule_ids\":[\"R1\"]}\n\n"
         f"Clause: {clause_type.value}\n"
         f"Context JSON:\n{json.dumps(context or {}, indent=2)}\n"
-        f"Playbook rules:\n{json.dumps(rule_fields, indent=2)}\n"
+        f"Playbook rules:\n{rules_json}\n"
         f"Clause text:\n{segment_blob}"
     )
     return prompt
@@ -154,33 +145,28 @@ def _parse_eval_json(payload: str) -> dict:
     return data
 
 
+def _is_valid_eval_payload(payload: str) -> bool:
+    try:
+        _parse_eval_json(payload)
+    except ValueError:
+        return False
+    return True
+
+
 def call_llm_openai(prompt: str) -> str:
     settings = get_settings()
     if not settings.openai_api_key:
         raise RuntimeError("Missing OpenAI API key")
-    from openai import OpenAI
-
-    client = OpenAI(api_key=settings.openai_api_key)
-
-    def _call() -> str:
-        try:
-            response = client.responses.create(
-                model=settings.openai_model,
-                input=prompt,
-                temperature=settings.llm_temperature,
-            )
-            if hasattr(response, "output_text"):
-                return response.output_text
-        except Exception:
-            response = client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=settings.llm_temperature,
-            )
-            return response.choices[0].message.content or ""
-        raise RuntimeError("Empty LLM response")
-
-    return retry_with_backoff(_call)
+    return get_llm_cache().get_or_call(
+        "evaluation",
+        prompt,
+        lambda: _request_openai(prompt),
+        cacheable=_is_valid_eval_payload,
+    )
+
+
+def _request_openai(prompt: str) -> str:
+    return get_llm_gateway().complete("evaluation", prompt)
 
 
 def _fallback_eval(message: str) -> dict:
@@ -190,6 +176,7 @@ def _fallback_eval(message: str) -> dict:
         "suggested_change": "Manual review recommended.",
         "candidate_quotes": [],
         "triggered_rule_ids": [],
+        "fallback": True,
     }
 
 
@@ -207,6 +194,7 @@ def evaluate_clause(
             "suggested_change": "Enable LLM or review manually.",
             "candidate_quotes": [],
             "triggered_rule_ids": [],
+            "fallback": True,
         }
 
     prompt = build_eval_prompt(clause_type, segment_texts, context, playbook_rules)
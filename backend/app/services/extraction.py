@@ -1,30 +1,89 @@
 from __future__ import annotations
 
+import zipfile
 from io import BytesIO
+from typing import BinaryIO, Iterator
+from xml.etree.ElementTree import iterparse
 
 from fastapi import HTTPException
 from pypdf import PdfReader
-from docx import Document
 
 from app.config import get_settings
 
-ALLOWED_MIME_TYPES = {
-    "application/pdf",
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-}
+DOCX_MIME_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+ALLOWED_MIME_TYPES = {"application/pdf", DOCX_MIME_TYPE}
+SCANNED_PDF_DETAIL = "Scanned PDFs are not supported. Please upload a text-based PDF."
 
 
 def validate_file(content: bytes, mime_type: str) -> None:
+    validate_upload(len(content), mime_type)
+
+
+def validate_upload(size_bytes: int, mime_type: str) -> None:
     settings = get_settings()
     max_bytes = settings.max_file_size_mb * 1024 * 1024
-    if len(content) > max_bytes:
+    if size_bytes > max_bytes:
         raise HTTPException(status_code=413, detail="File too large")
     if mime_type not in ALLOWED_MIME_TYPES:
         raise HTTPException(status_code=415, detail="Unsupported document type")
 
 
+def _raise_if_scanned(text_chars: int, content_len: int) -> float:
+    text_density = text_chars / content_len if content_len > 0 else 0.0
+    if text_density < get_settings().text_density_threshold:
+        raise HTTPException(status_code=400, detail=SCANNED_PDF_DETAIL)
+    return text_density
+
+
+def _sample_page_indexes(page_count: int, sample_size: int) -> list[int]:
+    if page_count <= sample_size:
+        return list(range(page_count))
+    if sample_size == 1:
+        return [0]
+    step = (page_count - 1) / (sample_size - 1)
+    return sorted({round(step * index) for index in range(sample_size)})
+
+
+def looks_scanned_pdf(content: bytes) -> bool:
+    # Cheap upload-time estimate of the worker's text density check: extract a
+    # few evenly spread pages and extrapolate their text to the whole file
+    # size. Files pypdf cannot open are left for the worker to report.
+    sample_size = get_settings().scanned_precheck_sample_pages
+    if sample_size <= 0 or not content:
+        return False
+    try:
+        reader = PdfReader(BytesIO(content))
+        page_count = len(reader.pages)
+        if page_count == 0:
+            return False
+        indexes = _sample_page_indexes(page_count, sample_size)
+        sample_chars = sum(
+            len((reader.pages[index].extract_text() or "").strip()) for index in indexes
+        )
+    except Exception:  # noqa: BLE001
+        return False
+    estimated_chars = sample_chars * page_count / len(indexes)
+    return estimated_chars / len(content) < get_settings().text_density_threshold
+
+
+def iter_pdf_pages(stream: BinaryIO) -> Iterator[dict]:
+    # Yields one page at a time so callers never hold more than the current
+    # page's text. pypdf reads the file lazily, so ``stream`` can be a file on
+    # disk rather than the whole upload in memory. The scanned-PDF check needs
+    # the total text length and therefore runs after the last page.
+    reader = PdfReader(stream)
+    text_chars = 0
+    for index, page in enumerate(reader.pages):
+        text = page.extract_text() or ""
+        text_chars += len(text.strip())
+        yield {"page_num": index + 1, "text": text}
+    stream.seek(0, 2)
+    _raise_if_scanned(text_chars, stream.tell())
+
+
 def extract_text_from_pdf(content: bytes) -> dict:
-    settings = get_settings()
     reader = PdfReader(BytesIO(content))
 
     pages = []
@@ -35,34 +94,84 @@ def extract_text_from_pdf(content: bytes) -> dict:
         texts.append(text)
 
     raw_text = "\n".join(texts)
-    content_len = len(content)
-    text_density = len(raw_text.strip()) / content_len if content_len > 0 else 0.0
-    is_scanned = text_density < settings.text_density_threshold
-    if is_scanned:
-        raise HTTPException(
-            status_code=400,
-            detail="Scanned PDFs are not supported. Please upload a text-based PDF.",
-        )
+    text_density = _raise_if_scanned(len(raw_text.strip()), len(content))
 
     return {
         "raw_text": raw_text,
         "pages": pages,
         "page_count": len(pages),
-        "is_scanned": is_scanned,
+        "is_scanned": False,
         "text_density": text_density,
     }
 
 
-def extract_text_from_docx(content: bytes) -> dict:
-    document = Document(BytesIO(content))
-    paragraphs = []
-    texts = []
-    for paragraph in document.paragraphs:
-        text = paragraph.text or ""
-        paragraphs.append({"text": text, "style": paragraph.style.name})
-        texts.append(text)
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_BODY = f"{_W}body"
+_DOCX_PARAGRAPH = f"{_W}p"
+_DOCX_TABLE_CELL = f"{_W}tc"
+_DOCX_STYLE = f"{_W}pPr/{_W}pStyle"
+_DOCX_VAL = f"{_W}val"
+_DOCX_TEXT_TAGS = {
+    f"{_W}t": None,
+    f"{_W}tab": "\t",
+    f"{_W}br": "\n",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
 
-    raw_text = "\n".join(texts)
+
+def _docx_paragraph_text(paragraph) -> str:
+    # Deleted runs hold w:delText and field codes w:instrText, so neither is
+    # picked up; inserted runs are read as accepted.
+    parts: list[str] = []
+    for element in paragraph.iter():
+        if element.tag not in _DOCX_TEXT_TAGS:
+            continue
+        replacement = _DOCX_TEXT_TAGS[element.tag]
+        parts.append(element.text or "" if replacement is None else replacement)
+    return "".join(parts)
+
+
+def iter_docx_blocks(stream: BinaryIO) -> Iterator[dict]:
+    # Iterparses word/document.xml straight from the archive and yields body
+    # paragraphs and table cells in document order. Finished top-level
+    # elements are dropped from the tree, so memory stays flat regardless of
+    # document size.
+    with zipfile.ZipFile(stream) as archive, archive.open("word/document.xml") as xml:
+        stack: list = []
+        cells: list[list[tuple[str, str | None]]] = []
+        for event, element in iterparse(xml, events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if element.tag == _DOCX_TABLE_CELL:
+                    cells.append([])
+                continue
+
+            stack.pop()
+            if element.tag == _DOCX_PARAGRAPH:
+                style = element.find(_DOCX_STYLE)
+                style_id = style.get(_DOCX_VAL) if style is not None else None
+                text = _docx_paragraph_text(element)
+                element.clear()
+                if cells:
+                    cells[-1].append((text, style_id))
+                else:
+                    yield {"text": text, "style_id": style_id, "kind": "paragraph"}
+            elif element.tag == _DOCX_TABLE_CELL:
+                cell = cells.pop()
+                yield {
+                    "text": "\n".join(text for text, _style in cell),
+                    "style_id": cell[0][1] if cell else None,
+                    "kind": "table_cell",
+                }
+                element.clear()
+            if stack and stack[-1].tag == _DOCX_BODY:
+                stack[-1].remove(element)
+
+
+def extract_text_from_docx(content: bytes) -> dict:
+    paragraphs = list(iter_docx_blocks(BytesIO(content)))
+    raw_text = "\n".join(paragraph["text"] for paragraph in paragraphs)
     return {
         "raw_text": raw_text,
         "paragraphs": paragraphs,
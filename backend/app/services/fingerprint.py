@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+
+# MinHash signature over the set of lowercased word tokens. The estimated
+# Jaccard similarity of two signatures is the share of equal positions.
+MINHASH_PERMUTATIONS = 64
+# LSH banding: signatures agreeing on all rows of any band become lookup
+# candidates. With 16 bands of 4 rows, pairs at Jaccard 0.8 are found with
+# probability 1 - (1 - 0.8 ** 4) ** 16 > 0.999.
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+def minhash_signature(text: str) -> list[int]:
+    # Tokens are a set, so whitespace, case and repeated words do not matter
+    # and a few changed words (party names, dates) change few positions.
+    hashes = [_token_hash(token) for token in set(_TOKEN_PATTERN.findall(text.lower()))]
+    if not hashes:
+        return [_PRIME] * MINHASH_PERMUTATIONS
+    return [
+        min((a * value + b) % _PRIME for value in hashes) for a, b in _PERMUTATIONS
+    ]
+
+
+def estimate_similarity(left: list[int], right: list[int]) -> float:
+    if len(left) != len(right) or not left:
+        return 0.0
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def lsh_bands(signature: list[int]) -> list[int]:
+    # One 31-bit value per band, tagged with the band index so equal rows in
+    # different bands do not collide.
+    bands: list[int] = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(
+            repr((band, rows)).encode("ascii"), digest_size=4
+        ).digest()
+        bands.append(int.from_bytes(digest, "big") >> 1)
+    return bands
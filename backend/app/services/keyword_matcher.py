@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Hashable, Mapping, Sequence
+
+
+class KeywordMatcher:
+    # Compiled once per keyword set. With pyahocorasick installed the keywords
+    # become a single Aho-Corasick automaton and a segment is matched in one
+    # linear pass; without it each distinct keyword is tested once with a
+    # substring search. Either way a keyword shared by several clause types is
+    # only looked up once, and the counts equal ``keyword in text`` per keyword.
+
+    def __init__(self, keywords_by_label: Mapping[Hashable, Sequence[str]]) -> None:
+        self.totals: dict[Hashable, int] = {}
+        self._labels_by_keyword: dict[str, list[Hashable]] = {}
+        for label, keywords in keywords_by_label.items():
+            if not keywords:
+                continue
+            self.totals[label] = len(keywords)
+            for keyword in keywords:
+                if keyword:
+                    self._labels_by_keyword.setdefault(keyword, []).append(label)
+        self._keywords = tuple(self._labels_by_keyword)
+        self._automaton = self._build_automaton(self._keywords)
+
+    @staticmethod
+    def _build_automaton(keywords: Sequence[str]):
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+        if not keywords:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    @property
+    def uses_automaton(self) -> bool:
+        return self._automaton is not None
+
+    def find_keywords(self, normalized_text: str) -> set[str]:
+        if self._automaton is not None:
+            return {keyword for _end, keyword in self._automaton.iter(normalized_text)}
+        return {keyword for keyword in self._keywords if keyword in normalized_text}
+
+    def count_hits(self, normalized_text: str) -> dict[Hashable, int]:
+        counts: dict[Hashable, int] = {}
+        for keyword in self.find_keywords(normalized_text):
+            for label in self._labels_by_keyword[keyword]:
+                counts[label] = counts.get(label, 0) + 1
+        return counts
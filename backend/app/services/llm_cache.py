@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, Protocol
+
+from app.config import get_settings
+from app.playbook.rules import get_playbook_version
+
+
+class LLMCacheBackend(Protocol):
+    def get(self, key: str) -> str | None:
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        ...
+
+
+class MemoryLLMCacheBackend:
+    def __init__(self, ttl_seconds: int, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisLLMCacheBackend:
+    _INDEX_KEY = "llm_cache:index"
+
+    def __init__(self, redis_url: str, ttl_seconds: int, max_entries: int) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(redis_url)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+    def get(self, key: str) -> str | None:
+        value = self._client.get(f"llm_cache:{key}")
+        if value is None:
+            return None
+        return value.decode("utf-8")
+
+    def set(self, key: str, value: str) -> None:
+        pipe = self._client.pipeline()
+        pipe.set(f"llm_cache:{key}", value, ex=self._ttl_seconds)
+        pipe.zadd(self._INDEX_KEY, {key: time.time()})
+        pipe.zremrangebyscore(self._INDEX_KEY, "-inf", time.time() - self._ttl_seconds)
+        pipe.zcard(self._INDEX_KEY)
+        size = pipe.execute()[-1]
+        overflow = size - self._max_entries
+        if overflow > 0:
+            evicted = self._client.zpopmin(self._INDEX_KEY, overflow)
+            if evicted:
+                self._client.delete(
+                    *[f"llm_cache:{member.decode('utf-8')}" for member, _score in evicted]
+                )
+
+
+class PostgresLLMCacheBackend:
+    _EVICT_EVERY = 100
+
+    def __init__(self, ttl_seconds: int, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        from sqlalchemy import select
+
+        from app.database import SessionLocal
+        from app.models.llm_cache_entry import LLMCacheEntry
+
+        with SessionLocal() as db:
+            return db.execute(
+                select(LLMCacheEntry.value).where(
+                    LLMCacheEntry.key == key,
+                    LLMCacheEntry.expires_at > datetime.now(timezone.utc),
+                )
+            ).scalar_one_or_none()
+
+    def set(self, key: str, value: str) -> None:
+        from sqlalchemy.dialects.postgresql import insert
+
+        from app.database import SessionLocal
+        from app.models.llm_cache_entry import LLMCacheEntry
+
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._ttl_seconds)
+        statement = insert(LLMCacheEntry).values(
+            key=key, value=value, expires_at=expires_at
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.key],
+            set_={"value": value, "expires_at": expires_at},
+        )
+        with SessionLocal() as db:
+            db.execute(statement)
+            with self._lock:
+                self._writes += 1
+                evict = self._writes % self._EVICT_EVERY == 0
+            if evict:
+                self._evict(db)
+            db.commit()
+
+    def _evict(self, db) -> None:
+        from sqlalchemy import delete, select
+
+        from app.models.llm_cache_entry import LLMCacheEntry
+
+        db.execute(
+            delete(LLMCacheEntry).where(
+                LLMCacheEntry.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        overflow = (
+            select(LLMCacheEntry.key)
+            .order_by(LLMCacheEntry.created_at.desc())
+            .offset(self._max_entries)
+            .scalar_subquery()
+        )
+        db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.key.in_(overflow)))
+
+
+class LLMResponseCache:
+    def __init__(self, backend: LLMCacheBackend | None) -> None:
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def get_or_call(
+        self,
+        namespace: str,
+        prompt: str,
+        call: Callable[[], str],
+        cacheable: Callable[[str], bool] | None = None,
+    ) -> str:
+        if self.backend is None:
+            return call()
+
+        key = build_cache_key(namespace, prompt)
+        try:
+            cached = self.backend.get(key)
+        except Exception:  # noqa: BLE001
+            self._incr("errors")
+            cached = None
+        if cached is not None:
+            self._incr("hits")
+            return cached
+
+        self._incr("misses")
+        value = call()
+        if value and (cacheable is None or cacheable(value)):
+            try:
+                self.backend.set(key, value)
+                self._incr("stores")
+            except Exception:  # noqa: BLE001
+                self._incr("errors")
+        return value
+
+
+def build_cache_key(namespace: str, prompt: str) -> str:
+    settings = get_settings()
+    material = json.dumps(
+        {
+            "namespace": namespace,
+            "model": settings.openai_model,
+            "temperature": settings.llm_temperature,
+            "playbook_version": get_playbook_version(),
+            "prompt": prompt,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _build_backend() -> LLMCacheBackend | None:
+    settings = get_settings()
+    backend = settings.llm_cache_backend.strip().lower()
+    ttl_seconds = settings.llm_cache_ttl_seconds
+    max_entries = settings.llm_cache_max_entries
+    if backend == "memory":
+        return MemoryLLMCacheBackend(ttl_seconds, max_entries)
+    if backend == "redis":
+        return RedisLLMCacheBackend(settings.redis_url, ttl_seconds, max_entries)
+    if backend == "postgres":
+        return PostgresLLMCacheBackend(ttl_seconds, max_entries)
+    if backend in {"", "none", "off"}:
+        return None
+    raise ValueError(f"Unknown LLM cache backend: {settings.llm_cache_backend}")
+
+
+@lru_cache
+def get_llm_cache() -> LLMResponseCache:
+    return LLMResponseCache(_build_backend())
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Protocol
+
+from app.config import get_settings
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBackend(Protocol):
+    def load(self, model: str) -> tuple[int, float | None]:
+        # (consecutive failures, time the circuit opened or None)
+        ...
+
+    def record_failure(self, model: str) -> int:
+        ...
+
+    def open(self, model: str, opened_at: float) -> None:
+        ...
+
+    def reset(self, model: str) -> None:
+        ...
+
+    def claim_probe(self, model: str, ttl_seconds: float) -> bool:
+        ...
+
+
+class MemoryCircuitBackend:
+    # Per-process state, for a single worker or tests.
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probe_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def load(self, model: str) -> tuple[int, float | None]:
+        with self._lock:
+            return self._failures.get(model, 0), self._opened_at.get(model)
+
+    def record_failure(self, model: str) -> int:
+        with self._lock:
+            self._failures[model] = self._failures.get(model, 0) + 1
+            return self._failures[model]
+
+    def open(self, model: str, opened_at: float) -> None:
+        with self._lock:
+            self._opened_at[model] = opened_at
+            self._probe_until.pop(model, None)
+
+    def reset(self, model: str) -> None:
+        with self._lock:
+            self._failures.pop(model, None)
+            self._opened_at.pop(model, None)
+            self._probe_until.pop(model, None)
+
+    def claim_probe(self, model: str, ttl_seconds: float) -> bool:
+        with self._lock:
+            now = self._clock()
+            if self._probe_until.get(model, 0.0) > now:
+                return False
+            self._probe_until[model] = now + ttl_seconds
+            return True
+
+
+class RedisCircuitBackend:
+    # State shared by every worker and visible to the API's health endpoint.
+    def __init__(self, redis_url: str) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(redis_url)
+
+    def load(self, model: str) -> tuple[int, float | None]:
+        failures, opened_at = self._client.hmget(
+            f"llm_circuit:{model}", "failures", "opened_at"
+        )
+        return (
+            int(failures) if failures is not None else 0,
+            float(opened_at) if opened_at is not None else None,
+        )
+
+    def record_failure(self, model: str) -> int:
+        return int(self._client.hincrby(f"llm_circuit:{model}", "failures", 1))
+
+    def open(self, model: str, opened_at: float) -> None:
+        pipe = self._client.pipeline()
+        pipe.hset(f"llm_circuit:{model}", "opened_at", opened_at)
+        pipe.delete(f"llm_circuit:{model}:probe")
+        pipe.execute()
+
+    def reset(self, model: str) -> None:
+        self._client.delete(f"llm_circuit:{model}", f"llm_circuit:{model}:probe")
+
+    def claim_probe(self, model: str, ttl_seconds: float) -> bool:
+        return bool(
+            self._client.set(
+                f"llm_circuit:{model}:probe",
+                1,
+                nx=True,
+                px=max(1, int(ttl_seconds * 1000)),
+            )
+        )
+
+
+class CircuitBreaker:
+    # Closed: calls go through and transient failures are counted. After
+    # LLM_CIRCUIT_FAILURE_THRESHOLD consecutive ones the circuit opens and
+    # calls fail fast for LLM_CIRCUIT_COOLDOWN_SECONDS. Half-open: one caller
+    # at a time may probe; a success closes the circuit, a failure reopens it.
+    def __init__(
+        self, backend: CircuitBackend | None, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.backend = backend
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {"rejected": 0, "opened": 0, "errors": 0}
+        # Models whose last seen state had failures or an open circuit; only
+        # these need a reset on success, so the common path costs one read.
+        self._dirty: set[str] = set()
+
+    def _mark_dirty(self, model: str, dirty: bool) -> None:
+        with self._lock:
+            if dirty:
+                self._dirty.add(model)
+            else:
+                self._dirty.discard(model)
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def allow(self, model: str) -> bool:
+        # An unreachable backend lets calls through rather than failing them.
+        if self.backend is None:
+            return True
+        cooldown = get_settings().llm_circuit_cooldown_seconds
+        try:
+            failures, opened_at = self.backend.load(model)
+            self._mark_dirty(model, bool(failures) or opened_at is not None)
+            if opened_at is None:
+                return True
+            if self._clock() >= opened_at + cooldown and self.backend.claim_probe(
+                model, cooldown
+            ):
+                return True
+        except Exception:  # noqa: BLE001
+            self._incr("errors")
+            return True
+        self._incr("rejected")
+        return False
+
+    def record_success(self, model: str) -> None:
+        if self.backend is None:
+            return
+        with self._lock:
+            if model not in self._dirty:
+                return
+        try:
+            self.backend.reset(model)
+            self._mark_dirty(model, False)
+        except Exception:  # noqa: BLE001
+            self._incr("errors")
+
+    def record_failure(self, model: str) -> None:
+        if self.backend is None:
+            return
+        self._mark_dirty(model, True)
+        try:
+            failures = self.backend.record_failure(model)
+            if failures >= get_settings().llm_circuit_failure_threshold:
+                self.backend.open(model, self._clock())
+                self._incr("opened")
+        except Exception:  # noqa: BLE001
+            self._incr("errors")
+
+    def state(self, model: str) -> dict:
+        if self.backend is None:
+            return {"state": "disabled"}
+        failures, opened_at = self.backend.load(model)
+        if opened_at is None:
+            return {"state": "closed", "consecutive_failures": failures}
+        retry_at = opened_at + get_settings().llm_circuit_cooldown_seconds
+        return {
+            "state": "open" if self._clock() < retry_at else "half_open",
+            "consecutive_failures": failures,
+            "opened_at": opened_at,
+            "retry_at": retry_at,
+        }
+
+
+def _build_backend() -> CircuitBackend | None:
+    settings = get_settings()
+    backend = settings.llm_circuit_backend.strip().lower()
+    if backend == "redis":
+        return RedisCircuitBackend(settings.redis_url)
+    if backend == "memory":
+        return MemoryCircuitBackend()
+    if backend in {"", "none", "off"}:
+        return None
+    raise ValueError(f"Unknown LLM circuit backend: {settings.llm_circuit_backend}")
+
+
+@lru_cache
+def get_circuit_breaker() -> CircuitBreaker:
+    return CircuitBreaker(_build_backend())
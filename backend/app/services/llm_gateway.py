@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
+from app.config import get_settings
+from app.services.llm_circuit import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from app.services.llm_rate_limit import (
+    LLMRateLimiter,
+    RateLimitWaitTimeout,
+    estimate_tokens,
+    get_rate_limiter,
+)
+from app.services.openai_retry import (
+    is_transient_openai_exception,
+    retry_with_backoff,
+)
+
+
+_usage: ContextVar[dict | None] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_llm_usage() -> Iterator[dict[str, dict[str, float]]]:
+    # Collects the gateway counters, by namespace, of calls made in the current
+    # thread or task while the block runs. Threads started from it share the
+    # counters when they run in a copy of its context.
+    usage: dict[str, dict[str, float]] = {}
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def _build_openai_client() -> Any:
+    settings = get_settings()
+    import httpx
+    from openai import OpenAI
+
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=settings.llm_pool_max_connections,
+            max_keepalive_connections=settings.llm_pool_max_keepalive,
+            keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            settings.llm_timeout_seconds,
+            connect=settings.llm_connect_timeout_seconds,
+        ),
+    )
+    # Retries are handled by the gateway, not a second time by the SDK.
+    return OpenAI(
+        api_key=settings.openai_api_key, http_client=http_client, max_retries=0
+    )
+
+
+class LLMGateway:
+    # One OpenAI client per process. Connections of a client inherited
+    # through fork are shared with the parent, so a child builds its own.
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] = _build_openai_client,
+        sleep_fn: Callable[[float], None] = time.sleep,
+        rate_limiter: LLMRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self._client_factory = client_factory
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._sleep_fn = sleep_fn
+        self._client: Any = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, float]] = {}
+        # (model, base_url) -> (working API surface, monotonic probe time)
+        self._surfaces: dict[tuple[str, str], tuple[str, float]] = {}
+
+    def client(self) -> Any:
+        pid = os.getpid()
+        with self._lock:
+            if self._client is None or self._pid != pid:
+                self._client = self._client_factory()
+                self._pid = pid
+            return self._client
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client, self._pid = self._client, None, None
+        if client is not None:
+            client.close()
+
+    def _known_surface(self, key: tuple[str, str]) -> str | None:
+        # Surfaces are re-probed after LLM_SURFACE_REPROBE_SECONDS so an
+        # endpoint that gains the Responses API is picked up again.
+        with self._lock:
+            entry = self._surfaces.get(key)
+        if entry is None:
+            return None
+        surface, probed_at = entry
+        if time.monotonic() - probed_at >= get_settings().llm_surface_reprobe_seconds:
+            return None
+        return surface
+
+    def _remember_surface(self, key: tuple[str, str], surface: str) -> None:
+        with self._lock:
+            self._surfaces[key] = (surface, time.monotonic())
+
+    def _forget_surface(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            self._surfaces.pop(key, None)
+
+    def surfaces(self) -> dict[str, str]:
+        with self._lock:
+            return {
+                f"{model}@{endpoint}": surface
+                for (model, endpoint), (surface, _probed_at) in self._surfaces.items()
+            }
+
+    def _record(self, namespace: str, **deltas: float) -> None:
+        usage = _usage.get()
+        with self._lock:
+            for counters in (self._stats, usage):
+                if counters is None:
+                    continue
+                stats = counters.setdefault(
+                    namespace,
+                    {
+                        "requests": 0,
+                        "failures": 0,
+                        "retries": 0,
+                        "latency_seconds": 0.0,
+                        "rate_limit_wait_seconds": 0.0,
+                    },
+                )
+                for name, delta in deltas.items():
+                    stats[name] += delta
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {namespace: dict(stats) for namespace, stats in self._stats.items()}
+
+    def complete(self, namespace: str, prompt: str) -> str:
+        settings = get_settings()
+        client = self.client()
+        surface_key = (settings.openai_model, str(getattr(client, "base_url", "")))
+        rate_limiter = self._rate_limiter or get_rate_limiter()
+        breaker = self._circuit_breaker or get_circuit_breaker()
+        tokens = estimate_tokens(prompt)
+
+        def _responses() -> str:
+            response = client.responses.create(
+                model=settings.openai_model,
+                input=prompt,
+                temperature=settings.llm_temperature,
+            )
+            if not hasattr(response, "output_text"):
+                raise RuntimeError("Empty LLM response")
+            return response.output_text
+
+        def _chat() -> str:
+            response = client.chat.completions.create(
+                model=settings.openai_model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=settings.llm_temperature,
+            )
+            return response.choices[0].message.content or ""
+
+        def _send() -> str:
+            surface = self._known_surface(surface_key)
+            if surface == "chat":
+                return _chat()
+            # Probe: the Responses API first, Chat Completions if it is
+            # rejected. Only a definite rejection marks the endpoint as
+            # chat-only; a transient error says nothing about the surface.
+            # An endpoint remembered as "responses" that starts rejecting it
+            # is forgotten and probed again within the same call.
+            try:
+                text = _responses()
+            except Exception as exc:
+                transient = is_transient_openai_exception(exc)
+                if surface == "responses":
+                    if transient:
+                        raise
+                    self._forget_surface(surface_key)
+                text = _chat()
+                if not transient:
+                    self._remember_surface(surface_key, "chat")
+                return text
+            if surface is None:
+                self._remember_surface(surface_key, "responses")
+            return text
+
+        def _call() -> str:
+            # An open circuit fails the attempt before it is sent; the error is
+            # not transient, so retries stop and callers use their fallback.
+            if not breaker.allow(settings.openai_model):
+                raise CircuitOpenError(
+                    f"LLM circuit open for {settings.openai_model}"
+                )
+            # Every attempt, retries included, waits for the model's
+            # cluster-wide request and token budget first. Time spent before
+            # giving up on the budget is counted too.
+            waited = 0.0
+            try:
+                waited = rate_limiter.acquire(settings.openai_model, tokens)
+            except RateLimitWaitTimeout as exc:
+                waited = exc.waited
+                raise
+            finally:
+                if waited:
+                    self._record(namespace, rate_limit_wait_seconds=waited)
+            try:
+                text = _send()
+            except Exception as exc:
+                if is_transient_openai_exception(exc):
+                    breaker.record_failure(settings.openai_model)
+                raise
+            breaker.record_success(settings.openai_model)
+            return text
+
+        def _sleep(delay: float) -> None:
+            self._record(namespace, retries=1)
+            self._sleep_fn(delay)
+
+        started = time.monotonic()
+        try:
+            return retry_with_backoff(
+                _call, deadline=settings.llm_retry_deadline_seconds, sleep_fn=_sleep
+            )
+        except Exception:
+            self._record(namespace, failures=1)
+            raise
+        finally:
+            self._record(
+                namespace, requests=1, latency_seconds=time.monotonic() - started
+            )
+
+
+@lru_cache
+def get_llm_gateway() -> LLMGateway:
+    return LLMGateway()
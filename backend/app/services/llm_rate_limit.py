@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Protocol
+
+from app.config import get_settings
+
+# Completion tokens are not known before the call, so every request reserves
+# this many on top of the prompt estimate.
+COMPLETION_TOKEN_ALLOWANCE = 512
+
+
+class RateLimitWaitTimeout(Exception):
+    def __init__(self, message: str, waited: float = 0.0) -> None:
+        super().__init__(message)
+        self.waited = waited
+
+
+class RateLimitBackend(Protocol):
+    def reserve(self, model: str, rpm: int, tpm: int, tokens: int) -> float:
+        # Takes one request and ``tokens`` tokens from the model's buckets if
+        # both have enough, returning 0; otherwise takes nothing and returns
+        # the seconds until they will.
+        ...
+
+
+class MemoryRateLimitBackend:
+    # Per-process buckets, for a single worker or tests.
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[tuple[str, str], tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, model: str, rpm: int, tpm: int, tokens: int) -> float:
+        with self._lock:
+            now = self._clock()
+            wait = 0.0
+            levels: dict[str, tuple[float, float]] = {}
+            for name, limit, cost in (("requests", rpm, 1), ("tokens", tpm, tokens)):
+                if limit <= 0:
+                    continue
+                cost = min(cost, limit)
+                level, updated = self._buckets.get((model, name), (limit, now))
+                level = min(limit, level + (now - updated) * limit / 60)
+                levels[name] = (level, cost)
+                if level < cost:
+                    wait = max(wait, (cost - level) * 60 / limit)
+            if wait == 0:
+                for name, (level, cost) in levels.items():
+                    self._buckets[(model, name)] = (level - cost, now)
+            return wait
+
+
+_RESERVE_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local limits = {tonumber(ARGV[1]), tonumber(ARGV[2])}
+local costs = {1, tonumber(ARGV[3])}
+local levels = {}
+local wait_ms = 0
+for i = 1, 2 do
+  if limits[i] > 0 then
+    costs[i] = math.min(costs[i], limits[i])
+    local state = redis.call('HMGET', KEYS[i], 'level', 'updated')
+    local level = tonumber(state[1]) or limits[i]
+    local updated = tonumber(state[2]) or now_ms
+    level = math.min(limits[i], level + (now_ms - updated) * limits[i] / 60000)
+    levels[i] = level
+    if level < costs[i] then
+      wait_ms = math.max(wait_ms, math.ceil((costs[i] - level) * 60000 / limits[i]))
+    end
+  end
+end
+if wait_ms == 0 then
+  for i = 1, 2 do
+    if limits[i] > 0 then
+      redis.call('HSET', KEYS[i], 'level', levels[i] - costs[i], 'updated', now_ms)
+      redis.call('PEXPIRE', KEYS[i], 120000)
+    end
+  end
+end
+return wait_ms
+"""
+
+
+class RedisRateLimitBackend:
+    # Buckets shared by every worker. The refill and the reservation of both
+    # buckets run as one script, timed by the Redis clock.
+    def __init__(self, redis_url: str) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(redis_url)
+        self._reserve = self._client.register_script(_RESERVE_SCRIPT)
+
+    def reserve(self, model: str, rpm: int, tpm: int, tokens: int) -> float:
+        # The hash tag keeps both buckets of a model on one cluster slot.
+        keys = [f"llm_rate:{{{model}}}:requests", f"llm_rate:{{{model}}}:tokens"]
+        return int(self._reserve(keys=keys, args=[rpm, tpm, tokens])) / 1000
+
+
+class LLMRateLimiter:
+    def __init__(
+        self,
+        backend: RateLimitBackend | None,
+        sleep_fn: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.backend = backend
+        self._sleep_fn = sleep_fn
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {
+            "acquired": 0,
+            "waited": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "errors": 0,
+        }
+
+    def _incr(self, name: str, delta: float = 1) -> None:
+        with self._lock:
+            self._stats[name] += delta
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._stats)
+
+    def acquire(self, model: str, tokens: int) -> float:
+        # Blocks until the model's budget allows the request and returns the
+        # seconds spent waiting. If the limiter backend is unreachable the
+        # request goes ahead rather than failing the review.
+        rpm, tpm = limits_for_model(model)
+        if self.backend is None or (rpm <= 0 and tpm <= 0):
+            return 0.0
+        max_wait = get_settings().llm_rate_limit_max_wait_seconds
+        started: float | None = None
+        while True:
+            try:
+                wait = self.backend.reserve(model, rpm, tpm, tokens)
+            except Exception:  # noqa: BLE001
+                self._incr("errors")
+                wait = 0.0
+            if started is None:
+                started = self._clock()
+                waited = 0.0
+            else:
+                waited = self._clock() - started
+            if wait <= 0:
+                self._incr("acquired")
+                if waited > 0:
+                    self._incr("waited")
+                    self._incr("wait_seconds", waited)
+                return waited
+            if waited + wait > max_wait:
+                self._incr("timeouts")
+                self._incr("wait_seconds", waited)
+                raise RateLimitWaitTimeout(
+                    f"No LLM budget for {model} within {max_wait}s", waited
+                )
+            self._sleep_fn(wait)
+
+
+def limits_for_model(model: str) -> tuple[int, int]:
+    settings = get_settings()
+    limits = settings.llm_rate_limits.get(model, {})
+    return (
+        int(limits.get("rpm", settings.llm_rpm_limit)),
+        int(limits.get("tpm", settings.llm_tpm_limit)),
+    )
+
+
+def estimate_tokens(prompt: str) -> int:
+    # About four characters per token for English text.
+    return math.ceil(len(prompt) / 4) + COMPLETION_TOKEN_ALLOWANCE
+
+
+def _build_backend() -> RateLimitBackend | None:
+    settings = get_settings()
+    backend = settings.llm_rate_limit_backend.strip().lower()
+    if backend == "redis":
+        return RedisRateLimitBackend(settings.redis_url)
+    if backend == "memory":
+        return MemoryRateLimitBackend()
+    if backend in {"", "none", "off"}:
+        return None
+    raise ValueError(
+        f"Unknown LLM rate limit backend: {settings.llm_rate_limit_backend}"
+    )
+
+
+@lru_cache
+def get_rate_limiter() -> LLMRateLimiter:
+    return LLMRateLimiter(_build_backend())
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import random
+import re
 import time
-from typing import Callable, TypeVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, TypeVar
 
 T = TypeVar("T")
 
+# Without a deadline, a server hint is waited for at most this many seconds.
+MAX_HINT_DELAY = 60.0
+
 
 class TransientOpenAIError(Exception):
     pass
@@ -42,22 +49,153 @@ def is_transient_openai_exception(exc: Exception) -> bool:
     return False
 
 
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _response_headers(exc: BaseException) -> dict[str, str]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        cause = getattr(exc, "__cause__", None)
+        return _response_headers(cause) if isinstance(cause, Exception) else {}
+    return {str(name).lower(): str(value) for name, value in headers.items()}
+
+
+def _parse_duration(value: str) -> float | None:
+    # x-ratelimit-reset-* values look like "20ms", "1s" or "6m0.5s".
+    parts = _DURATION_PATTERN.findall(value.strip())
+    if not parts or "".join(number + unit for number, unit in parts) != value.strip():
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    # Seconds, or an HTTP date.
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_hint(exc: BaseException) -> float | None:
+    # Seconds the server asked us to wait: retry-after-ms or Retry-After,
+    # otherwise the reset time of the exhausted rate-limit bucket(s).
+    headers = _response_headers(exc)
+    if "retry-after-ms" in headers:
+        try:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        except ValueError:
+            pass
+    if "retry-after" in headers:
+        hint = _parse_retry_after(headers["retry-after"])
+        if hint is not None:
+            return hint
+    resets = []
+    for bucket in ("requests", "tokens"):
+        reset = headers.get(f"x-ratelimit-reset-{bucket}")
+        remaining = headers.get(f"x-ratelimit-remaining-{bucket}")
+        if reset is None or remaining not in {None, "0"}:
+            continue
+        seconds = _parse_duration(reset)
+        if seconds is not None:
+            resets.append(seconds)
+    return max(resets) if resets else None
+
+
+def _next_delay(
+    exc: Exception,
+    attempt: int,
+    *,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    remaining: float | None,
+) -> float | None:
+    # None means give up and re-raise. A server hint replaces the
+    # exponential schedule and may exceed max_delay, up to the deadline or,
+    # without one, MAX_HINT_DELAY; either way the next attempt must start
+    # before the deadline.
+    if not is_transient_openai_exception(exc) or attempt >= max_retries:
+        return None
+    hint = retry_after_hint(exc)
+    if hint is not None:
+        if remaining is None:
+            hint = min(hint, MAX_HINT_DELAY)
+        delay = hint + random.uniform(0, 0.2)
+    else:
+        delay = min(max_delay, base_delay * (2**attempt) + random.uniform(0, 0.2))
+    if remaining is not None and delay >= remaining:
+        return None
+    return delay
+
+
 def retry_with_backoff(
     fn: Callable[[], T],
     *,
     max_retries: int = 2,
     base_delay: float = 0.5,
     max_delay: float = 4.0,
+    deadline: float | None = None,
     sleep_fn: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
 ) -> T:
+    # No retry is started later than ``deadline`` seconds after the first
+    # attempt: a sleep that would end past it re-raises instead. An attempt
+    # already running is only bounded by the client's own timeout, so the
+    # total can exceed the deadline by up to one request timeout.
+    started = clock()
     attempt = 0
     while True:
         try:
             return fn()
         except Exception as exc:  # noqa: BLE001
-            if not is_transient_openai_exception(exc) or attempt >= max_retries:
+            delay = _next_delay(
+                exc,
+                attempt,
+                max_retries=max_retries,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                remaining=None if deadline is None else deadline - (clock() - started),
+            )
+            if delay is None:
                 raise
-            jitter = random.uniform(0, 0.2)
-            delay = min(max_delay, base_delay * (2**attempt) + jitter)
             sleep_fn(delay)
             attempt += 1
+
+
+async def async_retry_with_backoff(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    max_retries: int = 2,
+    base_delay: float = 0.5,
+    max_delay: float = 4.0,
+    deadline: float | None = None,
+    sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> T:
+    started = clock()
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except Exception as exc:  # noqa: BLE001
+            delay = _next_delay(
+                exc,
+                attempt,
+                max_retries=max_retries,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                remaining=None if deadline is None else deadline - (clock() - started),
+            )
+            if delay is None:
+                raise
+            await sleep_fn(delay)
+            attempt += 1
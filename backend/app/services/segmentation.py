@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import hashlib
 import re
+from bisect import bisect_right
+from typing import Iterable, Iterator
 
 
 HEADING_PATTERNS = [
@@ -11,75 +13,173 @@ HEADING_PATTERNS = [
     re.compile(r"^\s*([A-Z][A-Z\s]{3,})$"),
 ]
 
+# HEADING_PATTERNS as one alternation, tried in the same order. Every branch
+# starts with a non-space character, so sharing the leading ``\s*`` does not
+# change which branch wins.
+HEADING_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?P<number>\d+\.)\s+(?P<number_heading>[A-Z][^\n]+)"
+    r"|(?P<subsection>\d+\.\d+)\s+(?P<subsection_heading>[A-Z][^\n]+)"
+    r"|\((?P<letter>[a-z])\)\s+(?P<letter_heading>[^\n]+)"
+    r"|(?P<caps>[A-Z][A-Z\s]{3,})$"
+    r")"
+)
+
 
 def _hash_text(text: str) -> str:
     return hashlib.md5(text.encode("utf-8")).hexdigest()
 
 
-def _find_page(text: str, pages: list[dict] | None) -> tuple[int | None, int | None]:
+def _page_offsets(text: str, pages: list[dict] | None) -> list[int] | None:
+    # Start offset of every page inside ``text``, which the extractor builds
+    # as ``"\n".join(page texts)``. Anything else cannot be mapped to pages.
     if not pages:
-        return None, None
-    snippet = text.strip()[:40]
-    if not snippet:
-        return None, None
+        return None
+    offsets: list[int] = []
+    offset = 0
     for page in pages:
-        page_text = page.get("text") or ""
-        if snippet in page_text:
-            page_num = page.get("page_num")
-            return page_num, page_num
-    return None, None
+        offsets.append(offset)
+        offset += len(page.get("text") or "") + 1
+    if offset - 1 != len(text):
+        return None
+    return offsets
+
+
+def _page_at(
+    offsets: list[int] | None, pages: list[dict] | None, offset: int | None
+) -> int | None:
+    if offsets is None or offset is None:
+        return None
+    return pages[bisect_right(offsets, offset) - 1].get("page_num")
 
 
 def _match_heading(line: str) -> tuple[str | None, str | None]:
-    for index, pattern in enumerate(HEADING_PATTERNS):
-        match = pattern.match(line)
-        if not match:
-            continue
-        if index == 3:
-            heading = match.group(1).strip()
-            return heading, None
-        section_number = match.group(1).strip()
-        heading = match.group(2).strip()
-        return heading, section_number
-    return None, None
+    match = HEADING_PATTERN.match(line)
+    if match is None:
+        return None, None
+    # The heading group closes last in every branch, so ``lastgroup`` names
+    # the branch that matched.
+    name = match.lastgroup
+    if name == "caps":
+        return match["caps"].strip(), None
+    return match[name].strip(), match[name.removesuffix("_heading")].strip()
 
 
-def segment_document(text: str, pages: list[dict] | None = None) -> list[dict]:
-    segments: list[dict] = []
+def _iter_blocks(
+    lines: Iterable[tuple[str, int | None]],
+) -> Iterator[tuple[str | None, str | None, str, int | None, int | None]]:
+    # Groups (line, position) pairs into (heading, section_number, text,
+    # first_position, last_position) blocks, emitting each block as soon as
+    # the next heading closes it. The position is a page number or a character
+    # offset, taken from the first and last non-blank line of the block.
     current_lines: list[str] = []
     current_heading: str | None = None
     current_section: str | None = None
+    first_position: int | None = None
+    last_position: int | None = None
 
-    def flush_segment() -> None:
-        nonlocal current_lines, current_heading, current_section
-        if not current_lines:
-            return
-        segment_text = "\n".join(current_lines).strip()
-        if not segment_text:
-            current_lines = []
-            return
-        page_start, page_end = _find_page(segment_text, pages)
-        segments.append(
-            {
-                "segment_index": len(segments),
-                "heading": current_heading,
-                "section_number": current_section,
-                "text": segment_text,
-                "hash": _hash_text(segment_text),
-                "page_start": page_start,
-                "page_end": page_end,
-            }
-        )
-        current_lines = []
-
-    for raw_line in text.splitlines():
+    for raw_line, position in lines:
         line = raw_line.rstrip()
         heading, section_number = _match_heading(line)
         if heading is not None or section_number is not None:
-            flush_segment()
+            segment_text = "\n".join(current_lines).strip()
+            if segment_text:
+                yield (
+                    current_heading,
+                    current_section,
+                    segment_text,
+                    first_position,
+                    last_position,
+                )
+            current_lines = []
+            first_position = last_position = None
             current_heading = heading
             current_section = section_number
         current_lines.append(line)
+        if line.strip():
+            if first_position is None:
+                first_position = position
+            last_position = position
+
+    segment_text = "\n".join(current_lines).strip()
+    if segment_text:
+        yield (
+            current_heading,
+            current_section,
+            segment_text,
+            first_position,
+            last_position,
+        )
 
-    flush_segment()
+
+def _build_segment(
+    segment_index: int,
+    heading: str | None,
+    section_number: str | None,
+    text: str,
+    page_start: int | None,
+    page_end: int | None,
+) -> dict:
+    return {
+        "segment_index": segment_index,
+        "heading": heading,
+        "section_number": section_number,
+        "text": text,
+        "hash": _hash_text(text),
+        "page_start": page_start,
+        "page_end": page_end,
+    }
+
+
+def _iter_line_offsets(text: str) -> Iterator[tuple[str, int]]:
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        yield line, offset
+        offset += len(line)
+
+
+def segment_document(text: str, pages: list[dict] | None = None) -> list[dict]:
+    # Lines carry their offset into ``text``; a segment's first and last
+    # non-blank line offsets are mapped to pages with a binary search over the
+    # page start offsets.
+    offsets = _page_offsets(text, pages)
+    segments: list[dict] = []
+    for heading, section_number, segment_text, first, last in _iter_blocks(
+        _iter_line_offsets(text)
+    ):
+        segments.append(
+            _build_segment(
+                len(segments),
+                heading,
+                section_number,
+                segment_text,
+                _page_at(offsets, pages, first),
+                _page_at(offsets, pages, last),
+            )
+        )
     return segments
+
+
+def _iter_page_lines(pages: Iterable[dict]) -> Iterator[tuple[str, int | None]]:
+    # Splits pages exactly like ``"\n".join(page texts).splitlines()`` would,
+    # holding back one page to know whether a separator follows it.
+    previous: dict | None = None
+    for page in pages:
+        if previous is not None:
+            for line in ((previous.get("text") or "") + "\n").splitlines():
+                yield line, previous.get("page_num")
+        previous = page
+    if previous is not None:
+        for line in (previous.get("text") or "").splitlines():
+            yield line, previous.get("page_num")
+
+
+def segment_pages(pages: Iterable[dict]) -> Iterator[dict]:
+    # Incremental counterpart of ``segment_document``: consumes pages lazily
+    # and yields each segment once it is complete. Output matches
+    # ``segment_document`` on the joined page texts.
+    blocks = _iter_blocks(_iter_page_lines(pages))
+    for index, (heading, section_number, text, first_page, last_page) in enumerate(
+        blocks
+    ):
+        yield _build_segment(index, heading, section_number, text, first_page, last_page)
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.domain.status_flow import assert_transition
 from app.models.review import Review, ReviewStatus
+from app.services.extraction import SCANNED_PDF_DETAIL, looks_scanned_pdf
 from app.storage.base import StorageClient
 from app.storage.minio import get_storage_client
 
@@ -21,6 +22,10 @@ class UnsupportedFileType(ValueError):
     pass
 
 
+class ScannedDocument(ValueError):
+    pass
+
+
 def _sanitize_filename(filename: str) -> str:
     if not filename:
         return "file"
@@ -41,6 +46,8 @@ def upload_review_document(
         raise UnsupportedFileType(f"Unsupported content type: {content_type}")
 
     assert_transition(review.status, ReviewStatus.UPLOADED)
+    if content_type == "application/pdf" and looks_scanned_pdf(data):
+        raise ScannedDocument(SCANNED_PDF_DETAIL)
 
     storage_client = storage_client or get_storage_client()
     size_bytes = len(data)
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 
 class StorageClient(Protocol):
@@ -7,3 +7,6 @@ class StorageClient(Protocol):
 
     def get_bytes(self, key: str) -> bytes:
         ...
+
+    def download_to(self, key: str, fileobj: BinaryIO) -> None:
+        ...
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import BinaryIO
 
 import boto3
 from botocore.exceptions import ClientError
@@ -46,6 +47,9 @@ class MinioStorageClient(StorageClient):
         finally:
             body.close()
 
+    def download_to(self, key: str, fileobj: BinaryIO) -> None:
+        self._client.download_fileobj(self._bucket, key, fileobj)
+
 
 @lru_cache
 def get_storage_client() -> StorageClient:
@@ -1,5 +1,18 @@
+from celery import chain, chord
+
 from app.celery_app import celery_app
-from app.workers.tasks import process_review
+from app.config import get_settings
+from app.models.clause_type import ClauseType
+from app.workers.tasks import (
+    classify_stage,
+    evaluate_clause_stage,
+    extract_stage,
+    prepare_staged_review,
+    process_review,
+    run_review_stage,
+    segment_stage,
+    summarize_stage,
+)
 
 
 @celery_app.task(
@@ -8,8 +21,80 @@ from app.workers.tasks import process_review
     max_retries=3,
     default_retry_delay=10,
 )
-def process_review_task(self, review_id: str):
+def process_review_task(self, review_id: str, force: bool = False):
+    # Retries resume from the last completed stage, so ``force`` only applies
+    # to the first attempt.
+    force = force and self.request.retries == 0
+    if get_settings().pipeline_mode == "staged":
+        if prepare_staged_review(review_id, force=force):
+            return self.replace(build_review_workflow(review_id, force=force))
+        return None
     try:
-        return process_review(review_id)
+        return process_review(
+            review_id, force=force, final_attempt=_is_final_attempt(self)
+        )
     except Exception as exc:
         raise self.retry(exc=exc)
+
+
+def _is_final_attempt(task) -> bool:
+    return task.request.retries >= task.max_retries
+
+
+def _run_stage_task(task, review_id: str, stage) -> None:
+    try:
+        run_review_stage(review_id, stage, final_attempt=_is_final_attempt(task))
+    except Exception as exc:
+        if _is_final_attempt(task):
+            raise
+        raise task.retry(exc=exc)
+
+
+_STAGE_TASK_OPTIONS = {"bind": True, "max_retries": 3, "default_retry_delay": 10}
+
+
+@celery_app.task(name="reviews.extract_document", **_STAGE_TASK_OPTIONS)
+def extract_document_task(self, review_id: str) -> None:
+    _run_stage_task(self, review_id, extract_stage)
+
+
+@celery_app.task(name="reviews.segment_document", **_STAGE_TASK_OPTIONS)
+def segment_document_task(self, review_id: str) -> None:
+    _run_stage_task(self, review_id, segment_stage)
+
+
+@celery_app.task(name="reviews.classify_segments", **_STAGE_TASK_OPTIONS)
+def classify_segments_task(self, review_id: str) -> None:
+    _run_stage_task(self, review_id, classify_stage)
+
+
+@celery_app.task(name="reviews.evaluate_clause", **_STAGE_TASK_OPTIONS)
+def evaluate_clause_task(
+    self, review_id: str, clause_type: str, force: bool = False
+) -> None:
+    # ``force`` re-runs the evaluator instead of taking the clause library entry.
+    _run_stage_task(
+        self,
+        review_id,
+        evaluate_clause_stage(ClauseType(clause_type), use_library=not force),
+    )
+
+
+@celery_app.task(name="reviews.summarize_review", **_STAGE_TASK_OPTIONS)
+def summarize_review_task(self, review_id: str) -> None:
+    _run_stage_task(self, review_id, summarize_stage)
+
+
+def build_review_workflow(review_id: str, force: bool = False):
+    return chain(
+        extract_document_task.si(review_id),
+        segment_document_task.si(review_id),
+        classify_segments_task.si(review_id),
+        chord(
+            [
+                evaluate_clause_task.si(review_id, clause_type.value, force)
+                for clause_type in ClauseType
+            ],
+            summarize_review_task.si(review_id),
+        ),
+    )
@@ -1,30 +1,170 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+from collections import Counter
+from contextlib import nullcontext
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Iterable, Iterator
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased
 
-from app.database import SessionLocal
+from app.config import get_settings
+from app.database import SessionLocal, count_round_trips
 from app.domain.errors import InvalidStatusTransition
 from app.domain.status_flow import assert_transition
 from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_library_entry import ClauseLibraryEntry
 from app.models.clause_type import ClauseType
 from app.models.classification import SegmentClassification
 from app.models.review import Review, ReviewStatus
 from app.models.risk_label import RiskLabel
 from app.models.segment import ReviewSegment
-from app.playbook.rules import get_rules_for_clause_type
+from app.models.stage_checkpoint import ReviewStageCheckpoint
+from app.playbook.rules import (
+    get_compiled_playbook,
+    get_playbook_version,
+    get_rules_for_clause_type,
+)
 from app.services.evidence import validate_evidence_spans
 from app.services.evaluation import evaluate_clause, evaluate_missing_clause
-from app.services.extraction import extract_document
+from app.services.extraction import (
+    extract_document,
+    iter_docx_blocks,
+    iter_pdf_pages,
+    validate_upload,
+)
 from app.services.summary import build_executive_summary
 from app.services.classification import classify_segment
-from app.services.segmentation import segment_document
+from app.services.clause_library import (
+    clause_library_key,
+    evaluator_hash,
+    find_near_duplicate_entries,
+    library_entry_result,
+    lookup_library_entries,
+    mark_library_entries_used,
+    store_library_entries,
+)
+from app.services.classification_cache import (
+    classifier_config,
+    classifier_config_hash,
+    lookup_cached_classifications,
+    store_cached_classifications,
+)
+from app.services.fingerprint import minhash_signature
+from app.services.llm_gateway import track_llm_usage
+from app.services.segmentation import segment_document, segment_pages
 from app.storage.minio import get_storage_client
 
+logger = logging.getLogger(__name__)
 
-def process_review(review_id: UUID | str) -> None:
+STAGE_SEGMENTS = "segments"
+STAGE_CLASSIFICATIONS = "classifications"
+STAGE_ORDER = (STAGE_SEGMENTS, STAGE_CLASSIFICATIONS)
+SEGMENT_BATCH_SIZE = 500
+
+
+def process_review(
+    review_id: UUID | str, force: bool = False, final_attempt: bool = True
+) -> None:
+    # Nothing else writes this review while the job runs, so objects are kept
+    # loaded across commits instead of being re-selected.
+    db: Session = SessionLocal(expire_on_commit=False)
+    review: Review | None = None
+    if not isinstance(review_id, UUID):
+        review_id = UUID(str(review_id))
+    round_trips = (
+        count_round_trips() if get_settings().db_round_trip_metrics else nullcontext()
+    )
+    try:
+        with round_trips as counts, track_llm_usage() as llm_usage:
+            review = db.get(Review, review_id)
+            if review is None:
+                return
+            if not review.doc_storage_key or not review.doc_mime:
+                raise ValueError("Review has no document to process")
+
+            if force:
+                _reset_checkpoints(db, review)
+            source = None if force else _find_reusable_review(db, review)
+            if source is not None:
+                _copy_review_artifacts(db, source, review)
+            else:
+                _run_pipeline(db, review, use_library=not force)
+            if llm_usage:
+                _record_metric(review, "llm", _llm_usage_metric(llm_usage))
+            # Counted up to the final commit, which also stores the metric.
+            if counts is not None:
+                _record_metric(review, "db_round_trips", dict(counts))
+            _finalize_review(db, review)
+    except Exception as exc:
+        if review is not None:
+            _record_failure(db, review, exc, final_attempt)
+        if not final_attempt:
+            raise
+    finally:
+        db.close()
+
+
+def _record_failure(
+    db: Session, review: Review, exc: Exception, final_attempt: bool
+) -> None:
+    # Non-final attempts keep the review PROCESSING so the retry can resume
+    # from the last completed stage.
+    if final_attempt:
+        _mark_failed(db, review, exc)
+        return
+    db.rollback()
+    review.error_message = str(exc)
+    db.add(review)
+    db.commit()
+
+
+def _mark_failed(db: Session, review: Review, exc: Exception) -> None:
+    db.rollback()
+    try:
+        assert_transition(review.status, ReviewStatus.FAILED)
+        review.status = ReviewStatus.FAILED
+    except InvalidStatusTransition:
+        pass
+    review.error_message = str(exc)
+    db.add(review)
+    db.commit()
+
+
+def _run_pipeline(db: Session, review: Review, use_library: bool = True) -> None:
+    # Freshly stored segments are handed to classification instead of being
+    # re-selected, and the evaluations are committed together with the
+    # summary by _finalize_review.
+    review.reused_from_review_id = None
+    segments = None
+    if not _checkpoint_matches(db, review, STAGE_SEGMENTS, _segments_input_hash(review)):
+        segments = _store_segments(
+            db,
+            review,
+            _iter_review_segments(review),
+            keep=get_settings().extraction_mode != "streaming",
+        )
+    if segments is not None or not _checkpoint_matches(
+        db, review, STAGE_CLASSIFICATIONS, _classifications_input_hash(db, review)
+    ):
+        _classify_segments(db, review, segments)
+    _evaluate_review(
+        db, review, list(ClauseType), use_library=use_library, commit=False
+    )
+
+
+def prepare_staged_review(review_id: UUID | str, force: bool = False) -> bool:
+    # Runs before the staged workflow is dispatched. Returns False when there is
+    # nothing left to do: the review is gone, already failed, or was completed
+    # from an identical earlier review.
     db: Session = SessionLocal()
     review: Review | None = None
     if not isinstance(review_id, UUID):
@@ -32,44 +172,285 @@ def process_review(review_id: UUID | str) -> None:
     try:
         review = db.get(Review, review_id)
         if review is None:
-            return
+            return False
         if not review.doc_storage_key or not review.doc_mime:
             raise ValueError("Review has no document to process")
+        if force:
+            _reset_checkpoints(db, review)
+        source = None if force else _find_reusable_review(db, review)
+        if source is None:
+            review.reused_from_review_id = None
+            db.add(review)
+            db.commit()
+            return True
+        _copy_review_artifacts(db, source, review)
+        _finalize_review(db, review)
+        return False
+    except Exception as exc:
+        if review is not None:
+            _mark_failed(db, review, exc)
+        return False
+    finally:
+        db.close()
+
 
-        storage = get_storage_client()
-        content = storage.get_bytes(review.doc_storage_key)
-        extraction_result = extract_document(content, review.doc_mime)
-        segments = segment_document(
+def run_review_stage(
+    review_id: UUID | str,
+    stage: Callable[[Session, Review], None],
+    final_attempt: bool = True,
+) -> None:
+    db: Session = SessionLocal()
+    review: Review | None = None
+    if not isinstance(review_id, UUID):
+        review_id = UUID(str(review_id))
+    try:
+        review = db.get(Review, review_id)
+        if review is None:
+            raise ValueError(f"Review {review_id} not found")
+        if review.status != ReviewStatus.PROCESSING:
+            raise ValueError(f"Review {review_id} is not processing")
+        stage(db, review)
+    except Exception as exc:
+        if review is not None and review.status == ReviewStatus.PROCESSING:
+            _record_failure(db, review, exc, final_attempt)
+        raise
+    finally:
+        db.close()
+
+
+def extraction_storage_key(review_id: UUID) -> str:
+    return f"reviews/{review_id}/derived/extraction.json"
+
+
+def extract_stage(db: Session, review: Review) -> None:
+    if _checkpoint_matches(db, review, STAGE_SEGMENTS, _segments_input_hash(review)):
+        return
+    extraction_result = _extract(review)
+    payload = {
+        "raw_text": extraction_result.get("raw_text", ""),
+        "pages": extraction_result.get("pages"),
+    }
+    get_storage_client().put_bytes(
+        extraction_storage_key(review.id),
+        json.dumps(payload).encode("utf-8"),
+        "application/json",
+    )
+
+
+def segment_stage(db: Session, review: Review) -> None:
+    if _checkpoint_matches(db, review, STAGE_SEGMENTS, _segments_input_hash(review)):
+        return
+    content = get_storage_client().get_bytes(extraction_storage_key(review.id))
+    extraction_result = json.loads(content)
+    del content
+    _store_segments(
+        db,
+        review,
+        segment_document(
             extraction_result.get("raw_text", ""), extraction_result.get("pages")
+        ),
+    )
+
+
+def classify_stage(db: Session, review: Review) -> None:
+    if _checkpoint_matches(
+        db, review, STAGE_CLASSIFICATIONS, _classifications_input_hash(db, review)
+    ):
+        return
+    _classify_segments(db, review)
+
+
+def evaluate_clause_stage(
+    clause_type: ClauseType, use_library: bool = True
+) -> Callable[[Session, Review], None]:
+    def _stage(db: Session, review: Review) -> None:
+        _evaluate_review(db, review, [clause_type], use_library=use_library)
+
+    return _stage
+
+
+def summarize_stage(db: Session, review: Review) -> None:
+    _finalize_review(db, review)
+
+
+def _hash_parts(*parts: object) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _segments_input_hash(review: Review) -> str:
+    return _hash_parts(
+        STAGE_SEGMENTS, review.doc_storage_key, review.doc_sha256, review.doc_mime
+    )
+
+
+def _classifications_input_hash(
+    db: Session, review: Review, segment_hashes: list[str] | None = None
+) -> str:
+    if segment_hashes is None:
+        segment_hashes = (
+            db.execute(
+                select(ReviewSegment.hash)
+                .where(ReviewSegment.review_id == review.id)
+                .order_by(ReviewSegment.segment_index)
+            )
+            .scalars()
+            .all()
+        )
+    return _hash_parts(STAGE_CLASSIFICATIONS, segment_hashes, classifier_config())
+
+
+def _record_metric(review: Review, name: str, value: dict) -> None:
+    review.metrics_json = {**(review.metrics_json or {}), name: value}
+
+
+def _llm_usage_metric(usage: dict[str, dict[str, float]]) -> dict:
+    return {
+        namespace: {name: round(value, 3) for name, value in counters.items()}
+        for namespace, counters in usage.items()
+    }
+
+
+def _evaluation_input_hash(library_key: dict) -> str:
+    # The clause library key already covers the candidates, context, playbook
+    # and evaluator settings the evaluation depends on.
+    return _hash_parts(
+        library_key["clause_type"].value,
+        library_key["candidates_hash"],
+        library_key["context_hash"],
+        library_key["playbook_fingerprint"],
+        library_key["evaluator_hash"],
+    )
+
+
+def _checkpoint_matches(
+    db: Session, review: Review, stage: str, input_hash: str
+) -> bool:
+    stored = db.execute(
+        select(ReviewStageCheckpoint.input_hash).where(
+            ReviewStageCheckpoint.review_id == review.id,
+            ReviewStageCheckpoint.stage == stage,
         )
-        if not segments:
-            raise ValueError("No segments produced from document")
+    ).scalar_one_or_none()
+    return stored == input_hash
+
 
+def _save_checkpoint(db: Session, review: Review, stage: str, input_hash: str) -> None:
+    # A re-run stage invalidates everything downstream of it.
+    downstream = STAGE_ORDER[STAGE_ORDER.index(stage) + 1 :]
+    if downstream:
         db.execute(
-            delete(SegmentClassification).where(
-                SegmentClassification.review_id == review.id
+            delete(ReviewStageCheckpoint).where(
+                ReviewStageCheckpoint.review_id == review.id,
+                ReviewStageCheckpoint.stage.in_(downstream),
             )
         )
-        db.commit()
+    statement = pg_insert(ReviewStageCheckpoint).values(
+        review_id=review.id, stage=stage, input_hash=input_hash
+    )
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=["review_id", "stage"],
+            set_={"input_hash": input_hash, "completed_at": func.now()},
+        )
+    )
 
-        db.execute(delete(ReviewSegment).where(ReviewSegment.review_id == review.id))
-        db.add_all(
-            [
-                ReviewSegment(
-                    review_id=review.id,
-                    segment_index=segment["segment_index"],
-                    heading=segment["heading"],
-                    section_number=segment["section_number"],
-                    text=segment["text"],
-                    hash=segment["hash"],
-                    page_start=segment["page_start"],
-                    page_end=segment["page_end"],
-                )
-                for segment in segments
-            ]
+
+def _reset_checkpoints(db: Session, review: Review) -> None:
+    db.execute(
+        delete(ReviewStageCheckpoint).where(ReviewStageCheckpoint.review_id == review.id)
+    )
+    db.execute(
+        update(ClauseEvaluation)
+        .where(ClauseEvaluation.review_id == review.id)
+        .values(input_hash=None)
+    )
+    db.commit()
+
+
+def _extract(review: Review) -> dict:
+    storage = get_storage_client()
+    content = storage.get_bytes(review.doc_storage_key)
+    return extract_document(content, review.doc_mime)
+
+
+def _iter_review_segments(review: Review) -> Iterable[dict]:
+    if get_settings().extraction_mode == "streaming":
+        return _stream_document_segments(review)
+    extraction_result = _extract(review)
+    return segment_document(
+        extraction_result.get("raw_text", ""), extraction_result.get("pages")
+    )
+
+
+def _stream_document_segments(review: Review) -> Iterator[dict]:
+    # The upload is spooled to a temporary file and read page by page (PDF) or
+    # block by block (DOCX), so neither the document bytes nor its full text
+    # are held in memory.
+    settings = get_settings()
+    with SpooledTemporaryFile(max_size=settings.extraction_spool_max_bytes) as spool:
+        get_storage_client().download_to(review.doc_storage_key, spool)
+        validate_upload(spool.tell(), review.doc_mime)
+        spool.seek(0)
+        if review.doc_mime == "application/pdf":
+            pages = iter_pdf_pages(spool)
+        else:
+            pages = (
+                {"page_num": None, "text": block["text"]}
+                for block in iter_docx_blocks(spool)
+            )
+        yield from segment_pages(pages)
+
+
+def _store_segments(
+    db: Session, review: Review, segments: Iterable[dict], keep: bool = False
+) -> list[ReviewSegment] | None:
+    # Segments are written with multi-row INSERTs as they are produced. With
+    # ``keep`` the inserted rows come back through RETURNING so classification
+    # does not re-select them; streamed documents keep nothing.
+    db.execute(
+        delete(SegmentClassification).where(
+            SegmentClassification.review_id == review.id
         )
-        db.commit()
+    )
+    db.execute(delete(ReviewSegment).where(ReviewSegment.review_id == review.id))
+    statement = insert(ReviewSegment)
+    if keep:
+        statement = statement.returning(ReviewSegment, sort_by_parameter_order=True)
+    rows = (
+        {
+            "review_id": review.id,
+            "segment_index": segment["segment_index"],
+            "heading": segment["heading"],
+            "section_number": segment["section_number"],
+            "text": segment["text"],
+            "hash": segment["hash"],
+            "page_start": segment["page_start"],
+            "page_end": segment["page_end"],
+        }
+        for segment in segments
+    )
+    stored: list[ReviewSegment] = []
+    count = 0
+    while batch := list(islice(rows, SEGMENT_BATCH_SIZE)):
+        count += len(batch)
+        if keep:
+            stored.extend(db.scalars(statement, batch).all())
+        else:
+            db.execute(statement, batch)
+    if not count:
+        raise ValueError("No segments produced from document")
+    _save_checkpoint(db, review, STAGE_SEGMENTS, _segments_input_hash(review))
+    db.commit()
+    return stored if keep else None
+
 
+def _classify_segments(
+    db: Session, review: Review, segments: list[ReviewSegment] | None = None
+) -> None:
+    # ``segments`` are rows _store_segments just inserted, which have no
+    # classifications yet.
+    if segments is None:
         segments = (
             db.execute(
                 select(ReviewSegment)
@@ -79,128 +460,686 @@ def process_review(review_id: UUID | str) -> None:
             .scalars()
             .all()
         )
+        db.execute(
+            delete(SegmentClassification).where(
+                SegmentClassification.review_id == review.id
+            )
+        )
+    # A revision inherits the parent review's results for unchanged segments.
+    # Boilerplate recurs across reviews, so the rest are looked up by segment
+    # hash next and only uncached texts reach the classifier.
+    parent = _parent_review(db, review)
+    inherited = _inherited_classifications(db, parent) if parent is not None else {}
+    use_cache = get_settings().classification_cache_enabled
+    config_hash = classifier_config_hash()
+    cached = (
+        lookup_cached_classifications(
+            db,
+            (segment.hash for segment in segments if segment.hash not in inherited),
+            config_hash,
+        )
+        if use_cache
+        else {}
+    )
+    computed: dict[str, list[dict]] = {}
+    # Fallback results are reused within this review but never cached.
+    cacheable: dict[str, list[dict]] = {}
+    hits = 0
+    classification_rows: list[dict] = []
+    for segment in segments:
+        results = inherited.get(segment.hash)
+        if results is None:
+            results = cached.get(segment.hash)
+            if results is not None:
+                hits += 1
+        if results is None:
+            results = computed.get(segment.hash)
+            if results is None:
+                results, complete = classify_segment(segment.text)
+                computed[segment.hash] = results
+                if complete:
+                    cacheable[segment.hash] = results
+        for result in results:
+            classification_rows.append(
+                {
+                    "review_id": review.id,
+                    "segment_id": segment.id,
+                    "clause_type": result["clause_type"],
+                    "confidence": result["confidence"],
+                    "method": result["method"],
+                }
+            )
+    if classification_rows:
+        db.execute(insert(SegmentClassification), classification_rows)
+    if use_cache and cacheable:
+        store_cached_classifications(db, cacheable, config_hash)
+    _record_metric(
+        review,
+        "classification_cache",
+        {
+            "segments": len(segments),
+            "hits": hits,
+            "hit_rate": round(hits / len(segments), 4) if segments else 0.0,
+        },
+    )
+    if parent is not None:
+        review.revision_diff_json = _revision_diff(db, review, parent, segments)
+    _save_checkpoint(
+        db,
+        review,
+        STAGE_CLASSIFICATIONS,
+        _classifications_input_hash(db, review, [segment.hash for segment in segments]),
+    )
+    db.commit()
 
-        classifications_to_add = []
-        for segment in segments:
-            for result in classify_segment(segment.text):
-                classifications_to_add.append(
-                    SegmentClassification(
-                        review_id=review.id,
-                        segment_id=segment.id,
-                        clause_type=result["clause_type"],
-                        confidence=result["confidence"],
-                        method=result["method"],
-                    )
-                )
-        if classifications_to_add:
-            db.add_all(classifications_to_add)
-            db.commit()
+
+def _parent_review(db: Session, review: Review) -> Review | None:
+    if review.parent_review_id is None:
+        return None
+    parent = db.get(Review, review.parent_review_id)
+    if parent is None or parent.status != ReviewStatus.COMPLETED:
+        return None
+    return parent
+
+
+def _inherited_classifications(db: Session, parent: Review) -> dict[str, list[dict]]:
+    # Only valid when the parent was classified with the current classifier
+    # settings, which its classifications checkpoint records.
+    if not _checkpoint_matches(
+        db, parent, STAGE_CLASSIFICATIONS, _classifications_input_hash(db, parent)
+    ):
+        return {}
+    rows = db.execute(
+        select(
+            ReviewSegment.hash,
+            SegmentClassification.clause_type,
+            SegmentClassification.confidence,
+            SegmentClassification.method,
+        )
+        .join(
+            SegmentClassification,
+            SegmentClassification.segment_id == ReviewSegment.id,
+            isouter=True,
+        )
+        .where(ReviewSegment.review_id == parent.id)
+        .order_by(ReviewSegment.segment_index, SegmentClassification.id)
+    ).all()
+    inherited: dict[str, list[dict]] = {}
+    for segment_hash, clause_type, confidence, method in rows:
+        results = inherited.setdefault(segment_hash, [])
+        if clause_type is not None:
+            results.append(
+                {"clause_type": clause_type, "confidence": confidence, "method": method}
+            )
+    return inherited
+
+
+def _revision_diff(
+    db: Session, review: Review, parent: Review, segments: list[ReviewSegment]
+) -> dict:
+    parent_hashes = Counter(
         db.execute(
-            delete(ClauseEvaluation).where(ClauseEvaluation.review_id == review.id)
+            select(ReviewSegment.hash).where(ReviewSegment.review_id == parent.id)
         )
-        db.commit()
+        .scalars()
+        .all()
+    )
+    hashes = Counter(segment.hash for segment in segments)
+    unchanged = sum((hashes & parent_hashes).values())
+    changed: list[str] = []
+    unchanged_clauses: list[str] = []
+    current = _select_candidate_segments(db, review.id, ClauseType)
+    previous = _select_candidate_segments(db, parent.id, ClauseType)
+    for clause_type in ClauseType:
+        current_hashes = [segment.hash for segment in current[clause_type]]
+        previous_hashes = [segment.hash for segment in previous[clause_type]]
+        (unchanged_clauses if current_hashes == previous_hashes else changed).append(
+            clause_type.value
+        )
+    return {
+        "parent_review_id": str(parent.id),
+        "segments": {
+            "added": sum(hashes.values()) - unchanged,
+            "removed": sum(parent_hashes.values()) - unchanged,
+            "unchanged": unchanged,
+        },
+        "changed_clause_types": changed,
+        "unchanged_clause_types": unchanged_clauses,
+    }
 
-        evaluations: list[ClauseEvaluation] = []
-        for clause_type in ClauseType:
-            candidates = _select_candidate_segments(db, review.id, clause_type)
-            if not candidates:
-                result = evaluate_missing_clause(clause_type)
-            else:
-                segment_texts = [segment.text for segment in candidates]
-                playbook_rules = get_rules_for_clause_type(clause_type)
-                context = review.context_json or {}
-                result = evaluate_clause(
-                    clause_type, segment_texts, context, playbook_rules
-                )
 
-            evidence_spans = validate_evidence_spans(
-                result.get("candidate_quotes", []), candidates
+def _evaluate_review(
+    db: Session,
+    review: Review,
+    clause_types: list[ClauseType],
+    use_library: bool = True,
+    commit: bool = True,
+) -> None:
+    # With ``commit=False`` the caller commits, unless a clause failed: the
+    # successful ones are then committed so a retry only redoes the failures.
+    context = review.context_json or {}
+    candidates_by_clause = _select_candidate_segments(db, review.id, clause_types)
+    existing = {
+        evaluation.clause_type: evaluation
+        for evaluation in db.execute(
+            select(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == review.id,
+                ClauseEvaluation.clause_type.in_(clause_types),
             )
+        )
+        .scalars()
+        .all()
+    }
+    library_keys = {
+        clause_type: clause_library_key(
+            clause_type, [segment.hash for segment in candidates], context
+        )
+        for clause_type, candidates in candidates_by_clause.items()
+    }
+    input_hashes = {
+        clause_type: _evaluation_input_hash(key)
+        for clause_type, key in library_keys.items()
+    }
 
-            evaluations.append(
-                ClauseEvaluation(
-                    review_id=review.id,
-                    clause_type=clause_type,
-                    risk_label=RiskLabel(result["risk_label"]),
-                    short_reason=result["short_reason"],
-                    suggested_change=result["suggested_change"],
-                    triggered_rule_ids=result.get("triggered_rule_ids", []),
-                    evidence_spans=evidence_spans,
-                )
+    pending: dict[ClauseType, list[str]] = {}
+    for clause_type, candidates in candidates_by_clause.items():
+        prior = existing.get(clause_type)
+        if prior is not None and prior.input_hash == input_hashes[clause_type]:
+            # Segment rows may have been re-created since, so re-anchor the
+            # stored quotes on the current candidate segments.
+            prior.evidence_spans = validate_evidence_spans(
+                [span.get("quote") for span in prior.evidence_spans or []],
+                candidates,
             )
+            continue
+        pending[clause_type] = [segment.text for segment in candidates]
 
-        if evaluations:
-            db.add_all(evaluations)
-            db.commit()
+    # Results taken from other reviews, with their provenance: library entry,
+    # source review and similarity.
+    reused: dict[ClauseType, tuple[dict, int | None, UUID | None, float]] = {}
+    settings = get_settings()
+    if use_library:
+        # A revision carries over the parent's evaluation of every clause
+        # whose inputs are unchanged.
+        parent = _parent_review(db, review)
+        if parent is not None:
+            for evaluation in db.execute(
+                select(ClauseEvaluation).where(
+                    ClauseEvaluation.review_id == parent.id,
+                    ClauseEvaluation.clause_type.in_(list(pending)),
+                )
+            ).scalars():
+                if evaluation.input_hash == input_hashes[evaluation.clause_type]:
+                    reused[evaluation.clause_type] = (
+                        _evaluation_result(evaluation),
+                        evaluation.library_entry_id,
+                        evaluation.reused_from_review_id or parent.id,
+                        evaluation.reuse_similarity or 1.0,
+                    )
 
-        if review.status == ReviewStatus.PROCESSING:
-            stored_evals = (
-                db.execute(
-                    select(ClauseEvaluation).where(ClauseEvaluation.review_id == review.id)
+    # Verbatim boilerplate evaluated in an earlier review (same candidates,
+    # context, playbook and evaluator) is taken from the clause library, and
+    # so are near-duplicates whose candidates reach
+    # NEAR_DUPLICATE_MIN_SIMILARITY.
+    signatures: dict[str, list[int]] = {}
+    if use_library and settings.clause_library_enabled:
+        exact = lookup_library_entries(
+            db,
+            {
+                clause_type: library_keys[clause_type]
+                for clause_type, texts in pending.items()
+                if texts and clause_type not in reused
+            },
+        )
+        library_hits = {
+            clause_type: (entry, 1.0) for clause_type, entry in exact.items()
+        }
+        for clause_type, texts in pending.items():
+            if (
+                not texts
+                or clause_type in reused
+                or clause_type in library_hits
+                or settings.near_duplicate_min_similarity <= 0
+            ):
+                continue
+            near = _find_near_duplicate(
+                db,
+                library_keys[clause_type],
+                candidates_by_clause[clause_type],
+                _candidate_signatures(candidates_by_clause[clause_type], signatures),
+                settings.near_duplicate_min_similarity,
+            )
+            if near is not None:
+                entry, similarity = near
+                logger.info(
+                    "Review %s reuses %s from review %s (library entry %s, "
+                    "similarity %.3f)",
+                    review.id,
+                    clause_type.value,
+                    entry.source_review_id,
+                    entry.id,
+                    similarity,
                 )
-                .scalars()
-                .all()
-            )
-            if stored_evals:
-                decision, summary_json = build_executive_summary(stored_evals)
-                review.decision = decision
-                review.summary_json = summary_json
-                db.add(review)
-                db.commit()
-
-            actual = db.execute(
-                select(func.count(ClauseEvaluation.id)).where(
-                    ClauseEvaluation.review_id == review.id
+                library_hits[clause_type] = near
+        mark_library_entries_used(
+            db,
+            [
+                entry.id
+                for clause_type, (entry, _similarity) in library_hits.items()
+                if clause_type not in exact
+            ],
+        )
+        for clause_type, (entry, similarity) in library_hits.items():
+            reused[clause_type] = (
+                library_entry_result(entry),
+                entry.id,
+                entry.source_review_id,
+                similarity,
+            )
+    to_evaluate = {
+        clause_type: texts
+        for clause_type, texts in pending.items()
+        if clause_type not in reused
+    }
+    results_by_clause: dict[ClauseType, dict | Exception] = dict(
+        zip(to_evaluate, _evaluate_clauses(to_evaluate, context))
+    )
+    for clause_type, (result, *_provenance) in reused.items():
+        results_by_clause[clause_type] = result
+
+    evaluations: list[ClauseEvaluation] = []
+    failures: list[Exception] = []
+    library_entries: dict[ClauseType, tuple[dict, dict, list]] = {}
+    for clause_type in pending:
+        result = results_by_clause[clause_type]
+        if isinstance(result, Exception):
+            failures.append(result)
+            continue
+        candidates = candidates_by_clause[clause_type]
+        evidence_spans = validate_evidence_spans(
+            result.get("candidate_quotes", []), candidates
+        )
+        if clause_type in reused:
+            _result, library_entry_id, source_review_id, reuse_similarity = reused[
+                clause_type
+            ]
+        else:
+            library_entry_id, source_review_id, reuse_similarity = None, None, None
+            if (
+                candidates
+                and not result.get("fallback")
+                and settings.clause_library_enabled
+            ):
+                library_entries[clause_type] = (
+                    library_keys[clause_type],
+                    result,
+                    _candidate_signatures(candidates, signatures),
                 )
-            ).scalar_one()
-            expected = len(ClauseType)
-            if actual == expected:
-                assert_transition(review.status, ReviewStatus.COMPLETED)
-                review.status = ReviewStatus.COMPLETED
-                db.add(review)
-                db.commit()
-            else:
-                review.error_message = f"Incomplete evaluations: {actual}/{expected}"
-                db.add(review)
-                db.commit()
-        # Pipeline steps will be added in later tasks.
-    except Exception as exc:
-        if review is not None:
-            try:
-                assert_transition(review.status, ReviewStatus.FAILED)
-                review.status = ReviewStatus.FAILED
-            except InvalidStatusTransition:
-                pass
-            review.error_message = str(exc)
-            db.add(review)
-            db.commit()
-    finally:
-        db.close()
 
+        evaluations.append(
+            ClauseEvaluation(
+                review_id=review.id,
+                clause_type=clause_type,
+                risk_label=RiskLabel(result["risk_label"]),
+                short_reason=result["short_reason"],
+                suggested_change=result["suggested_change"],
+                triggered_rule_ids=result.get("triggered_rule_ids", []),
+                evidence_spans=evidence_spans,
+                input_hash=(
+                    None if result.get("fallback") else input_hashes[clause_type]
+                ),
+                library_entry_id=library_entry_id,
+                reused_from_review_id=source_review_id,
+                reuse_similarity=reuse_similarity,
+            )
+        )
 
-def _select_candidate_segments(
+    # Fresh results go into the clause library with one upsert.
+    entry_ids = store_library_entries(db, library_entries, review.id)
+    for evaluation in evaluations:
+        if evaluation.clause_type in entry_ids:
+            evaluation.library_entry_id = entry_ids[evaluation.clause_type]
+
+    replaced = [
+        evaluation.clause_type
+        for evaluation in evaluations
+        if evaluation.clause_type in existing
+    ]
+    if replaced:
+        db.execute(
+            delete(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == review.id,
+                ClauseEvaluation.clause_type.in_(replaced),
+            )
+        )
+    db.add_all(evaluations)
+    db.flush()
+    if commit or failures:
+        db.commit()
+    if failures:
+        raise failures[0]
+
+
+def _evaluation_result(evaluation: ClauseEvaluation) -> dict:
+    return {
+        "risk_label": evaluation.risk_label.value,
+        "short_reason": evaluation.short_reason,
+        "suggested_change": evaluation.suggested_change,
+        "candidate_quotes": [
+            span.get("quote") for span in evaluation.evidence_spans or []
+        ],
+        "triggered_rule_ids": list(evaluation.triggered_rule_ids or []),
+    }
+
+
+def _candidate_signatures(
+    candidates: list[ReviewSegment], signatures: dict[str, list[int]]
+) -> list[list[int]]:
+    # MinHash signatures are only needed for candidate segments, so they are
+    # computed here rather than for every segment at segmentation time.
+    # ``signatures`` holds the ones already computed, by segment hash.
+    for segment in candidates:
+        if segment.hash not in signatures:
+            signatures[segment.hash] = minhash_signature(segment.text)
+    return [signatures[segment.hash] for segment in candidates]
+
+
+def _find_near_duplicate(
     db: Session,
-    review_id: UUID,
-    clause_type: ClauseType,
-    top_n: int = 5,
-) -> list[ReviewSegment]:
-    return (
+    library_key: dict,
+    candidates: list[ReviewSegment],
+    signatures: list[list[int]],
+    min_similarity: float,
+) -> tuple[ClauseLibraryEntry, float] | None:
+    for similarity, entry in find_near_duplicate_entries(
+        db, library_key, signatures, min_similarity
+    ):
+        # Word-set similarity cannot tell "shall notify" from "shall not
+        # notify", so a near-duplicate is only reused when its stored quotes
+        # are all still found in the new candidates. Entries without quotes
+        # need an exact match.
+        quotes = [quote for quote in entry.evidence_quotes or [] if quote]
+        if quotes and len(validate_evidence_spans(quotes, candidates)) == len(quotes):
+            return entry, similarity
+    return None
+
+
+def _finalize_review(db: Session, review: Review) -> None:
+    if review.status != ReviewStatus.PROCESSING:
+        return
+    stored_evals = (
+        db.execute(
+            select(ClauseEvaluation).where(ClauseEvaluation.review_id == review.id)
+        )
+        .scalars()
+        .all()
+    )
+    if stored_evals:
+        decision, summary_json = build_executive_summary(stored_evals)
+        review.decision = decision
+        review.summary_json = summary_json
+
+    actual = len(stored_evals)
+    expected = len(ClauseType)
+    if actual == expected:
+        assert_transition(review.status, ReviewStatus.COMPLETED)
+        review.status = ReviewStatus.COMPLETED
+        review.playbook_version = get_playbook_version()
+        review.results_fingerprint = _results_fingerprint()
+        # Clears the error a failed earlier attempt recorded.
+        review.error_message = None
+    else:
+        review.error_message = f"Incomplete evaluations: {actual}/{expected}"
+    db.add(review)
+    db.commit()
+
+
+def _results_fingerprint() -> str:
+    # Everything besides the document and context that a review's results
+    # depend on: the compiled playbook, classifier and evaluator settings.
+    return _hash_parts(
+        get_compiled_playbook().fingerprint, classifier_config_hash(), evaluator_hash()
+    )
+
+
+def _find_reusable_review(db: Session, review: Review) -> Review | None:
+    # Fallback evaluations (LLM errors, the LLM-disabled placeholder) are
+    # stored without an input hash; like the caches, reuse skips reviews
+    # holding any.
+    if not review.doc_sha256:
+        return None
+    candidates = (
         db.execute(
-            select(ReviewSegment)
+            select(Review)
+            .where(
+                Review.doc_sha256 == review.doc_sha256,
+                Review.status == ReviewStatus.COMPLETED,
+                Review.results_fingerprint == _results_fingerprint(),
+                Review.id != review.id,
+                ~select(ClauseEvaluation.id)
+                .where(
+                    ClauseEvaluation.review_id == Review.id,
+                    ClauseEvaluation.input_hash.is_(None),
+                )
+                .exists(),
+            )
+            .order_by(Review.updated_at.desc())
+            .limit(20)
+        )
+        .scalars()
+        .all()
+    )
+    context = review.context_json or {}
+    for candidate in candidates:
+        if (candidate.context_json or {}) == context:
+            return candidate
+    return None
+
+
+def _copy_review_artifacts(db: Session, source: Review, review: Review) -> None:
+    db.execute(
+        delete(SegmentClassification).where(
+            SegmentClassification.review_id == review.id
+        )
+    )
+    db.execute(delete(ClauseEvaluation).where(ClauseEvaluation.review_id == review.id))
+    db.execute(delete(ReviewSegment).where(ReviewSegment.review_id == review.id))
+
+    db.execute(
+        insert(ReviewSegment).from_select(
+            [
+                "review_id",
+                "segment_index",
+                "heading",
+                "section_number",
+                "text",
+                "hash",
+                "page_start",
+                "page_end",
+            ],
+            select(
+                literal(review.id, type_=ReviewSegment.review_id.type),
+                ReviewSegment.segment_index,
+                ReviewSegment.heading,
+                ReviewSegment.section_number,
+                ReviewSegment.text,
+                ReviewSegment.hash,
+                ReviewSegment.page_start,
+                ReviewSegment.page_end,
+            ).where(ReviewSegment.review_id == source.id),
+        )
+    )
+
+    source_segment = aliased(ReviewSegment)
+    target_segment = aliased(ReviewSegment)
+    db.execute(
+        insert(SegmentClassification).from_select(
+            ["review_id", "segment_id", "clause_type", "confidence", "method"],
+            select(
+                literal(review.id, type_=SegmentClassification.review_id.type),
+                target_segment.id,
+                SegmentClassification.clause_type,
+                SegmentClassification.confidence,
+                SegmentClassification.method,
+            )
+            .join(source_segment, source_segment.id == SegmentClassification.segment_id)
             .join(
-                SegmentClassification,
-                SegmentClassification.segment_id == ReviewSegment.id,
+                target_segment,
+                (target_segment.review_id == review.id)
+                & (target_segment.segment_index == source_segment.segment_index),
             )
-            .where(
-                SegmentClassification.review_id == review_id,
-                SegmentClassification.clause_type == clause_type,
+            .where(SegmentClassification.review_id == source.id),
+        )
+    )
+
+    segment_id_map = dict(
+        db.execute(
+            select(source_segment.id, target_segment.id)
+            .join(
+                target_segment,
+                target_segment.segment_index == source_segment.segment_index,
             )
-            .order_by(
-                SegmentClassification.confidence.desc(),
-                ReviewSegment.segment_index.asc(),
+            .where(
+                source_segment.review_id == source.id,
+                target_segment.review_id == review.id,
             )
-            .limit(top_n)
+        ).all()
+    )
+    source_evals = (
+        db.execute(
+            select(ClauseEvaluation).where(ClauseEvaluation.review_id == source.id)
         )
         .scalars()
         .all()
     )
+    db.add_all(
+        [
+            ClauseEvaluation(
+                review_id=review.id,
+                clause_type=evaluation.clause_type,
+                risk_label=evaluation.risk_label,
+                short_reason=evaluation.short_reason,
+                suggested_change=evaluation.suggested_change,
+                triggered_rule_ids=list(evaluation.triggered_rule_ids or []),
+                evidence_spans=[
+                    {
+                        **span,
+                        "segment_id": segment_id_map.get(
+                            span.get("segment_id"), span.get("segment_id")
+                        ),
+                    }
+                    for span in evaluation.evidence_spans or []
+                ],
+                input_hash=evaluation.input_hash,
+                library_entry_id=evaluation.library_entry_id,
+                reused_from_review_id=evaluation.reused_from_review_id,
+                reuse_similarity=evaluation.reuse_similarity,
+            )
+            for evaluation in source_evals
+        ]
+    )
+    # The copy is as good as a full run, so it can serve as a revision parent
+    # or resume point: its own checkpoints are recorded for the copied stages.
+    _save_checkpoint(db, review, STAGE_SEGMENTS, _segments_input_hash(review))
+    _save_checkpoint(
+        db, review, STAGE_CLASSIFICATIONS, _classifications_input_hash(db, review)
+    )
+    review.reused_from_review_id = source.id
+    db.add(review)
+    db.commit()
+
+
+def _evaluate_single_clause(
+    clause_type: ClauseType,
+    segment_texts: list[str],
+    context: dict,
+) -> dict | Exception:
+    # Exceptions are returned rather than raised so that one failing clause
+    # does not discard the results of the others.
+    try:
+        if not segment_texts:
+            return evaluate_missing_clause(clause_type)
+        playbook_rules = get_rules_for_clause_type(clause_type)
+        return evaluate_clause(clause_type, segment_texts, context, playbook_rules)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
+def _evaluate_clauses(
+    segment_texts_by_clause: dict[ClauseType, list[str]],
+    context: dict,
+) -> list[dict | Exception]:
+    # Only plain strings cross the thread boundary; the session and ORM
+    # objects stay on the calling thread. executor.map preserves input order.
+    settings = get_settings()
+    items = list(segment_texts_by_clause.items())
+    workers = max(1, min(settings.llm_eval_concurrency, len(items)))
+    if workers == 1:
+        return [
+            _evaluate_single_clause(clause_type, texts, context)
+            for clause_type, texts in items
+        ]
+    # Each item runs in a copy of the caller's context so LLM usage is
+    # counted for the review being processed.
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="clause-eval"
+    ) as executor:
+        return list(
+            executor.map(
+                lambda item: copy_context().run(
+                    _evaluate_single_clause, item[0], item[1], context
+                ),
+                items,
+            )
+        )
+
+
+def _candidate_segments_query(
+    review_id: UUID, clause_types: list[ClauseType], top_n: int = 5
+) -> Select:
+    # One windowed query ranks the classifications of every clause type at
+    # once: highest confidence first, earlier segments first on ties. The
+    # inner scan is served by ix_segment_classifications_candidates.
+    ranked = (
+        select(
+            SegmentClassification.clause_type,
+            SegmentClassification.segment_id,
+            func.row_number()
+            .over(
+                partition_by=SegmentClassification.clause_type,
+                order_by=(
+                    SegmentClassification.confidence.desc(),
+                    ReviewSegment.segment_index.asc(),
+                ),
+            )
+            .label("rank"),
+        )
+        .join(ReviewSegment, SegmentClassification.segment_id == ReviewSegment.id)
+        .where(
+            SegmentClassification.review_id == review_id,
+            SegmentClassification.clause_type.in_(clause_types),
+        )
+        .subquery()
+    )
+    return (
+        select(ranked.c.clause_type, ReviewSegment)
+        .join(ReviewSegment, ReviewSegment.id == ranked.c.segment_id)
+        .where(ranked.c.rank <= top_n)
+        .order_by(ranked.c.clause_type, ranked.c.rank)
+    )
+
+
+def _select_candidate_segments(
+    db: Session,
+    review_id: UUID,
+    clause_types: Iterable[ClauseType],
+    top_n: int = 5,
+) -> dict[ClauseType, list[ReviewSegment]]:
+    clause_types = list(clause_types)
+    candidates: dict[ClauseType, list[ReviewSegment]] = {
+        clause_type: [] for clause_type in clause_types
+    }
+    rows = db.execute(_candidate_segments_query(review_id, clause_types, top_n))
+    for clause_type, segment in rows:
+        candidates[clause_type].append(segment)
+    return candidates
@@ -0,0 +1,93 @@
+"""Rules-classifier benchmark: compiled keyword matcher vs the per-keyword loop.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_classification --segments 1000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.config import get_settings
+from app.models.clause_type import ClauseType
+from app.playbook.rules import get_classification_keywords
+from app.services.classification import (
+    FALLBACK_CLASSIFICATION_RULES,
+    classify_segment_rules,
+    get_keyword_matcher,
+)
+
+VOCABULARY = (
+    "the processor shall implement appropriate technical and organizational "
+    "measures to ensure a level of security appropriate to the risk including "
+    "encryption of personal data the controller may audit compliance and request "
+    "deletion or return of data at termination sub-processor transfers to a third "
+    "country rely on standard contractual clauses this agreement is governed by the "
+    "laws of germany and subject to the jurisdiction of its courts notify without "
+    "undue delay after becoming aware of a personal data breach"
+).split()
+
+
+def legacy_classify_segment_rules(segment_text: str) -> list[dict]:
+    normalized = segment_text.lower()
+    results: list[dict] = []
+    keywords_map = get_classification_keywords()
+    for clause_type in ClauseType:
+        keywords = keywords_map.get(clause_type) or FALLBACK_CLASSIFICATION_RULES.get(
+            clause_type, []
+        )
+        if not keywords:
+            continue
+        score = sum(1 for keyword in keywords if keyword in normalized)
+        if score > 0:
+            confidence = min((score / len(keywords)) * 2, 0.9)
+            results.append(
+                {"clause_type": clause_type, "confidence": confidence, "method": "RULES"}
+            )
+    results.sort(key=lambda item: (-item["confidence"], item["clause_type"].value))
+    return results[: get_settings().classify_top_k]
+
+
+def _synthetic_segments(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(40, 200)))
+        for _ in range(count)
+    ]
+
+
+def _time(fn, segments: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for segment in segments:
+            fn(segment)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--segments", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    segments = _synthetic_segments(args.segments, args.seed)
+    for segment in segments:
+        assert classify_segment_rules(segment) == legacy_classify_segment_rules(segment)
+
+    legacy = _time(legacy_classify_segment_rules, segments, args.repeat)
+    compiled = _time(classify_segment_rules, segments, args.repeat)
+    mode = "aho-corasick" if get_keyword_matcher().uses_automaton else "substring"
+    print(f"segments:        {args.segments}")
+    print(f"matcher:         {mode}")
+    print(f"legacy loop:     {legacy * 1000:.1f} ms")
+    print(f"compiled match:  {compiled * 1000:.1f} ms")
+    print(f"speedup:         {legacy / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""PDF extraction benchmark: pypdf text extraction throughput.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_pdf_extraction --pages 300
+    python -m benchmarks.bench_pdf_extraction --pdf path/to/contract.pdf
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from io import BytesIO
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.services.extraction import extract_text_from_pdf
+
+from benchmarks.bench_classification import VOCABULARY
+
+
+def _synthetic_pdf(page_count: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    resources = DictionaryObject(
+        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+    )
+    for page_num in range(1, page_count + 1):
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = resources
+        lines = [f"{page_num}. Annex section {page_num}"] + [
+            " ".join(rng.choice(VOCABULARY) for _ in range(12)) for _ in range(50)
+        ]
+        body = " ".join(f"({line}) '" for line in lines)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 9 Tf 11 TL 40 770 Td {body} ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--pdf", type=str, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.pdf:
+        with open(args.pdf, "rb") as handle:
+            content = handle.read()
+    else:
+        content = _synthetic_pdf(args.pages, args.seed)
+    page_count = len(PdfReader(BytesIO(content)).pages)
+
+    elapsed = _time(lambda: extract_text_from_pdf(content), args.repeat)
+
+    print(f"pages:           {page_count}")
+    print(f"size:            {len(content) / 1024 / 1024:.1f} MB")
+    print(f"extraction:      {elapsed * 1000:.1f} ms")
+    print(f"throughput:      {page_count / elapsed:,.0f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
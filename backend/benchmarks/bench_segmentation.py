@@ -0,0 +1,97 @@
+"""Segmentation benchmark: combined heading matcher vs the four-regex loop.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_segmentation --pages 500 5000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.services import segmentation
+from app.services.segmentation import HEADING_PATTERNS, segment_document
+
+from benchmarks.bench_classification import VOCABULARY
+
+
+def legacy_match_heading(line: str) -> tuple[str | None, str | None]:
+    for index, pattern in enumerate(HEADING_PATTERNS):
+        match = pattern.match(line)
+        if not match:
+            continue
+        if index == 3:
+            return match.group(1).strip(), None
+        return match.group(2).strip(), match.group(1).strip()
+    return None, None
+
+
+def _synthetic_pages(page_count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    pages: list[dict] = []
+    section = 0
+    for page_num in range(1, page_count + 1):
+        lines: list[str] = []
+        for _ in range(45):
+            roll = rng.random()
+            if roll < 0.03:
+                section += 1
+                lines.append(f"{section}. {rng.choice(VOCABULARY).title()} obligations")
+            elif roll < 0.05:
+                lines.append(f"{section}.{rng.randint(1, 9)} Scope of processing")
+            elif roll < 0.06:
+                lines.append(f"({rng.choice('abcdef')}) {rng.choice(VOCABULARY)} measures")
+            elif roll < 0.065:
+                lines.append("ANNEX SECURITY MEASURES")
+            else:
+                lines.append(" ".join(rng.choice(VOCABULARY) for _ in range(14)))
+        pages.append({"page_num": page_num, "text": "\n".join(lines)})
+    return pages
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    combined_match = segmentation._match_heading
+    for page_count in args.pages:
+        pages = _synthetic_pages(page_count, args.seed)
+        text = "\n".join(page["text"] for page in pages)
+        line_count = text.count("\n") + 1
+
+        def run() -> list[dict]:
+            return segment_document(text, pages)
+
+        segmentation._match_heading = legacy_match_heading
+        try:
+            legacy_segments = run()
+            legacy = _time(run, args.repeat)
+        finally:
+            segmentation._match_heading = combined_match
+        assert run() == legacy_segments
+        combined = _time(run, args.repeat)
+
+        print(f"pages:           {page_count}")
+        print(f"lines:           {line_count}")
+        print(f"segments:        {len(legacy_segments)}")
+        print(f"four regexes:    {line_count / legacy:,.0f} lines/s")
+        print(f"combined:        {line_count / combined:,.0f} lines/s")
+        print(f"speedup:         {legacy / combined:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
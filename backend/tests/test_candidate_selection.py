@@ -0,0 +1,138 @@
+import json
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+from app.database import SessionLocal
+from app.models.classification import SegmentClassification
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.segment import ReviewSegment
+from app.workers.tasks import _candidate_segments_query, _select_candidate_segments
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+def _create_classified_review(session, classifications, segment_count) -> str:
+    # classifications: (segment_index, clause_type, confidence)
+    review_id = uuid4()
+    session.add(
+        Review(
+            id=review_id,
+            status=ReviewStatus.PROCESSING,
+            doc_storage_key="reviews/key",
+            doc_mime="application/pdf",
+            doc_sha256=str(uuid4()),
+        )
+    )
+    segments = [
+        ReviewSegment(
+            review_id=review_id,
+            segment_index=index,
+            text=f"segment {index}",
+            hash=f"hash-{index}",
+        )
+        for index in range(segment_count)
+    ]
+    session.add_all(segments)
+    session.flush()
+    session.add_all(
+        SegmentClassification(
+            review_id=review_id,
+            segment_id=segments[index].id,
+            clause_type=clause_type,
+            confidence=confidence,
+            method="RULES",
+        )
+        for index, clause_type, confidence in classifications
+    )
+    session.commit()
+    return review_id
+
+
+def test_candidates_ranked_per_clause_type() -> None:
+    classifications = [
+        (0, ClauseType.LIABILITY, 0.5),
+        (1, ClauseType.LIABILITY, 0.9),
+        (2, ClauseType.LIABILITY, 0.7),
+        (3, ClauseType.LIABILITY, 0.9),
+        (4, ClauseType.LIABILITY, 0.6),
+        (5, ClauseType.LIABILITY, 0.8),
+        (5, ClauseType.GOVERNING_LAW, 0.95),
+        (2, ClauseType.GOVERNING_LAW, 0.6),
+    ]
+    with SessionLocal() as session:
+        review_id = _create_classified_review(session, classifications, 6)
+        candidates = _select_candidate_segments(
+            session,
+            review_id,
+            [ClauseType.LIABILITY, ClauseType.GOVERNING_LAW, ClauseType.AUDIT_RIGHTS],
+        )
+
+    assert [segment.segment_index for segment in candidates[ClauseType.LIABILITY]] == [
+        1,
+        3,
+        5,
+        2,
+        4,
+    ]
+    assert [
+        segment.segment_index for segment in candidates[ClauseType.GOVERNING_LAW]
+    ] == [5, 2]
+    assert candidates[ClauseType.AUDIT_RIGHTS] == []
+
+
+def test_candidate_query_uses_candidates_index() -> None:
+    with SessionLocal() as session:
+        review_ids = [
+            _create_classified_review(
+                session,
+                [
+                    (index, clause_type, (index % 7) / 7)
+                    for index in range(40)
+                    for clause_type in list(ClauseType)[index % 3 :: 3]
+                ],
+                40,
+            )
+            for _ in range(5)
+        ]
+        session.execute(text("ANALYZE segment_classifications"))
+        # The tables are small here, so keep the planner from preferring a
+        # sequential scan and check which index it picks.
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        query = _candidate_segments_query(review_ids[0], list(ClauseType)).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {query}")).scalar_one()
+
+    assert "ix_segment_classifications_candidates" in json.dumps(plan)
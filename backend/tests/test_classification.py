@@ -97,3 +97,28 @@ def test_top_k_sorted(tmp_path, monkeypatch) -> None:
 
     confidences = [result["confidence"] for result in results]
     assert confidences == sorted(confidences, reverse=True)
+
+
+def test_llm_fallback_is_marked_incomplete(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("USE_LLM_CLASSIFICATION", "true")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    module = _reload_with_playbook(
+        tmp_path,
+        """
+        playbook:
+          id: test
+          version: "1.0"
+          rules: []
+        """,
+        monkeypatch,
+    )
+
+    # Too weak for the rules alone, and the LLM cannot answer without a key.
+    _results, complete = module.classify_segment("The parties agree as follows.")
+    assert complete is False
+
+    _results, complete = module.classify_segment(
+        "Governing law and jurisdiction: governing law is applicable law."
+    )
+    assert complete is True
+    get_settings.cache_clear()
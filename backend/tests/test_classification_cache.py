@@ -0,0 +1,160 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, select, text
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.classification import SegmentClassification
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.workers import tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+BOILERPLATE = "The processor shall notify the controller of any personal data breach."
+
+
+@pytest.fixture()
+def classified(monkeypatch) -> list:
+    monkeypatch.setattr(
+        "app.workers.tasks.extract_document",
+        lambda content, _mime: {"raw_text": content.decode("utf-8"), "pages": []},
+    )
+    texts: list = []
+
+    def _classify_stub(segment_text):
+        texts.append(segment_text)
+        return [
+            {
+                "clause_type": ClauseType.BREACH_NOTIFICATION,
+                "confidence": 0.8,
+                "method": "RULES",
+            }
+        ], True
+
+    monkeypatch.setattr("app.workers.tasks.classify_segment", _classify_stub)
+    monkeypatch.setattr(
+        "app.workers.tasks.evaluate_clause",
+        lambda *_args: {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": [],
+            "triggered_rule_ids": [],
+        },
+    )
+    return texts
+
+
+def _process(document: str) -> Review:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                doc_storage_key="reviews/key",
+                doc_mime="application/pdf",
+                doc_sha256=uuid4().hex,
+            )
+        )
+        session.commit()
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(
+            "app.workers.tasks.get_storage_client",
+            lambda: type(
+                "Stub", (), {"get_bytes": lambda _self, _key: document.encode("utf-8")}
+            )(),
+        )
+        tasks.process_review(review_id)
+    with SessionLocal() as session:
+        return session.get(Review, review_id)
+
+
+def test_shared_segments_are_classified_once(classified) -> None:
+    first = _process(f"1. Breach\n{BOILERPLATE}\n2. Vendor Terms\nFirst vendor only.")
+    assert len(classified) == 2
+    assert first.metrics_json["classification_cache"] == {
+        "segments": 2,
+        "hits": 0,
+        "hit_rate": 0.0,
+    }
+
+    classified.clear()
+    second = _process(f"1. Breach\n{BOILERPLATE}\n2. Vendor Terms\nSecond vendor only.")
+
+    assert classified == ["2. Vendor Terms\nSecond vendor only."]
+    assert second.status == ReviewStatus.COMPLETED
+    assert second.metrics_json["classification_cache"] == {
+        "segments": 2,
+        "hits": 1,
+        "hit_rate": 0.5,
+    }
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(SegmentClassification).where(
+                SegmentClassification.review_id == second.id
+            )
+        ).scalars().all()
+        assert {row.clause_type for row in rows} == {ClauseType.BREACH_NOTIFICATION}
+        assert len(rows) == 2
+
+
+def test_classifier_config_change_misses_cache(classified, monkeypatch) -> None:
+    document = f"1. Breach\n{BOILERPLATE}"
+    _process(document)
+    monkeypatch.setenv("CLASSIFY_TOP_K", "1")
+    get_settings.cache_clear()
+    classified.clear()
+
+    review = _process(document)
+
+    assert len(classified) == 1
+    assert review.metrics_json["classification_cache"]["hits"] == 0
+
+
+def test_fallback_classifications_are_not_cached(classified, monkeypatch) -> None:
+    def _fallback_stub(segment_text):
+        classified.append(segment_text)
+        return [], False
+
+    monkeypatch.setattr("app.workers.tasks.classify_segment", _fallback_stub)
+    document = f"1. Breach\n{BOILERPLATE}"
+    _process(document)
+    classified.clear()
+
+    review = _process(document)
+
+    assert len(classified) == 1
+    assert review.metrics_json["classification_cache"]["hits"] == 0
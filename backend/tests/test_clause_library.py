@@ -0,0 +1,258 @@
+import logging
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, select, text
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_library_entry import ClauseLibraryEntry
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.models.segment import ReviewSegment
+from app.services.segmentation import segment_document
+from app.workers import tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+GOVERNING_LAW_TEXT = (
+    "This agreement between Acme Corporation and the Supplier is governed by "
+    "the laws of Ireland. Acme Corporation and the Supplier submit to the "
+    "exclusive jurisdiction of the courts of Dublin, and governing law applies "
+    "to any dispute or claim arising out of or in connection with it."
+)
+
+
+@pytest.fixture()
+def document() -> dict:
+    return {"text": GOVERNING_LAW_TEXT}
+
+
+@pytest.fixture()
+def eval_calls(monkeypatch, document) -> list:
+    monkeypatch.setattr(
+        "app.workers.tasks.get_storage_client",
+        lambda: type("Stub", (), {"get_bytes": lambda _self, _key: b"data"})(),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.extract_document",
+        lambda _content, _mime: {"raw_text": "", "pages": []},
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.segment_document",
+        lambda *_args: segment_document(f"GOVERNING LAW\n{document['text']}"),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.classify_segment",
+        lambda _text: (
+            [{"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}],
+            True,
+        ),
+    )
+    calls: list = []
+
+    def _eval_stub(clause_type, *_args):
+        calls.append(clause_type)
+        return {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": ["governing law"],
+            "triggered_rule_ids": ["R1"],
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _eval_stub)
+    return calls
+
+
+def _create_review(context: dict | None, doc_sha256: str) -> str:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                context_json=context,
+                doc_storage_key="reviews/key",
+                doc_mime="application/pdf",
+                doc_sha256=doc_sha256,
+            )
+        )
+        session.commit()
+    return review_id
+
+
+def test_known_clause_reuses_library_entry(eval_calls) -> None:
+    first_id = _create_review({"region": "EU"}, "a" * 64)
+    tasks.process_review(first_id)
+    assert eval_calls == [ClauseType.GOVERNING_LAW]
+
+    second_id = _create_review({"region": " EU ", "sector": ""}, "b" * 64)
+    tasks.process_review(second_id)
+    assert eval_calls == [ClauseType.GOVERNING_LAW]
+
+    with SessionLocal() as session:
+        second = session.get(Review, second_id)
+        assert second.status == ReviewStatus.COMPLETED
+        assert second.reused_from_review_id is None
+
+        entry = session.execute(select(ClauseLibraryEntry)).scalar_one()
+        assert entry.clause_type == ClauseType.GOVERNING_LAW
+        assert entry.hit_count == 1
+
+        segment = session.execute(
+            select(ReviewSegment).where(ReviewSegment.review_id == second_id)
+        ).scalar_one()
+        gov_eval = session.execute(
+            select(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == second_id,
+                ClauseEvaluation.clause_type == ClauseType.GOVERNING_LAW,
+            )
+        ).scalar_one()
+        assert gov_eval.library_entry_id == entry.id
+        assert gov_eval.reused_from_review_id == first_id
+        assert gov_eval.reuse_similarity == 1.0
+        assert gov_eval.risk_label == RiskLabel.YELLOW
+        assert gov_eval.evidence_spans[0]["segment_id"] == segment.id
+        assert gov_eval.evidence_spans[0]["quote"] == "governing law"
+
+
+def test_different_context_misses_library(eval_calls) -> None:
+    tasks.process_review(_create_review({"region": "EU"}, "a" * 64))
+    tasks.process_review(_create_review({"region": "US"}, "b" * 64))
+
+    assert len(eval_calls) == 2
+
+
+def test_force_bypasses_library(eval_calls) -> None:
+    tasks.process_review(_create_review(None, "a" * 64))
+    tasks.process_review(_create_review(None, "b" * 64), force=True)
+
+    assert len(eval_calls) == 2
+
+
+def test_library_can_be_disabled(eval_calls, monkeypatch) -> None:
+    monkeypatch.setenv("CLAUSE_LIBRARY_ENABLED", "false")
+    get_settings.cache_clear()
+
+    tasks.process_review(_create_review(None, "a" * 64))
+    tasks.process_review(_create_review(None, "b" * 64))
+
+    assert len(eval_calls) == 2
+    with SessionLocal() as session:
+        assert session.execute(select(ClauseLibraryEntry)).first() is None
+
+
+@pytest.fixture()
+def near_duplicates(monkeypatch):
+    monkeypatch.setenv("NEAR_DUPLICATE_MIN_SIMILARITY", "0.8")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_near_duplicate_reuses_prior_review(
+    eval_calls, document, near_duplicates, caplog
+) -> None:
+    first_id = _create_review({"region": "EU"}, "a" * 64)
+    tasks.process_review(first_id)
+
+    document["text"] = GOVERNING_LAW_TEXT.replace("Acme", "Globex")
+    second_id = _create_review({"region": "EU"}, "b" * 64)
+    with caplog.at_level(logging.INFO, logger="app.workers.tasks"):
+        tasks.process_review(second_id)
+
+    assert eval_calls == [ClauseType.GOVERNING_LAW]
+    assert f"reuses GOVERNING_LAW from review {first_id}" in caplog.text
+    with SessionLocal() as session:
+        gov_eval = session.execute(
+            select(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == second_id,
+                ClauseEvaluation.clause_type == ClauseType.GOVERNING_LAW,
+            )
+        ).scalar_one()
+        assert gov_eval.reused_from_review_id == first_id
+        assert 0.8 <= gov_eval.reuse_similarity < 1
+        assert gov_eval.evidence_spans[0]["quote"] == "governing law"
+
+
+def test_near_duplicate_with_changed_evidence_is_evaluated(
+    eval_calls, document, near_duplicates
+) -> None:
+    tasks.process_review(_create_review({"region": "EU"}, "a" * 64))
+
+    document["text"] = GOVERNING_LAW_TEXT.replace("governing law", "choice of law")
+    tasks.process_review(_create_review({"region": "EU"}, "b" * 64))
+
+    assert len(eval_calls) == 2
+
+
+def test_near_duplicate_can_be_disabled(eval_calls, document, monkeypatch) -> None:
+    monkeypatch.setenv("NEAR_DUPLICATE_MIN_SIMILARITY", "0")
+    get_settings.cache_clear()
+
+    tasks.process_review(_create_review(None, "a" * 64))
+    document["text"] = GOVERNING_LAW_TEXT.replace("Acme", "Globex")
+    tasks.process_review(_create_review(None, "b" * 64))
+
+    assert len(eval_calls) == 2
+
+
+def test_near_duplicate_without_quotes_is_evaluated(
+    eval_calls, document, near_duplicates, monkeypatch
+) -> None:
+    def _eval_stub(clause_type, *_args):
+        eval_calls.append(clause_type)
+        return {
+            "risk_label": RiskLabel.GREEN.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": [],
+            "triggered_rule_ids": [],
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _eval_stub)
+    tasks.process_review(_create_review(None, "a" * 64))
+    document["text"] = GOVERNING_LAW_TEXT.replace("Acme", "Globex")
+    tasks.process_review(_create_review(None, "b" * 64))
+
+    assert len(eval_calls) == 2
+
+
+def test_near_duplicate_is_off_by_default(eval_calls, document) -> None:
+    tasks.process_review(_create_review(None, "a" * 64))
+    document["text"] = GOVERNING_LAW_TEXT.replace("Acme", "Globex")
+    tasks.process_review(_create_review(None, "b" * 64))
+
+    assert len(eval_calls) == 2
@@ -0,0 +1,152 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.workers import tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+@pytest.fixture(autouse=True)
+def _stub_processing(monkeypatch) -> None:
+    monkeypatch.setenv("CLAUSE_LIBRARY_ENABLED", "false")
+    monkeypatch.setenv("DB_ROUND_TRIP_METRICS", "true")
+    get_settings.cache_clear()
+    monkeypatch.setattr(
+        "app.workers.tasks.get_storage_client",
+        lambda: type("Stub", (), {"get_bytes": lambda _self, key: key.encode()})(),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.extract_document",
+        lambda content, _mime: {"raw_text": content.decode(), "pages": []},
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.segment_document",
+        lambda raw_text, _pages: [
+            {
+                "segment_index": index,
+                "heading": None,
+                "section_number": None,
+                "text": f"{raw_text} clause {index}",
+                "hash": f"{raw_text}-{index}",
+                "page_start": 1,
+                "page_end": 1,
+            }
+            for index in range(int(raw_text.split("-")[1]))
+        ],
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.classify_segment",
+        lambda segment_text: (
+            [
+                {
+                    "clause_type": (
+                        ClauseType.LIABILITY
+                        if segment_text.endswith("0")
+                        else ClauseType.GOVERNING_LAW
+                    ),
+                    "confidence": 0.9,
+                    "method": "RULES",
+                }
+            ],
+            True,
+        ),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.evaluate_clause",
+        lambda *_args: {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": [],
+            "triggered_rule_ids": [],
+        },
+    )
+    yield
+    get_settings.cache_clear()
+
+
+def _process(document: str) -> dict:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                doc_storage_key=document,
+                doc_mime="application/pdf",
+                doc_sha256=str(uuid4()),
+            )
+        )
+        session.commit()
+    tasks.process_review(review_id)
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.COMPLETED
+        return review.metrics_json["db_round_trips"]
+
+
+def test_round_trips_do_not_grow_with_segment_count() -> None:
+    small = _process("small-3")
+    large = _process("large-300")
+
+    # Segments and classifications each commit once; evaluations are
+    # committed with the summary after the metric is recorded.
+    assert small["commits"] == 2
+    assert large == small
+
+
+def test_round_trips_are_not_recorded_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("DB_ROUND_TRIP_METRICS")
+    get_settings.cache_clear()
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                doc_storage_key="small-3",
+                doc_mime="application/pdf",
+                doc_sha256=str(uuid4()),
+            )
+        )
+        session.commit()
+    tasks.process_review(review_id)
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.COMPLETED
+        assert "db_round_trips" not in (review.metrics_json or {})
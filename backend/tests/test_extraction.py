@@ -1,12 +1,24 @@
 from io import BytesIO
+import zipfile
 
 import pytest
 from fastapi import HTTPException
-from docx import Document
 
 from app.config import get_settings
 from app.services import extraction
 
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _docx(body: str) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>',
+        )
+    return buffer.getvalue()
+
 
 def test_pdf_scanned_detection(monkeypatch) -> None:
     class FakePage:
@@ -28,20 +40,147 @@ def test_pdf_scanned_detection(monkeypatch) -> None:
     assert "Scanned PDFs" in exc_info.value.detail
 
 
+def test_iter_pdf_pages_yields_pages_lazily(monkeypatch) -> None:
+    extracted: list[int] = []
+
+    class FakePage:
+        def __init__(self, page_num: int) -> None:
+            self.page_num = page_num
+
+        def extract_text(self) -> str:
+            extracted.append(self.page_num)
+            return f"Page {self.page_num} text"
+
+    class FakeReader:
+        def __init__(self, *_args, **_kwargs) -> None:
+            self.pages = [FakePage(1), FakePage(2)]
+
+    monkeypatch.setattr(extraction, "PdfReader", FakeReader)
+    monkeypatch.setenv("TEXT_DENSITY_THRESHOLD", "0.1")
+    get_settings.cache_clear()
+
+    pages = extraction.iter_pdf_pages(BytesIO(b"%PDF-1.4 test"))
+
+    assert next(pages) == {"page_num": 1, "text": "Page 1 text"}
+    assert extracted == [1]
+    assert list(pages) == [{"page_num": 2, "text": "Page 2 text"}]
+
+
+def test_iter_pdf_pages_rejects_scanned_after_last_page(monkeypatch) -> None:
+    class FakePage:
+        def extract_text(self) -> str:
+            return ""
+
+    class FakeReader:
+        def __init__(self, *_args, **_kwargs) -> None:
+            self.pages = [FakePage()]
+
+    monkeypatch.setattr(extraction, "PdfReader", FakeReader)
+    monkeypatch.setenv("TEXT_DENSITY_THRESHOLD", "0.9")
+    get_settings.cache_clear()
+
+    with pytest.raises(HTTPException) as exc_info:
+        list(extraction.iter_pdf_pages(BytesIO(b"%PDF-1.4 test")))
+
+    assert exc_info.value.status_code == 400
+
 
 def test_docx_extraction_returns_text(monkeypatch) -> None:
     monkeypatch.setenv("MAX_FILE_SIZE_MB", "25")
     get_settings.cache_clear()
 
-    document = Document()
-    document.add_paragraph("Hello DPA Guard")
-    buffer = BytesIO()
-    document.save(buffer)
+    content = _docx("<w:p><w:r><w:t>Hello DPA Guard</w:t></w:r></w:p>")
 
     result = extraction.extract_document(
-        buffer.getvalue(),
+        content,
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     )
 
     assert "Hello DPA Guard" in result["raw_text"]
     assert result["paragraph_count"] == 1
+
+
+def test_scanned_precheck_samples_pages(monkeypatch) -> None:
+    from pypdf import PdfWriter
+
+    from benchmarks.bench_pdf_extraction import _synthetic_pdf
+
+    monkeypatch.setenv("TEXT_DENSITY_THRESHOLD", "0.01")
+    monkeypatch.setenv("SCANNED_PRECHECK_SAMPLE_PAGES", "3")
+    get_settings.cache_clear()
+
+    writer = PdfWriter()
+    for _ in range(10):
+        writer.add_blank_page(612, 792)
+    buffer = BytesIO()
+    writer.write(buffer)
+
+    assert extraction.looks_scanned_pdf(buffer.getvalue()) is True
+    assert extraction.looks_scanned_pdf(_synthetic_pdf(10, seed=5)) is False
+    assert extraction.looks_scanned_pdf(b"%PDF-1.4 test") is False
+    assert extraction._sample_page_indexes(10, 3) == [0, 4, 9]
+    assert extraction._sample_page_indexes(2, 3) == [0, 1]
+
+
+def test_scanned_precheck_only_extracts_sample(monkeypatch) -> None:
+    extracted: list[int] = []
+
+    class FakePage:
+        def __init__(self, index: int) -> None:
+            self.index = index
+
+        def extract_text(self) -> str:
+            extracted.append(self.index)
+            return ""
+
+    class FakeReader:
+        def __init__(self, *_args, **_kwargs) -> None:
+            self.pages = [FakePage(index) for index in range(100)]
+
+    monkeypatch.setattr(extraction, "PdfReader", FakeReader)
+    monkeypatch.setenv("SCANNED_PRECHECK_SAMPLE_PAGES", "3")
+    get_settings.cache_clear()
+
+    assert extraction.looks_scanned_pdf(b"%PDF-1.4 scanned") is True
+    assert extracted == [0, 50, 99]
+
+
+def test_docx_extraction_streams_paragraphs_and_table_cells() -> None:
+    content = _docx(
+        '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+        "<w:r><w:t>Annex 2 Security Measures</w:t></w:r></w:p>"
+        "<w:tbl><w:tr>"
+        "<w:tc><w:p><w:r><w:t>Encryption</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>AES-256 at rest</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>TLS 1.2 in transit</w:t></w:r></w:p></w:tc>"
+        "</w:tr></w:tbl>"
+        "<w:p><w:r><w:t>Closing paragraph</w:t></w:r></w:p>"
+    )
+
+    blocks = list(extraction.iter_docx_blocks(BytesIO(content)))
+
+    assert blocks == [
+        {"text": "Annex 2 Security Measures", "style_id": "Heading1", "kind": "paragraph"},
+        {"text": "Encryption", "style_id": None, "kind": "table_cell"},
+        {
+            "text": "AES-256 at rest\nTLS 1.2 in transit",
+            "style_id": None,
+            "kind": "table_cell",
+        },
+        {"text": "Closing paragraph", "style_id": None, "kind": "paragraph"},
+    ]
+
+
+def test_docx_extraction_reads_tracked_changes_as_accepted() -> None:
+    content = _docx(
+        '<w:p><w:pPr><w:pStyle w:val="Clause"/></w:pPr>'
+        "<w:r><w:t>Notify within </w:t></w:r>"
+        "<w:del><w:r><w:delText>72</w:delText></w:r></w:del>"
+        "<w:ins><w:r><w:t>48</w:t></w:r></w:ins>"
+        "<w:r><w:tab/><w:t>hours</w:t></w:r></w:p>"
+    )
+
+    result = extraction.extract_text_from_docx(content)
+
+    assert result["raw_text"] == "Notify within 48\thours"
+    assert result["paragraphs"][0]["style_id"] == "Clause"
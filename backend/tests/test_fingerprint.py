@@ -0,0 +1,47 @@
+from app.services.fingerprint import (
+    LSH_BANDS,
+    MINHASH_PERMUTATIONS,
+    estimate_similarity,
+    lsh_bands,
+    minhash_signature,
+)
+
+CLAUSE = (
+    "The Processor shall notify Acme Corporation without undue delay and in any "
+    "event within 48 hours after becoming aware of a Personal Data Breach, "
+    "describing the nature of the breach, the categories and approximate number "
+    "of data subjects concerned and the measures taken to address the breach."
+)
+
+
+def test_signature_ignores_case_and_whitespace() -> None:
+    signature = minhash_signature(CLAUSE)
+
+    assert len(signature) == MINHASH_PERMUTATIONS
+    assert minhash_signature("  " + CLAUSE.upper().replace(" ", "\n  ")) == signature
+
+
+def test_party_name_change_stays_similar() -> None:
+    original = minhash_signature(CLAUSE)
+    renamed = minhash_signature(CLAUSE.replace("Acme Corporation", "Globex"))
+    unrelated = minhash_signature(
+        "Each party shall keep confidential all information disclosed by the "
+        "other party and shall not use it except for the purposes of this Agreement."
+    )
+
+    assert estimate_similarity(original, renamed) >= 0.8
+    assert estimate_similarity(original, unrelated) < 0.3
+
+
+def test_similar_signatures_share_lsh_bands() -> None:
+    original = lsh_bands(minhash_signature(CLAUSE))
+    renamed = lsh_bands(minhash_signature(CLAUSE.replace("48 hours", "72 hours")))
+
+    assert len(original) == LSH_BANDS
+    assert set(original) & set(renamed)
+    assert all(0 <= band < 2**31 for band in original)
+
+
+def test_empty_text_has_a_signature() -> None:
+    assert minhash_signature("") == minhash_signature("  \n ")
+    assert estimate_similarity([], []) == 0.0
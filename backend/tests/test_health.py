@@ -1,7 +1,9 @@
 from fastapi.testclient import TestClient
 
 from app.api.routes import health
+from app.config import get_settings
 from app.main import app
+from app.services.llm_circuit import CircuitBreaker, MemoryCircuitBackend
 
 client = TestClient(app)
 
@@ -20,3 +22,21 @@ def test_ready_db_down(monkeypatch) -> None:
 
     assert response.status_code == 503
     assert response.json() == {"status": "not_ready"}
+
+
+def test_llm_circuit_state(monkeypatch) -> None:
+    breaker = CircuitBreaker(MemoryCircuitBackend())
+    monkeypatch.setattr(health, "get_circuit_breaker", lambda: breaker)
+
+    response = client.get("/health/llm")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+    assert response.json()["circuit"] == {"state": "closed", "consecutive_failures": 0}
+
+    for _ in range(get_settings().llm_circuit_failure_threshold):
+        breaker.record_failure(get_settings().openai_model)
+
+    response = client.get("/health/llm")
+    assert response.status_code == 200
+    assert response.json()["status"] == "degraded"
+    assert response.json()["circuit"]["state"] == "open"
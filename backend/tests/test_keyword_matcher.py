@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from app.services.keyword_matcher import KeywordMatcher
+
+KEYWORDS = {
+    "security": ["security", "security incident", "encryption"],
+    "breach": ["breach", "security incident", "notify"],
+    "subjects": ["data subject", "data subjects", "rights"],
+    "empty": [],
+}
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def matcher(request, monkeypatch) -> KeywordMatcher:
+    if request.param == "substring":
+        monkeypatch.setattr(KeywordMatcher, "_build_automaton", staticmethod(lambda _k: None))
+    else:
+        pytest.importorskip("ahocorasick")
+    return KeywordMatcher(KEYWORDS)
+
+
+def _naive_counts(text: str) -> dict:
+    counts = {}
+    for label, keywords in KEYWORDS.items():
+        score = sum(1 for keyword in keywords if keyword in text)
+        if score:
+            counts[label] = score
+    return counts
+
+
+def test_counts_overlapping_and_shared_keywords(matcher) -> None:
+    text = "notify data subjects of any security incident"
+
+    assert matcher.count_hits(text) == {"security": 2, "breach": 2, "subjects": 2}
+    assert matcher.totals == {"security": 3, "breach": 3, "subjects": 3}
+
+
+def test_matches_naive_substring_loop(matcher) -> None:
+    rng = random.Random(3)
+    vocabulary = ["data", "subjects", "security", "incident", "breach", "rig", "hts", "notify", "x"]
+    for _ in range(200):
+        text = rng.choice(["", " "]).join(
+            rng.choice(vocabulary) for _ in range(rng.randint(0, 20))
+        )
+        assert matcher.count_hits(text) == _naive_counts(text)
@@ -0,0 +1,97 @@
+from app.config import get_settings
+from app.services import evaluation, llm_cache
+from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+
+
+def test_memory_backend_lru_eviction() -> None:
+    backend = MemoryLLMCacheBackend(ttl_seconds=60, max_entries=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    assert backend.get("a") == "1"
+    backend.set("c", "3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+    assert backend.evictions == 1
+
+
+def test_memory_backend_ttl_expiry(monkeypatch) -> None:
+    now = {"value": 1000.0}
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now["value"])
+    backend = MemoryLLMCacheBackend(ttl_seconds=10, max_entries=10)
+    backend.set("a", "1")
+
+    now["value"] += 5
+    assert backend.get("a") == "1"
+    now["value"] += 6
+    assert backend.get("a") is None
+
+
+def test_get_or_call_counts_hits_and_misses() -> None:
+    cache = LLMResponseCache(MemoryLLMCacheBackend(ttl_seconds=60, max_entries=10))
+    calls = {"count": 0}
+
+    def _call() -> str:
+        calls["count"] += 1
+        return "response"
+
+    assert cache.get_or_call("evaluation", "prompt", _call) == "response"
+    assert cache.get_or_call("evaluation", "prompt", _call) == "response"
+    assert cache.get_or_call("classification", "prompt", _call) == "response"
+
+    assert calls["count"] == 2
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_get_or_call_skips_uncacheable_responses() -> None:
+    cache = LLMResponseCache(MemoryLLMCacheBackend(ttl_seconds=60, max_entries=10))
+    calls = {"count": 0}
+
+    def _call() -> str:
+        calls["count"] += 1
+        return "not json"
+
+    for _ in range(2):
+        cache.get_or_call("evaluation", "prompt", _call, cacheable=lambda _v: False)
+
+    assert calls["count"] == 2
+    assert cache.stats()["stores"] == 0
+
+
+def test_cache_key_includes_model(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_MODEL", "model-a")
+    get_settings.cache_clear()
+    key_a = llm_cache.build_cache_key("evaluation", "prompt")
+    monkeypatch.setenv("OPENAI_MODEL", "model-b")
+    get_settings.cache_clear()
+    key_b = llm_cache.build_cache_key("evaluation", "prompt")
+
+    assert key_a != key_b
+
+
+def test_call_llm_openai_served_from_cache(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("LLM_CACHE_BACKEND", "memory")
+    get_settings.cache_clear()
+    llm_cache.get_llm_cache.cache_clear()
+    payload = (
+        '{"risk_label":"YELLOW","short_reason":"r","suggested_change":"s",'
+        '"candidate_quotes":[],"triggered_rule_ids":[]}'
+    )
+    calls = {"count": 0}
+
+    def _request(_prompt: str) -> str:
+        calls["count"] += 1
+        return payload
+
+    monkeypatch.setattr(evaluation, "_request_openai", _request)
+
+    assert evaluation.call_llm_openai("same prompt") == payload
+    assert evaluation.call_llm_openai("same prompt") == payload
+
+    assert calls["count"] == 1
+    assert llm_cache.get_llm_cache().stats()["hits"] == 1
+    llm_cache.get_llm_cache.cache_clear()
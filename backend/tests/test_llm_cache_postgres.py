@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+
+from app.services.llm_cache import PostgresLLMCacheBackend
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(text("TRUNCATE TABLE llm_cache_entries"))
+
+
+def test_postgres_backend_roundtrip_and_upsert() -> None:
+    backend = PostgresLLMCacheBackend(ttl_seconds=60, max_entries=10)
+    assert backend.get("key") is None
+
+    backend.set("key", "first")
+    backend.set("key", "second")
+
+    assert backend.get("key") == "second"
+
+
+def test_postgres_backend_expired_entries_miss() -> None:
+    backend = PostgresLLMCacheBackend(ttl_seconds=-1, max_entries=10)
+    backend.set("key", "value")
+
+    assert backend.get("key") is None
+
+
+def test_postgres_backend_size_eviction(monkeypatch) -> None:
+    monkeypatch.setattr(PostgresLLMCacheBackend, "_EVICT_EVERY", 1)
+    backend = PostgresLLMCacheBackend(ttl_seconds=60, max_entries=2)
+    engine = create_engine(DATABASE_URL, future=True)
+    for index in range(4):
+        backend.set(f"key-{index}", "value")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "UPDATE llm_cache_entries SET created_at = now() - "
+                    "make_interval(secs => :age) WHERE key = :key"
+                ),
+                {"age": 10 - index, "key": f"key-{index}"},
+            )
+
+    with engine.begin() as connection:
+        keys = connection.execute(
+            text("SELECT key FROM llm_cache_entries ORDER BY key")
+        ).scalars().all()
+    assert keys == ["key-2", "key-3"]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import pytest
+
+from app.config import get_settings
+from app.services.llm_circuit import CircuitBreaker, MemoryCircuitBackend
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def breaker(monkeypatch):
+    monkeypatch.setenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "3")
+    monkeypatch.setenv("LLM_CIRCUIT_COOLDOWN_SECONDS", "30")
+    get_settings.cache_clear()
+    clock = FakeClock()
+    yield CircuitBreaker(MemoryCircuitBackend(clock=clock), clock=clock), clock
+    get_settings.cache_clear()
+
+
+def test_opens_after_consecutive_failures(breaker) -> None:
+    circuit, _clock = breaker
+    for _ in range(2):
+        circuit.record_failure("model")
+    assert circuit.allow("model")
+
+    circuit.record_failure("model")
+
+    assert not circuit.allow("model")
+    assert circuit.state("model")["state"] == "open"
+    assert circuit.stats()["rejected"] == 1
+
+
+def test_success_resets_failure_count(breaker) -> None:
+    circuit, _clock = breaker
+    for _ in range(2):
+        circuit.record_failure("model")
+    circuit.record_success("model")
+    circuit.record_failure("model")
+
+    assert circuit.allow("model")
+    assert circuit.state("model") == {"state": "closed", "consecutive_failures": 1}
+
+
+def test_half_open_admits_one_probe(breaker) -> None:
+    circuit, clock = breaker
+    for _ in range(3):
+        circuit.record_failure("model")
+
+    clock.now += 30
+    assert circuit.state("model")["state"] == "half_open"
+    assert circuit.allow("model")
+    assert not circuit.allow("model")
+
+    circuit.record_success("model")
+    assert circuit.allow("model")
+    assert circuit.state("model")["state"] == "closed"
+
+
+def test_failed_probe_reopens(breaker) -> None:
+    circuit, clock = breaker
+    for _ in range(3):
+        circuit.record_failure("model")
+
+    clock.now += 30
+    assert circuit.allow("model")
+    circuit.record_failure("model")
+
+    assert not circuit.allow("model")
+    assert circuit.state("model")["retry_at"] == clock.now + 30
+
+
+def test_circuits_are_per_model(breaker) -> None:
+    circuit, _clock = breaker
+    for _ in range(3):
+        circuit.record_failure("model-a")
+
+    assert not circuit.allow("model-a")
+    assert circuit.allow("model-b")
+
+
+def test_unreachable_backend_allows_calls() -> None:
+    class BrokenBackend:
+        def load(self, _model):
+            raise ConnectionError("redis down")
+
+    circuit = CircuitBreaker(BrokenBackend())
+
+    assert circuit.allow("model")
+    assert circuit.stats()["errors"] == 1
+
+
+def test_success_only_resets_after_failures(breaker) -> None:
+    circuit, _clock = breaker
+    resets = []
+    reset = circuit.backend.reset
+    circuit.backend.reset = lambda model: (resets.append(model), reset(model))
+
+    for _ in range(3):
+        assert circuit.allow("model")
+        circuit.record_success("model")
+    assert resets == []
+
+    circuit.record_failure("model")
+    circuit.record_success("model")
+    circuit.record_success("model")
+    assert resets == ["model"]
+
+
+def test_success_resets_failures_seen_in_shared_state(breaker) -> None:
+    circuit, clock = breaker
+    other = CircuitBreaker(circuit.backend, clock=clock)
+    other.record_failure("model")
+
+    assert circuit.allow("model")
+    circuit.record_success("model")
+
+    assert circuit.state("model") == {"state": "closed", "consecutive_failures": 0}
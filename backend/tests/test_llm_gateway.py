@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import threading
+from contextvars import copy_context
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import get_settings
+from app.services import llm_gateway
+from app.services.llm_circuit import (
+    CircuitBreaker,
+    CircuitOpenError,
+    MemoryCircuitBackend,
+)
+from app.services.llm_gateway import LLMGateway, track_llm_usage
+from app.services.llm_rate_limit import (
+    LLMRateLimiter,
+    MemoryRateLimitBackend,
+    RateLimitWaitTimeout,
+)
+
+
+class DummyTransientError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__("transient")
+        self.status_code = status_code
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_circuit(monkeypatch) -> None:
+    monkeypatch.setattr(llm_gateway, "get_circuit_breaker", lambda: CircuitBreaker(None))
+
+
+class FakeClient:
+    def __init__(self, outcomes: list) -> None:
+        self.outcomes = outcomes
+        self.calls: list[str] = []
+        self.responses = SimpleNamespace(create=self._responses_create)
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(create=self._chat_create)
+        )
+
+    def _next(self, surface: str):
+        self.calls.append(surface)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _responses_create(self, **_kwargs):
+        return SimpleNamespace(output_text=self._next("responses"))
+
+    def _chat_create(self, **_kwargs):
+        content = self._next("chat")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+def test_client_is_reused_across_calls() -> None:
+    built: list[FakeClient] = []
+
+    def _factory() -> FakeClient:
+        built.append(FakeClient(["one", "two"]))
+        return built[-1]
+
+    gateway = LLMGateway(client_factory=_factory)
+
+    assert gateway.complete("evaluation", "prompt") == "one"
+    assert gateway.complete("classification", "prompt") == "two"
+    assert len(built) == 1
+
+
+def test_client_is_rebuilt_after_fork(monkeypatch) -> None:
+    built: list[FakeClient] = []
+
+    def _factory() -> FakeClient:
+        built.append(FakeClient([]))
+        return built[-1]
+
+    gateway = LLMGateway(client_factory=_factory)
+    monkeypatch.setattr(llm_gateway.os, "getpid", lambda: 100)
+    first = gateway.client()
+    assert gateway.client() is first
+
+    monkeypatch.setattr(llm_gateway.os, "getpid", lambda: 101)
+    assert gateway.client() is not first
+    assert len(built) == 2
+
+
+def test_retries_and_failures_are_counted() -> None:
+    client = FakeClient([DummyTransientError(503)] * 6 + ["ok"])
+    gateway = LLMGateway(client_factory=lambda: client, sleep_fn=lambda _delay: None)
+
+    # responses and chat both fail on each attempt until retries run out.
+    with pytest.raises(DummyTransientError):
+        gateway.complete("evaluation", "prompt")
+    assert gateway.complete("evaluation", "prompt") == "ok"
+
+    stats = gateway.stats()["evaluation"]
+    assert stats["requests"] == 2
+    assert stats["failures"] == 1
+    assert stats["retries"] == 2
+
+
+class DummyNotFoundError(Exception):
+    status_code = 404
+
+
+def test_chat_only_endpoint_is_probed_once() -> None:
+    client = FakeClient([DummyNotFoundError(), "one", "two", "three"])
+    client.base_url = "https://proxy.example/v1/"
+    gateway = LLMGateway(client_factory=lambda: client)
+
+    assert [gateway.complete("evaluation", "prompt") for _ in range(3)] == [
+        "one",
+        "two",
+        "three",
+    ]
+    assert client.calls == ["responses", "chat", "chat", "chat"]
+    assert gateway.surfaces() == {"gpt-4.1-mini@https://proxy.example/v1/": "chat"}
+
+
+def test_transient_probe_failure_is_not_remembered() -> None:
+    client = FakeClient([DummyTransientError(503), "one", "two"])
+    gateway = LLMGateway(client_factory=lambda: client)
+
+    gateway.complete("evaluation", "prompt")
+    gateway.complete("evaluation", "prompt")
+
+    assert client.calls == ["responses", "chat", "responses"]
+    assert list(gateway.surfaces().values()) == ["responses"]
+
+
+def test_surface_is_reprobed_after_interval(monkeypatch) -> None:
+    now = {"value": 1000.0}
+    monkeypatch.setattr(llm_gateway.time, "monotonic", lambda: now["value"])
+    client = FakeClient([DummyNotFoundError(), "one", "two", "three"])
+    gateway = LLMGateway(client_factory=lambda: client)
+
+    gateway.complete("evaluation", "prompt")
+    gateway.complete("evaluation", "prompt")
+    now["value"] += 3600
+    gateway.complete("evaluation", "prompt")
+
+    assert client.calls == ["responses", "chat", "chat", "responses"]
+
+
+def test_rejected_responses_surface_falls_back_to_chat() -> None:
+    client = FakeClient(["one", DummyNotFoundError(), "two", "three"])
+    gateway = LLMGateway(client_factory=lambda: client)
+
+    assert gateway.complete("evaluation", "prompt") == "one"
+    assert gateway.complete("evaluation", "prompt") == "two"
+    assert gateway.complete("evaluation", "prompt") == "three"
+
+    assert client.calls == ["responses", "responses", "chat", "chat"]
+    assert list(gateway.surfaces().values()) == ["chat"]
+
+
+def test_known_responses_surface_is_kept_on_transient_error() -> None:
+    client = FakeClient(["one", DummyTransientError(503), "two"])
+    gateway = LLMGateway(client_factory=lambda: client, sleep_fn=lambda _delay: None)
+
+    gateway.complete("evaluation", "prompt")
+    assert gateway.complete("evaluation", "prompt") == "two"
+
+    assert client.calls == ["responses", "responses", "responses"]
+    assert list(gateway.surfaces().values()) == ["responses"]
+
+
+def test_usage_is_tracked_for_the_current_context() -> None:
+    client = FakeClient(["one", "two", "three"])
+    gateway = LLMGateway(client_factory=lambda: client)
+
+    gateway.complete("evaluation", "prompt")
+    with track_llm_usage() as usage:
+        gateway.complete("evaluation", "prompt")
+        thread = threading.Thread(
+            target=copy_context().run,
+            args=(gateway.complete, "classification", "prompt"),
+        )
+        thread.start()
+        thread.join()
+
+    assert usage["evaluation"]["requests"] == 1
+    assert usage["classification"]["requests"] == 1
+    assert gateway.stats()["evaluation"]["requests"] == 2
+
+
+def test_rate_limit_wait_is_recorded(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_RPM_LIMIT", "1")
+    get_settings.cache_clear()
+    now = {"value": 1000.0}
+
+    def _clock() -> float:
+        return now["value"]
+
+    def _sleep(delay: float) -> None:
+        now["value"] += delay
+
+    limiter = LLMRateLimiter(
+        MemoryRateLimitBackend(clock=_clock), sleep_fn=_sleep, clock=_clock
+    )
+    gateway = LLMGateway(
+        client_factory=lambda: FakeClient(["one", "two"]), rate_limiter=limiter
+    )
+
+    gateway.complete("classification", "prompt")
+    gateway.complete("classification", "prompt")
+
+    stats = gateway.stats()["classification"]
+    assert stats["rate_limit_wait_seconds"] == pytest.approx(60)
+    get_settings.cache_clear()
+
+
+def test_rate_limit_wait_is_recorded_on_timeout(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_RPM_LIMIT", "1")
+    monkeypatch.setenv("LLM_RATE_LIMIT_MAX_WAIT_SECONDS", "12")
+    get_settings.cache_clear()
+    now = {"value": 1000.0}
+
+    class ContendedBackend:
+        # Other workers take the budget every time it refills.
+        def reserve(self, *_args) -> float:
+            return 5.0
+
+    def _sleep(delay: float) -> None:
+        now["value"] += delay
+
+    limiter = LLMRateLimiter(
+        ContendedBackend(), sleep_fn=_sleep, clock=lambda: now["value"]
+    )
+    client = FakeClient([])
+    gateway = LLMGateway(client_factory=lambda: client, rate_limiter=limiter)
+
+    with track_llm_usage() as usage:
+        with pytest.raises(RateLimitWaitTimeout):
+            gateway.complete("evaluation", "prompt")
+
+    assert client.calls == []
+    assert usage["evaluation"]["rate_limit_wait_seconds"] == pytest.approx(10)
+    assert usage["evaluation"]["failures"] == 1
+    get_settings.cache_clear()
+
+
+def test_open_circuit_fails_fast(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "2")
+    get_settings.cache_clear()
+    client = FakeClient([DummyTransientError(503)] * 4)
+    gateway = LLMGateway(
+        client_factory=lambda: client,
+        sleep_fn=lambda _delay: None,
+        circuit_breaker=CircuitBreaker(MemoryCircuitBackend()),
+    )
+
+    # Two failed attempts open the circuit; the last retry and the next call
+    # are rejected before anything is sent.
+    with pytest.raises(CircuitOpenError):
+        gateway.complete("evaluation", "prompt")
+    with pytest.raises(CircuitOpenError):
+        gateway.complete("evaluation", "prompt")
+
+    assert client.calls == ["responses", "chat"] * 2
+    get_settings.cache_clear()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+
+from app.config import get_settings
+from app.services.llm_rate_limit import (
+    LLMRateLimiter,
+    MemoryRateLimitBackend,
+    RateLimitWaitTimeout,
+    limits_for_model,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+@pytest.fixture()
+def limits(monkeypatch):
+    def _set(**env: str) -> None:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+
+    yield _set
+    get_settings.cache_clear()
+
+
+def test_memory_backend_refills_over_a_minute() -> None:
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(clock=clock)
+
+    assert backend.reserve("model", 2, 0, 100) == 0
+    assert backend.reserve("model", 2, 0, 100) == 0
+    assert backend.reserve("model", 2, 0, 100) == pytest.approx(30)
+
+    clock.now += 30
+    assert backend.reserve("model", 2, 0, 100) == 0
+
+
+def test_token_budget_limits_independently_of_requests() -> None:
+    backend = MemoryRateLimitBackend(clock=FakeClock())
+
+    assert backend.reserve("model", 100, 1000, 800) == 0
+    assert backend.reserve("model", 100, 1000, 800) == pytest.approx(36)
+    # Nothing was taken by the rejected reservation.
+    assert backend.reserve("model", 100, 1000, 200) == 0
+
+
+def test_acquire_waits_for_budget_and_records_it(limits) -> None:
+    limits(LLM_RPM_LIMIT="1")
+    clock = FakeClock()
+    limiter = LLMRateLimiter(
+        MemoryRateLimitBackend(clock=clock), sleep_fn=clock.sleep, clock=clock
+    )
+
+    assert limiter.acquire("model", 10) == 0
+    assert limiter.acquire("model", 10) == pytest.approx(60)
+
+    stats = limiter.stats()
+    assert stats["acquired"] == 2
+    assert stats["waited"] == 1
+    assert stats["wait_seconds"] == pytest.approx(60)
+
+
+def test_acquire_gives_up_after_max_wait(limits) -> None:
+    limits(LLM_RPM_LIMIT="1", LLM_RATE_LIMIT_MAX_WAIT_SECONDS="10")
+    clock = FakeClock()
+    limiter = LLMRateLimiter(
+        MemoryRateLimitBackend(clock=clock), sleep_fn=clock.sleep, clock=clock
+    )
+
+    limiter.acquire("model", 10)
+    with pytest.raises(RateLimitWaitTimeout):
+        limiter.acquire("model", 10)
+    assert limiter.stats()["timeouts"] == 1
+
+
+def test_backend_errors_do_not_block_calls(limits) -> None:
+    limits(LLM_RPM_LIMIT="1")
+
+    class BrokenBackend:
+        def reserve(self, *_args) -> float:
+            raise ConnectionError("redis down")
+
+    limiter = LLMRateLimiter(BrokenBackend())
+
+    assert limiter.acquire("model", 10) == 0
+    assert limiter.stats()["errors"] == 1
+
+
+def test_per_model_limits_override_defaults(limits) -> None:
+    limits(
+        LLM_RPM_LIMIT="100",
+        LLM_TPM_LIMIT="5000",
+        LLM_RATE_LIMITS='{"big-model": {"tpm": 90000}}',
+    )
+
+    assert limits_for_model("big-model") == (100, 90000)
+    assert limits_for_model("other") == (100, 5000)
+
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
-from app.services.openai_retry import is_transient_openai_exception, retry_with_backoff
+from app.services import openai_retry
+from app.services.openai_retry import (
+    async_retry_with_backoff,
+    is_transient_openai_exception,
+    retry_after_hint,
+    retry_with_backoff,
+)
 
 
 class DummyTransientError(Exception):
@@ -51,3 +60,102 @@ def test_non_transient_not_retried() -> None:
 
 def test_is_transient_exception_status_code() -> None:
     assert is_transient_openai_exception(DummyTransientError(429)) is True
+
+
+class DummyRateLimitError(Exception):
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.response = SimpleNamespace(headers=headers)
+
+
+def test_retry_after_header_sets_delay(monkeypatch) -> None:
+    monkeypatch.setattr(openai_retry.random, "uniform", lambda _a, _b: 0.0)
+    delays: list[float] = []
+    errors = [
+        DummyRateLimitError({"Retry-After": "7"}),
+        DummyRateLimitError({"retry-after-ms": "250"}),
+    ]
+
+    def _fn() -> str:
+        if errors:
+            raise errors.pop(0)
+        return "OK"
+
+    assert retry_with_backoff(_fn, sleep_fn=delays.append) == "OK"
+    assert delays == [7.0, 0.25]
+
+
+def test_ratelimit_reset_of_exhausted_bucket() -> None:
+    exc = DummyRateLimitError(
+        {
+            "x-ratelimit-remaining-requests": "12",
+            "x-ratelimit-reset-requests": "1s",
+            "x-ratelimit-remaining-tokens": "0",
+            "x-ratelimit-reset-tokens": "6m0.5s",
+        }
+    )
+
+    assert retry_after_hint(exc) == pytest.approx(360.5)
+    assert retry_after_hint(DummyTransientError(503)) is None
+
+
+def test_deadline_stops_retries() -> None:
+    now = {"value": 0.0}
+    calls = {"count": 0}
+
+    def _fn() -> str:
+        calls["count"] += 1
+        now["value"] += 1
+        raise DummyRateLimitError({"Retry-After": "5"})
+
+    with pytest.raises(DummyRateLimitError):
+        retry_with_backoff(
+            _fn,
+            max_retries=5,
+            deadline=10,
+            sleep_fn=lambda delay: now.__setitem__("value", now["value"] + delay),
+            clock=lambda: now["value"],
+        )
+    # 1s call + 5s sleep + 1s call leaves 3s, less than the next hint.
+    assert calls["count"] == 2
+
+
+def test_hint_is_capped_without_deadline(monkeypatch) -> None:
+    monkeypatch.setattr(openai_retry.random, "uniform", lambda _a, _b: 0.0)
+    delays: list[float] = []
+    errors = [DummyRateLimitError({"Retry-After": "86400"})]
+
+    def _fn() -> str:
+        if errors:
+            raise errors.pop(0)
+        return "OK"
+
+    assert retry_with_backoff(_fn, sleep_fn=delays.append) == "OK"
+    assert delays == [openai_retry.MAX_HINT_DELAY]
+
+
+def test_async_retry_succeeds_after_transient_failures() -> None:
+    calls = {"count": 0}
+    delays: list[float] = []
+
+    async def _fn() -> str:
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise DummyTransientError(503)
+        return "OK"
+
+    async def _sleep(delay: float) -> None:
+        delays.append(delay)
+
+    assert asyncio.run(async_retry_with_backoff(_fn, sleep_fn=_sleep)) == "OK"
+    assert calls["count"] == 3
+    assert len(delays) == 2
+
+
+def test_async_non_transient_not_retried() -> None:
+    async def _fn() -> str:
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(async_retry_with_backoff(_fn))
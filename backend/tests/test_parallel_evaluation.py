@@ -0,0 +1,80 @@
+import threading
+import time
+
+from app.config import get_settings
+from app.models.clause_type import ClauseType
+from app.models.risk_label import RiskLabel
+from app.workers import tasks
+
+
+def _stub_eval(clause_type, segment_texts, _context, _rules):
+    # Finish later clause types first to prove ordering is not completion order.
+    time.sleep(0.001 * (len(ClauseType) - list(ClauseType).index(clause_type)))
+    return {
+        "risk_label": RiskLabel.GREEN.value,
+        "short_reason": clause_type.value,
+        "suggested_change": None,
+        "candidate_quotes": [],
+        "triggered_rule_ids": [threading.current_thread().name],
+    }
+
+
+def test_evaluate_clauses_keeps_clause_order(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_EVAL_CONCURRENCY", "4")
+    get_settings.cache_clear()
+    monkeypatch.setattr(tasks, "evaluate_clause", _stub_eval)
+
+    texts_by_clause = {clause_type: ["text"] for clause_type in ClauseType}
+    texts_by_clause[ClauseType.TRANSFERS] = []
+
+    results = tasks._evaluate_clauses(texts_by_clause, {})
+
+    assert len(results) == len(ClauseType)
+    for clause_type, result in zip(ClauseType, results):
+        if clause_type == ClauseType.TRANSFERS:
+            assert result["risk_label"] == RiskLabel.RED.value
+        else:
+            assert result["short_reason"] == clause_type.value
+    thread_names = {
+        name for result in results for name in result["triggered_rule_ids"]
+    }
+    assert all(name.startswith("clause-eval") for name in thread_names)
+
+
+def test_evaluate_clauses_serial_when_concurrency_one(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_EVAL_CONCURRENCY", "1")
+    get_settings.cache_clear()
+    monkeypatch.setattr(tasks, "evaluate_clause", _stub_eval)
+
+    results = tasks._evaluate_clauses(
+        {clause_type: ["text"] for clause_type in ClauseType}, {}
+    )
+
+    assert [result["short_reason"] for result in results] == [
+        clause_type.value for clause_type in ClauseType
+    ]
+    assert {result["triggered_rule_ids"][0] for result in results} == {
+        threading.current_thread().name
+    }
+
+
+def test_evaluate_clauses_returns_failures_in_place(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_EVAL_CONCURRENCY", "4")
+    get_settings.cache_clear()
+
+    def _flaky_eval(clause_type, *args):
+        if clause_type == ClauseType.LIABILITY:
+            raise TimeoutError("slow model")
+        return _stub_eval(clause_type, *args)
+
+    monkeypatch.setattr(tasks, "evaluate_clause", _flaky_eval)
+
+    results = tasks._evaluate_clauses(
+        {clause_type: ["text"] for clause_type in ClauseType}, {}
+    )
+
+    for clause_type, result in zip(ClauseType, results):
+        if clause_type == ClauseType.LIABILITY:
+            assert isinstance(result, TimeoutError)
+        else:
+            assert result["short_reason"] == clause_type.value
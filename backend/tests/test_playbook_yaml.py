@@ -1,4 +1,5 @@
 import importlib
+import os
 from textwrap import dedent
 
 import app.playbook.rules as rules
@@ -31,3 +32,96 @@ def test_playbook_yaml_loads_rules(tmp_path, monkeypatch) -> None:
     result = rules.get_rules_for_clause_type(ClauseType.GOVERNING_LAW)
     assert result
     assert result[0]["rule_id"] == "DPA-LAW-01"
+
+
+def _write_playbook(path, version: str, keyword: str) -> None:
+    path.write_text(
+        dedent(
+            f"""
+            playbook:
+              id: dpa-test
+              version: "{version}"
+              rules:
+                - rule_id: DPA-LAW-01
+                  clause_type: governing_law
+                  requirement: Governing law is stated.
+                  severity: low
+                  keywords: ["{keyword}"]
+            """
+        )
+    )
+
+
+def test_compiled_playbook_hot_reloads_on_change(tmp_path, monkeypatch) -> None:
+    yaml_path = tmp_path / "playbook.yml"
+    _write_playbook(yaml_path, "1.0", "governing law")
+    monkeypatch.setenv("PLAYBOOK_YAML_PATH", str(yaml_path))
+    monkeypatch.setenv("PLAYBOOK_RELOAD_INTERVAL_SECONDS", "0")
+    get_settings.cache_clear()
+    importlib.reload(rules)
+
+    first = rules.get_compiled_playbook()
+    assert first.version == "1.0"
+    assert rules.get_compiled_playbook() is first
+    assert first.keywords_by_clause[ClauseType.GOVERNING_LAW] == ["governing law"]
+    assert first.rules_json_by_clause[ClauseType.GOVERNING_LAW] == (
+        rules.serialize_rule_fields(first.rules_by_clause[ClauseType.GOVERNING_LAW])
+    )
+
+    _write_playbook(yaml_path, "2.0", "jurisdiction")
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = rules.get_compiled_playbook()
+    assert second is not first
+    assert second.version == "2.0"
+    assert rules.get_playbook_version() == "2.0"
+    assert rules.get_classification_keywords()[ClauseType.GOVERNING_LAW] == [
+        "jurisdiction"
+    ]
+
+
+def test_compiled_playbook_touch_without_change_keeps_rules(tmp_path, monkeypatch) -> None:
+    yaml_path = tmp_path / "playbook.yml"
+    _write_playbook(yaml_path, "1.0", "governing law")
+    monkeypatch.setenv("PLAYBOOK_YAML_PATH", str(yaml_path))
+    monkeypatch.setenv("PLAYBOOK_RELOAD_INTERVAL_SECONDS", "0")
+    get_settings.cache_clear()
+    importlib.reload(rules)
+
+    first = rules.get_compiled_playbook()
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = rules.get_compiled_playbook()
+
+    assert second.fingerprint == first.fingerprint
+    assert second.rules_by_clause is first.rules_by_clause
+
+
+def test_broken_reload_keeps_last_good_playbook(tmp_path, monkeypatch) -> None:
+    yaml_path = tmp_path / "playbook.yml"
+    _write_playbook(yaml_path, "1.0", "governing law")
+    monkeypatch.setenv("PLAYBOOK_YAML_PATH", str(yaml_path))
+    monkeypatch.setenv("PLAYBOOK_RELOAD_INTERVAL_SECONDS", "60")
+    get_settings.cache_clear()
+    importlib.reload(rules)
+
+    first = rules.get_compiled_playbook()
+    yaml_path.write_text("playbook: [unterminated\n")
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    monkeypatch.setattr(rules, "_LAST_CHECKED", rules._LAST_CHECKED - 60)
+    compiles = {"count": 0}
+    compile_playbook = rules.compile_playbook
+
+    def _counting_compile(*args, **kwargs):
+        compiles["count"] += 1
+        return compile_playbook(*args, **kwargs)
+
+    monkeypatch.setattr(rules, "compile_playbook", _counting_compile)
+
+    assert rules.get_compiled_playbook() is first
+    assert rules.get_compiled_playbook() is first
+    assert rules.get_playbook_version() == "1.0"
+    # The failed check counts, so the file is not re-parsed on every call.
+    assert compiles["count"] == 1
@@ -34,7 +34,9 @@ def _clean_db() -> None:
     with engine.begin() as connection:
         connection.execute(
             text(
-                "TRUNCATE TABLE clause_evaluations, segment_classifications, review_segments, reviews"
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
             )
         )
 
@@ -64,9 +66,10 @@ def _stub_processing(monkeypatch) -> None:
 
     monkeypatch.setattr(
         "app.workers.tasks.classify_segment",
-        lambda _text: [
-            {"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}
-        ],
+        lambda _text: (
+            [{"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}],
+            True,
+        ),
     )
 
     monkeypatch.setattr(
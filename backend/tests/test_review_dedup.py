@@ -0,0 +1,249 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, select, text
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.models.segment import ReviewSegment
+from app.models.stage_checkpoint import ReviewStageCheckpoint
+from app.workers import tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+@pytest.fixture()
+def eval_calls(monkeypatch) -> list:
+    monkeypatch.setattr(
+        "app.workers.tasks.get_storage_client",
+        lambda: type("Stub", (), {"get_bytes": lambda _self, _key: b"data"})(),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.extract_document",
+        lambda _content, _mime: {"raw_text": "", "pages": []},
+    )
+    segments = [
+        {
+            "segment_index": 0,
+            "heading": "GOVERNING LAW",
+            "section_number": None,
+            "text": "This agreement is governed by law. governing law applies.",
+            "hash": "hash1",
+            "page_start": 1,
+            "page_end": 1,
+        }
+    ]
+    monkeypatch.setattr("app.workers.tasks.segment_document", lambda *_args: segments)
+    monkeypatch.setattr(
+        "app.workers.tasks.classify_segment",
+        lambda _text: (
+            [{"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}],
+            True,
+        ),
+    )
+    calls: list = []
+
+    def _eval_stub(clause_type, *_args):
+        calls.append(clause_type)
+        return {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": ["governing law"],
+            "triggered_rule_ids": ["R1"],
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _eval_stub)
+    return calls
+
+
+def _create_review(
+    context: dict | None, doc_sha256: str = "a" * 64, parent_review_id=None
+) -> str:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                context_json=context,
+                doc_storage_key="reviews/key",
+                doc_mime="application/pdf",
+                doc_sha256=doc_sha256,
+                parent_review_id=parent_review_id,
+            )
+        )
+        session.commit()
+    return review_id
+
+
+def test_duplicate_document_reuses_completed_review(eval_calls) -> None:
+    first_id = _create_review({"region": "EU", "company_role": "controller"})
+    tasks.process_review(first_id)
+    assert len(eval_calls) == 1
+
+    second_id = _create_review({"company_role": "controller", "region": "EU"})
+    tasks.process_review(second_id)
+    assert len(eval_calls) == 1
+
+    with SessionLocal() as session:
+        second = session.get(Review, second_id)
+        assert second.status == ReviewStatus.COMPLETED
+        assert second.reused_from_review_id == first_id
+        assert second.decision is not None
+
+        segment = session.execute(
+            select(ReviewSegment).where(ReviewSegment.review_id == second_id)
+        ).scalar_one()
+        gov_eval = session.execute(
+            select(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == second_id,
+                ClauseEvaluation.clause_type == ClauseType.GOVERNING_LAW,
+            )
+        ).scalar_one()
+        assert gov_eval.evidence_spans[0]["segment_id"] == segment.id
+
+        evaluations = session.execute(
+            select(ClauseEvaluation).where(ClauseEvaluation.review_id == second_id)
+        ).scalars().all()
+        assert len(evaluations) == len(ClauseType)
+
+
+def test_different_context_is_not_reused(eval_calls) -> None:
+    tasks.process_review(_create_review({"region": "EU"}))
+    tasks.process_review(_create_review({"region": "US"}))
+
+    assert len(eval_calls) == 2
+
+
+def test_force_runs_full_pipeline(eval_calls) -> None:
+    tasks.process_review(_create_review(None))
+    second_id = _create_review(None)
+    tasks.process_review(second_id, force=True)
+
+    assert len(eval_calls) == 2
+    with SessionLocal() as session:
+        second = session.get(Review, second_id)
+        assert second.status == ReviewStatus.COMPLETED
+        assert second.reused_from_review_id is None
+
+
+def test_evaluator_change_is_not_reused(eval_calls, monkeypatch) -> None:
+    tasks.process_review(_create_review(None))
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.7")
+    get_settings.cache_clear()
+    try:
+        second_id = _create_review(None)
+        tasks.process_review(second_id)
+    finally:
+        get_settings.cache_clear()
+
+    assert len(eval_calls) == 2
+    with SessionLocal() as session:
+        assert session.get(Review, second_id).reused_from_review_id is None
+
+
+def test_review_with_fallback_evaluations_is_not_reused(eval_calls, monkeypatch) -> None:
+    def _fallback_stub(clause_type, *_args):
+        eval_calls.append(clause_type)
+        return {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "Evaluation unavailable (LLM error).",
+            "suggested_change": "Manual review recommended.",
+            "candidate_quotes": [],
+            "triggered_rule_ids": [],
+            "fallback": True,
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _fallback_stub)
+    tasks.process_review(_create_review(None))
+    second_id = _create_review(None)
+    tasks.process_review(second_id)
+
+    assert len(eval_calls) == 2
+    with SessionLocal() as session:
+        assert session.get(Review, second_id).reused_from_review_id is None
+
+
+def test_copied_review_keeps_input_hashes_and_checkpoints(eval_calls) -> None:
+    first_id = _create_review(None)
+    tasks.process_review(first_id)
+    second_id = _create_review(None)
+    tasks.process_review(second_id)
+
+    with SessionLocal() as session:
+        hashes = {
+            review_id: {
+                evaluation.clause_type: evaluation.input_hash
+                for evaluation in session.execute(
+                    select(ClauseEvaluation).where(
+                        ClauseEvaluation.review_id == review_id
+                    )
+                ).scalars()
+            }
+            for review_id in (first_id, second_id)
+        }
+        assert hashes[second_id] == hashes[first_id]
+        assert None not in hashes[second_id].values()
+        stages = session.execute(
+            select(ReviewStageCheckpoint.stage).where(
+                ReviewStageCheckpoint.review_id == second_id
+            )
+        ).scalars().all()
+        assert set(stages) == {"segments", "classifications"}
+
+
+def test_copied_review_can_be_a_revision_parent(eval_calls, monkeypatch) -> None:
+    monkeypatch.setenv("CLAUSE_LIBRARY_ENABLED", "false")
+    get_settings.cache_clear()
+    try:
+        tasks.process_review(_create_review(None))
+        copy_id = _create_review(None)
+        tasks.process_review(copy_id)
+        revision_id = _create_review(None, "b" * 64, parent_review_id=copy_id)
+        tasks.process_review(revision_id)
+    finally:
+        get_settings.cache_clear()
+
+    # The unchanged clause is carried over from the copy, not evaluated again.
+    assert len(eval_calls) == 1
+    with SessionLocal() as session:
+        gov_eval = session.execute(
+            select(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == revision_id,
+                ClauseEvaluation.clause_type == ClauseType.GOVERNING_LAW,
+            )
+        ).scalar_one()
+        assert gov_eval.input_hash is not None
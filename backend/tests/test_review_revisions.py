@@ -0,0 +1,163 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, select, text
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.workers import tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+ORIGINAL = (
+    "1. Governing law\nThis agreement is governed by Irish law.\n"
+    "2. Liability\nLiability is capped at the fees paid."
+)
+REVISED = (
+    "1. Governing law\nThis agreement is governed by Irish law.\n"
+    "2. Liability\nLiability is unlimited for data protection breaches."
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+@pytest.fixture()
+def calls(monkeypatch) -> dict:
+    # Caches are off so that only the parent review can supply results.
+    monkeypatch.setenv("CLAUSE_LIBRARY_ENABLED", "false")
+    monkeypatch.setenv("CLASSIFICATION_CACHE_ENABLED", "false")
+    get_settings.cache_clear()
+    calls: dict = {"classify": [], "evaluate": []}
+    monkeypatch.setattr(
+        "app.workers.tasks.get_storage_client",
+        lambda: type("Stub", (), {"get_bytes": lambda _self, key: key.encode()})(),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.extract_document",
+        lambda content, _mime: {"raw_text": content.decode(), "pages": []},
+    )
+
+    def _classify_stub(segment_text):
+        calls["classify"].append(segment_text)
+        clause_type = (
+            ClauseType.LIABILITY
+            if "Liability" in segment_text
+            else ClauseType.GOVERNING_LAW
+        )
+        return [{"clause_type": clause_type, "confidence": 0.9, "method": "RULES"}], True
+
+    monkeypatch.setattr("app.workers.tasks.classify_segment", _classify_stub)
+
+    def _eval_stub(clause_type, segment_texts, *_args):
+        calls["evaluate"].append(clause_type)
+        quotes = [segment_texts[0].splitlines()[-1]] if segment_texts else []
+        return {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": quotes,
+            "triggered_rule_ids": ["R1"],
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _eval_stub)
+    yield calls
+    get_settings.cache_clear()
+
+
+def _create_review(document: str, parent_id=None) -> str:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                context_json={"region": "EU"},
+                doc_storage_key=document,
+                doc_mime="application/pdf",
+                doc_sha256=str(uuid4()),
+                parent_review_id=parent_id,
+            )
+        )
+        session.commit()
+    return review_id
+
+
+def test_revision_only_reevaluates_changed_clauses(calls) -> None:
+    parent_id = _create_review(ORIGINAL)
+    tasks.process_review(parent_id)
+    calls["classify"].clear()
+    calls["evaluate"].clear()
+
+    revision_id = _create_review(REVISED, parent_id)
+    tasks.process_review(revision_id)
+
+    assert calls["classify"] == [
+        "2. Liability\nLiability is unlimited for data protection breaches."
+    ]
+    assert calls["evaluate"] == [ClauseType.LIABILITY]
+    with SessionLocal() as session:
+        revision = session.get(Review, revision_id)
+        assert revision.status == ReviewStatus.COMPLETED
+        diff = revision.revision_diff_json
+        assert diff["parent_review_id"] == str(parent_id)
+        assert diff["segments"] == {"added": 1, "removed": 1, "unchanged": 1}
+        assert diff["changed_clause_types"] == [ClauseType.LIABILITY.value]
+        assert ClauseType.GOVERNING_LAW.value in diff["unchanged_clause_types"]
+
+        evaluations = {
+            evaluation.clause_type: evaluation
+            for evaluation in session.execute(
+                select(ClauseEvaluation).where(
+                    ClauseEvaluation.review_id == revision_id
+                )
+            ).scalars()
+        }
+        assert len(evaluations) == len(ClauseType)
+        carried = evaluations[ClauseType.GOVERNING_LAW]
+        assert carried.reused_from_review_id == parent_id
+        assert carried.evidence_spans[0]["quote"] == (
+            "This agreement is governed by Irish law."
+        )
+        assert evaluations[ClauseType.LIABILITY].reused_from_review_id is None
+
+
+def test_forced_revision_reevaluates_everything(calls) -> None:
+    parent_id = _create_review(ORIGINAL)
+    tasks.process_review(parent_id)
+    calls["evaluate"].clear()
+
+    tasks.process_review(_create_review(REVISED, parent_id), force=True)
+
+    assert sorted(calls["evaluate"]) == sorted(
+        [ClauseType.GOVERNING_LAW, ClauseType.LIABILITY]
+    )
@@ -35,7 +35,9 @@ def _clean_reviews() -> None:
     with engine.begin() as connection:
         connection.execute(
             text(
-                "TRUNCATE TABLE clause_evaluations, segment_classifications, review_segments, reviews"
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
             )
         )
 
@@ -1,4 +1,4 @@
-from app.services.segmentation import segment_document
+from app.services.segmentation import segment_document, segment_pages
 
 
 def test_segment_document_headings() -> None:
@@ -41,3 +41,97 @@ def test_segment_hashes_stable() -> None:
 
     assert first
     assert [seg["hash"] for seg in first] == [seg["hash"] for seg in second]
+
+
+def test_segment_pages_matches_joined_text() -> None:
+    pages = [
+        {"page_num": 1, "text": "1. Definitions\nAlpha\n"},
+        {"page_num": 2, "text": "continued on page two\n7. Security Measures\n"},
+        {"page_num": 3, "text": ""},
+        {"page_num": 4, "text": "Details about security."},
+    ]
+
+    streamed = list(segment_pages(iter(pages)))
+    buffered = segment_document("\n".join(page["text"] for page in pages))
+
+    assert [seg["text"] for seg in streamed] == [seg["text"] for seg in buffered]
+    assert [seg["hash"] for seg in streamed] == [seg["hash"] for seg in buffered]
+    assert [(seg["page_start"], seg["page_end"]) for seg in streamed] == [(1, 2), (2, 4)]
+
+
+def test_segment_pages_is_lazy() -> None:
+    consumed: list[int] = []
+
+    def pages():
+        for page_num in range(1, 6):
+            consumed.append(page_num)
+            yield {"page_num": page_num, "text": f"{page_num}. Heading {page_num}\nBody"}
+
+    segments = segment_pages(pages())
+    first = next(segments)
+
+    assert first["heading"] == "Heading 1"
+    assert len(consumed) < 5
+
+
+def test_segment_document_maps_page_ranges_by_offset() -> None:
+    pages = [
+        {"page_num": 1, "text": "1. Definitions\nAlpha"},
+        {"page_num": 2, "text": "Alpha continues here\n7. Security Measures\nBeta"},
+        {"page_num": 3, "text": ""},
+        {"page_num": 4, "text": "Beta ends\n8. Audit\nGamma"},
+    ]
+    text = "\n".join(page["text"] for page in pages)
+
+    segments = segment_document(text, pages)
+
+    assert [(seg["page_start"], seg["page_end"]) for seg in segments] == [
+        (1, 2),
+        (2, 4),
+        (4, 4),
+    ]
+    streamed = list(segment_pages(pages))
+    assert [(seg["page_start"], seg["page_end"]) for seg in streamed] == [
+        (seg["page_start"], seg["page_end"]) for seg in segments
+    ]
+
+
+def test_segment_document_without_matching_pages() -> None:
+    segments = segment_document(
+        "1. Definitions\nAlpha", [{"page_num": 1, "text": "different"}]
+    )
+
+    assert [(seg["page_start"], seg["page_end"]) for seg in segments] == [(None, None)]
+
+
+def test_combined_heading_pattern_matches_individual_patterns() -> None:
+    from app.services.segmentation import HEADING_PATTERNS, _match_heading
+
+    def match_each(line: str) -> tuple[str | None, str | None]:
+        for index, pattern in enumerate(HEADING_PATTERNS):
+            match = pattern.match(line)
+            if match and index == 3:
+                return match.group(1).strip(), None
+            if match:
+                return match.group(2).strip(), match.group(1).strip()
+        return None, None
+
+    lines = [
+        "1. Definitions",
+        "  12. Security Measures",
+        "1.2 Scope of Processing",
+        "1.2. Scope",
+        "(a) access controls",
+        "(A) Not a letter heading",
+        "CONFIDENTIALITY",
+        "ANNEX  II TOMS",
+        "ABC",
+        "1. lowercase heading",
+        "12 Subprocessors",
+        "The processor shall notify.",
+        "",
+        "   ",
+        "2.\tAudit Rights",
+    ]
+    for line in lines:
+        assert _match_heading(line) == match_each(line), line
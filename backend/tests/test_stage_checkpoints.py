@@ -0,0 +1,228 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, select, text
+
+from app.database import SessionLocal
+from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.models.stage_checkpoint import ReviewStageCheckpoint
+from app.workers import tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+@pytest.fixture()
+def calls(monkeypatch) -> dict:
+    calls: dict = {"extract": 0, "classify": 0, "evaluate": [], "fail": set()}
+    monkeypatch.setattr(
+        "app.workers.tasks.get_storage_client",
+        lambda: type("Stub", (), {"get_bytes": lambda _self, _key: b"data"})(),
+    )
+
+    def _extract_stub(_content, _mime):
+        calls["extract"] += 1
+        return {"raw_text": "", "pages": []}
+
+    monkeypatch.setattr("app.workers.tasks.extract_document", _extract_stub)
+    segments = [
+        {
+            "segment_index": 0,
+            "heading": "GOVERNING LAW",
+            "section_number": None,
+            "text": "This agreement is governed by law. governing law applies.",
+            "hash": "hash1",
+            "page_start": 1,
+            "page_end": 1,
+        },
+        {
+            "segment_index": 1,
+            "heading": "LIABILITY",
+            "section_number": None,
+            "text": "Liability is capped at the fees paid.",
+            "hash": "hash2",
+            "page_start": 1,
+            "page_end": 1,
+        },
+    ]
+    monkeypatch.setattr("app.workers.tasks.segment_document", lambda *_args: segments)
+
+    def _classify_stub(segment_text):
+        calls["classify"] += 1
+        if "classify" in calls["fail"]:
+            raise RuntimeError("classifier unavailable")
+        clause_type = (
+            ClauseType.GOVERNING_LAW
+            if "governing" in segment_text
+            else ClauseType.LIABILITY
+        )
+        return [{"clause_type": clause_type, "confidence": 0.9, "method": "RULES"}], True
+
+    monkeypatch.setattr("app.workers.tasks.classify_segment", _classify_stub)
+
+    def _eval_stub(clause_type, *_args):
+        calls["evaluate"].append(clause_type)
+        if clause_type in calls["fail"]:
+            raise RuntimeError("evaluation timed out")
+        return {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": ["governing law"],
+            "triggered_rule_ids": ["R1"],
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _eval_stub)
+    return calls
+
+
+def _create_review() -> str:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                doc_storage_key="reviews/key",
+                doc_mime="application/pdf",
+                doc_sha256="b" * 64,
+            )
+        )
+        session.commit()
+    return review_id
+
+
+def test_retry_resumes_after_failed_classification(calls) -> None:
+    review_id = _create_review()
+    calls["fail"].add("classify")
+
+    with pytest.raises(RuntimeError):
+        tasks.process_review(review_id, final_attempt=False)
+
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.PROCESSING
+        assert review.error_message == "classifier unavailable"
+        stages = session.execute(
+            select(ReviewStageCheckpoint.stage).where(
+                ReviewStageCheckpoint.review_id == review_id
+            )
+        ).scalars().all()
+        assert stages == [tasks.STAGE_SEGMENTS]
+
+    calls["fail"].clear()
+    tasks.process_review(review_id, final_attempt=False)
+
+    assert calls["extract"] == 1
+    with SessionLocal() as session:
+        assert session.get(Review, review_id).status == ReviewStatus.COMPLETED
+
+
+def test_retry_only_reevaluates_failed_clause(calls) -> None:
+    review_id = _create_review()
+    calls["fail"].add(ClauseType.LIABILITY)
+
+    with pytest.raises(RuntimeError):
+        tasks.process_review(review_id, final_attempt=False)
+
+    with SessionLocal() as session:
+        stored = session.execute(
+            select(ClauseEvaluation.clause_type).where(
+                ClauseEvaluation.review_id == review_id
+            )
+        ).scalars().all()
+        assert len(stored) == len(ClauseType) - 1
+        assert ClauseType.LIABILITY not in stored
+
+    calls["fail"].clear()
+    calls["evaluate"].clear()
+    classify_calls = calls["classify"]
+    tasks.process_review(review_id, final_attempt=False)
+
+    assert calls["extract"] == 1
+    assert calls["classify"] == classify_calls
+    assert calls["evaluate"] == [ClauseType.LIABILITY]
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.COMPLETED
+        gov_eval = session.execute(
+            select(ClauseEvaluation).where(
+                ClauseEvaluation.review_id == review_id,
+                ClauseEvaluation.clause_type == ClauseType.GOVERNING_LAW,
+            )
+        ).scalar_one()
+        assert gov_eval.evidence_spans[0]["quote"] == "governing law"
+
+
+def test_successful_retry_clears_error_message(calls) -> None:
+    review_id = _create_review()
+    calls["fail"].add(ClauseType.LIABILITY)
+    with pytest.raises(RuntimeError):
+        tasks.process_review(review_id, final_attempt=False)
+    with SessionLocal() as session:
+        assert session.get(Review, review_id).error_message is not None
+
+    calls["fail"].clear()
+    tasks.process_review(review_id, final_attempt=False)
+
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.COMPLETED
+        assert review.error_message is None
+
+
+def test_final_attempt_marks_failed(calls) -> None:
+    review_id = _create_review()
+    calls["fail"].add("classify")
+
+    tasks.process_review(review_id)
+
+    with SessionLocal() as session:
+        assert session.get(Review, review_id).status == ReviewStatus.FAILED
+
+
+def test_force_clears_checkpoints(calls) -> None:
+    review_id = _create_review()
+    tasks.process_review(review_id)
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        review.status = ReviewStatus.PROCESSING
+        session.commit()
+    calls["evaluate"].clear()
+
+    tasks.process_review(review_id, force=True)
+
+    assert calls["extract"] == 2
+    assert sorted(calls["evaluate"]) == sorted(
+        [ClauseType.GOVERNING_LAW, ClauseType.LIABILITY]
+    )
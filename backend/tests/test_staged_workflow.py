@@ -0,0 +1,153 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, select, text
+
+from app.database import SessionLocal
+from app.models.clause_evaluation import ClauseEvaluation
+from app.models.clause_type import ClauseType
+from app.models.review import Review, ReviewStatus
+from app.models.risk_label import RiskLabel
+from app.workers import celery_tasks
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("DATABASE_URL not set", allow_module_level=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _apply_migrations() -> None:
+    base_dir = Path(__file__).resolve().parents[1]
+    config = Config(str(base_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(base_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(autouse=True)
+def _clean_db() -> None:
+    engine = create_engine(DATABASE_URL, future=True)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
+            )
+        )
+
+
+class MemoryStorage:
+    def __init__(self) -> None:
+        self.objects = {"reviews/key": b"data"}
+
+    def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        self.objects[key] = data
+
+    def get_bytes(self, key: str) -> bytes:
+        return self.objects[key]
+
+
+@pytest.fixture()
+def storage(monkeypatch) -> MemoryStorage:
+    storage = MemoryStorage()
+    monkeypatch.setattr("app.workers.tasks.get_storage_client", lambda: storage)
+    monkeypatch.setattr(
+        "app.workers.tasks.extract_document",
+        lambda _content, _mime: {
+            "raw_text": "GOVERNING LAW\nThis agreement is governed by law. governing law applies.",
+            "pages": [{"page_num": 1, "text": "GOVERNING LAW"}],
+        },
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.classify_segment",
+        lambda _text: (
+            [{"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}],
+            True,
+        ),
+    )
+    monkeypatch.setattr(
+        "app.workers.tasks.evaluate_clause",
+        lambda *_args: {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": ["governing law"],
+            "triggered_rule_ids": ["R1"],
+        },
+    )
+    return storage
+
+
+def _create_review() -> str:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                doc_storage_key="reviews/key",
+                doc_mime="application/pdf",
+            )
+        )
+        session.commit()
+    return str(review_id)
+
+
+def _run_stages(review_id: str) -> None:
+    assert celery_tasks.prepare_staged_review(review_id) is True
+    celery_tasks.extract_document_task.apply(args=(review_id,))
+    celery_tasks.segment_document_task.apply(args=(review_id,))
+    celery_tasks.classify_segments_task.apply(args=(review_id,))
+    for clause_type in ClauseType:
+        celery_tasks.evaluate_clause_task.apply(args=(review_id, clause_type.value))
+    celery_tasks.summarize_review_task.apply(args=(review_id,))
+
+
+def test_staged_workflow_completes_review(storage) -> None:
+    review_id = _create_review()
+
+    _run_stages(review_id)
+
+    assert f"reviews/{review_id}/derived/extraction.json" in storage.objects
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.COMPLETED
+        assert review.decision is not None
+        evaluations = session.execute(
+            select(ClauseEvaluation).where(ClauseEvaluation.review_id == review.id)
+        ).scalars().all()
+        assert len(evaluations) == len(ClauseType)
+
+
+def test_staged_workflow_marks_failed_stage(storage, monkeypatch) -> None:
+    review_id = _create_review()
+    monkeypatch.setattr("app.workers.tasks.segment_document", lambda *_args: [])
+
+    celery_tasks.extract_document_task.apply(args=(review_id,))
+    result = celery_tasks.segment_document_task.apply(args=(review_id,))
+
+    assert result.failed()
+
+    with SessionLocal() as session:
+        review = session.get(Review, review_id)
+        assert review.status == ReviewStatus.FAILED
+        assert review.error_message == "No segments produced from document"
+
+
+def test_build_review_workflow_fans_out_per_clause() -> None:
+    workflow = celery_tasks.build_review_workflow("review-1")
+
+    names = [task.task for task in workflow.tasks[:3]]
+    assert names == [
+        "reviews.extract_document",
+        "reviews.segment_document",
+        "reviews.classify_segments",
+    ]
+    evaluation_chord = workflow.tasks[3]
+    assert len(evaluation_chord.tasks) == len(ClauseType)
+    assert evaluation_chord.body.task == "reviews.summarize_review"
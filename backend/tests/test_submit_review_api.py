@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from uuid import uuid4
 
 import pytest
 from alembic import command
@@ -7,8 +8,9 @@ from alembic.config import Config
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
 
+from app.database import SessionLocal
 from app.main import app
-from app.models.review import ReviewStatus
+from app.models.review import Review, ReviewStatus
 from app.storage.base import StorageClient
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -41,7 +43,9 @@ def _clean_reviews() -> None:
     with engine.begin() as connection:
         connection.execute(
             text(
-                "TRUNCATE TABLE clause_evaluations, segment_classifications, review_segments, reviews"
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
             )
         )
 
@@ -109,3 +113,42 @@ def test_submit_unsupported_file_type() -> None:
     response = client.post("/reviews/submit", files=files, data=data)
 
     assert response.status_code == 415
+
+
+def _create_parent(status: ReviewStatus) -> str:
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(Review(id=review_id, status=status))
+        session.commit()
+    return str(review_id)
+
+
+def test_submit_revision_of_completed_review() -> None:
+    parent_id = _create_parent(ReviewStatus.COMPLETED)
+    files = {"file": ("contract.pdf", b"%PDF-1.4 test", "application/pdf")}
+    data = {"company_role": "controller", "region": "EU", "parent_review_id": parent_id}
+    response = client.post("/reviews/submit", files=files, data=data)
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["parent_review_id"] == parent_id
+    with SessionLocal() as session:
+        review = session.get(Review, payload["review_id"])
+        assert str(review.parent_review_id) == parent_id
+
+
+def test_submit_revision_rejects_unknown_or_unfinished_parent() -> None:
+    files = {"file": ("contract.pdf", b"%PDF-1.4 test", "application/pdf")}
+    data = {"company_role": "controller", "region": "EU"}
+
+    missing = client.post(
+        "/reviews/submit", files=files, data={**data, "parent_review_id": str(uuid4())}
+    )
+    processing = client.post(
+        "/reviews/submit",
+        files=files,
+        data={**data, "parent_review_id": _create_parent(ReviewStatus.PROCESSING)},
+    )
+
+    assert missing.status_code == 404
+    assert processing.status_code == 409
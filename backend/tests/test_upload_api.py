@@ -41,7 +41,9 @@ def _clean_reviews() -> None:
     with engine.begin() as connection:
         connection.execute(
             text(
-                "TRUNCATE TABLE clause_evaluations, segment_classifications, review_segments, reviews"
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
             )
         )
 
@@ -105,3 +107,26 @@ def test_upload_unsupported_type() -> None:
     response = client.post(f"/reviews/{review_id}/upload", files=files)
 
     assert response.status_code == 415
+
+
+def test_upload_scanned_pdf_rejected(_fake_storage: FakeStorageClient) -> None:
+    from io import BytesIO
+
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for _ in range(5):
+        writer.add_blank_page(612, 792)
+    buffer = BytesIO()
+    writer.write(buffer)
+
+    create_response = client.post("/reviews")
+    review_id = create_response.json()["review_id"]
+
+    files = {"file": ("scan.pdf", buffer.getvalue(), "application/pdf")}
+    response = client.post(f"/reviews/{review_id}/upload", files=files)
+
+    assert response.status_code == 400
+    assert "Scanned PDFs" in response.json()["detail"]
+    assert not _fake_storage.uploads
+    assert client.get(f"/reviews/{review_id}").json()["status"] == ReviewStatus.CREATED.value
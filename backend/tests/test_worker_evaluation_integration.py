@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
@@ -12,6 +13,8 @@ from app.models.clause_evaluation import ClauseEvaluation
 from app.models.clause_type import ClauseType
 from app.models.review import Review, ReviewStatus
 from app.models.risk_label import RiskLabel
+from app.services.llm_circuit import CircuitBreaker
+from app.services.llm_gateway import LLMGateway
 from app.workers import tasks
 
 
@@ -35,7 +38,9 @@ def _clean_db() -> None:
     with engine.begin() as connection:
         connection.execute(
             text(
-                "TRUNCATE TABLE clause_evaluations, segment_classifications, review_segments, reviews"
+                "TRUNCATE TABLE review_stage_checkpoints, clause_evaluations, "
+                "clause_library, segment_classifications, segment_classification_cache, "
+                "review_segments, reviews"
             )
         )
 
@@ -74,8 +79,8 @@ def _stub_processing(monkeypatch) -> None:
 
     def _classify(text: str):
         if "governing law" in text:
-            return [{"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}]
-        return [{"clause_type": ClauseType.SECURITY_TOMS, "confidence": 0.8, "method": "RULES"}]
+            return [{"clause_type": ClauseType.GOVERNING_LAW, "confidence": 0.9, "method": "RULES"}], True
+        return [{"clause_type": ClauseType.SECURITY_TOMS, "confidence": 0.8, "method": "RULES"}], True
 
     monkeypatch.setattr("app.workers.tasks.classify_segment", _classify)
 
@@ -136,3 +141,45 @@ def test_process_review_evaluations_idempotent() -> None:
             )
         ).scalar_one()
         assert liability.risk_label == RiskLabel.YELLOW
+
+
+def test_llm_usage_is_recorded_per_review(monkeypatch) -> None:
+    client = SimpleNamespace(
+        responses=SimpleNamespace(
+            create=lambda **_kwargs: SimpleNamespace(output_text="{}")
+        )
+    )
+    gateway = LLMGateway(
+        client_factory=lambda: client, circuit_breaker=CircuitBreaker(None)
+    )
+
+    def _eval_stub(_clause_type, _segment_texts, _context, _rules):
+        gateway.complete("evaluation", "prompt")
+        return {
+            "risk_label": RiskLabel.YELLOW.value,
+            "short_reason": "stub",
+            "suggested_change": "stub",
+            "candidate_quotes": [],
+            "triggered_rule_ids": [],
+        }
+
+    monkeypatch.setattr("app.workers.tasks.evaluate_clause", _eval_stub)
+    review_id = uuid4()
+    with SessionLocal() as session:
+        session.add(
+            Review(
+                id=review_id,
+                status=ReviewStatus.PROCESSING,
+                doc_storage_key="reviews/key",
+                doc_mime="application/pdf",
+            )
+        )
+        session.commit()
+
+    tasks.process_review(review_id)
+
+    with SessionLocal() as session:
+        usage = session.get(Review, review_id).metrics_json["llm"]["evaluation"]
+        # Two clause types have candidates; the rest are missing clauses.
+        assert usage["requests"] == 2
+        assert usage["failures"] == 0